@@ -0,0 +1,102 @@
+"""
+Micro-benchmark: time spent in the audio callback per block.
+
+Compares the previous callback body (to_mono + per-block normalize + slice
+copy) with the current MicrophoneTranscriber.audio_callback (ring copy, ADC
+timestamps, capture stats), and with RingBuffer.write alone. No audio device
+or model is used; the transcriber's state is set up by hand:
+
+    uv run python benchmarks/bench_audio_callback.py [--blocksize 4000] [--blocks 20000]
+"""
+
+import argparse
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from faster_whisper_hotkey.audio import CaptureStats, RingBuffer
+from faster_whisper_hotkey.transcriber import MicrophoneTranscriber
+
+SAMPLE_RATE = 16000
+BUFFER_LENGTH = 10 * 60 * SAMPLE_RATE
+
+
+def legacy_callback_factory():
+    audio_buffer = np.zeros(BUFFER_LENGTH, dtype=np.float32)
+    state = {"index": 0}
+
+    def callback(indata, frames, time_, status):
+        audio_data = indata.flatten().astype(np.float32)
+        max_val = np.abs(audio_data).max()
+        audio_data = audio_data / max_val if not np.isclose(max_val, 0) else audio_data
+        index = state["index"]
+        new_index = index + len(audio_data)
+        if new_index > BUFFER_LENGTH:
+            index, new_index = 0, len(audio_data)
+        audio_buffer[index:new_index] = audio_data
+        state["index"] = new_index
+
+    return callback
+
+
+def ring_write_factory():
+    ring = RingBuffer(BUFFER_LENGTH, channels=1)
+    return lambda indata, frames, time_, status: ring.write(indata)
+
+
+def audio_callback_factory():
+    """The real callback, on a transcriber with only the state it touches."""
+    transcriber = MicrophoneTranscriber.__new__(MicrophoneTranscriber)
+    transcriber.capture_rate = SAMPLE_RATE
+    transcriber._capture_target = RingBuffer(BUFFER_LENGTH, channels=1)
+    transcriber.capture_stats = CaptureStats()
+    transcriber._input_latency = 0.0
+    transcriber._first_block_adc = None
+    transcriber._block_adc_end = None
+    transcriber._block_ns = 0
+    return transcriber.audio_callback
+
+
+def measure(callback, blocks: np.ndarray) -> np.ndarray:
+    frames = blocks.shape[1]
+    timings = np.empty(len(blocks), dtype=np.float64)
+    for i, block in enumerate(blocks):
+        # PortAudio-style timestamps: the block's first sample is one block old
+        now = time.perf_counter()
+        time_ = SimpleNamespace(currentTime=now, inputBufferAdcTime=now - frames / SAMPLE_RATE)
+        t0 = time.perf_counter_ns()
+        callback(block, frames, time_, None)
+        timings[i] = time.perf_counter_ns() - t0
+    return timings / 1000.0  # µs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blocksize", type=int, default=4000)
+    parser.add_argument("--blocks", type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    # A pool of distinct blocks, cycled, so caches see realistic traffic
+    pool = (rng.standard_normal((64, args.blocksize, 1)) * 0.1).astype(np.float32)
+    blocks = pool[np.arange(args.blocks) % len(pool)]
+
+    print(f"{args.blocks} blocks of {args.blocksize} frames ({args.blocksize / SAMPLE_RATE * 1000:.0f} ms each)")
+    print(f"{'callback':<16} {'mean µs':>9} {'p50 µs':>9} {'p99 µs':>9} {'max µs':>9}")
+    for name, factory in (
+        ("legacy", legacy_callback_factory),
+        ("ring.write", ring_write_factory),
+        ("audio_callback", audio_callback_factory),
+    ):
+        callback = factory()
+        measure(callback, blocks[:200])  # warm up, fault in the buffer pages
+        t = measure(callback, blocks)
+        print(
+            f"{name:<16} {t.mean():>9.1f} {np.percentile(t, 50):>9.1f} "
+            f"{np.percentile(t, 99):>9.1f} {t.max():>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Long recordings: one monolithic backend call vs. the pause-split long-form stage.
+
+Tiles test_audio_data/test.mp3 to --minutes and decodes it both ways with the
+chosen model (only backends without native chunking use the long-form stage).
+Needs librosa and the model:
+
+    uv run python benchmarks/bench_longform.py --model-type parakeet \\
+        --model-name nvidia/parakeet-tdt-0.6b-v3 --compute-type float32 --minutes 5
+    uv run python benchmarks/bench_longform.py --model-type granite ...
+"""
+
+import argparse
+import time
+
+import librosa
+import numpy as np
+
+from faster_whisper_hotkey.models import ModelWrapper
+from faster_whisper_hotkey.settings import Settings
+
+SAMPLE_RATE = 16000
+AUDIO_PATH = "test_audio_data/test.mp3"
+
+
+def load_clip(minutes: float) -> np.ndarray:
+    audio, _ = librosa.load(AUDIO_PATH, sr=SAMPLE_RATE, dtype="float32")
+    n = int(minutes * 60 * SAMPLE_RATE)
+    return np.tile(audio, n // audio.size + 1)[:n]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    try:
+        text = fn()
+    except Exception as e:
+        return time.perf_counter() - start, f"failed: {e}"
+    return time.perf_counter() - start, text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--model-type", default="parakeet")
+    parser.add_argument("--model-name", default="nvidia/parakeet-tdt-0.6b-v3")
+    parser.add_argument("--compute-type", default="float32")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--minutes", type=float, default=5.0)
+    parser.add_argument("--chunk", type=float, default=30.0)
+    parser.add_argument("--batch-size", type=int, default=8)
+    args = parser.parse_args()
+
+    settings = Settings(
+        device_name="",
+        model_type=args.model_type,
+        model_name=args.model_name,
+        compute_type=args.compute_type,
+        device=args.device,
+        language=args.language,
+        hotkey="pause",
+        longform_threshold=1.0,
+        longform_chunk=args.chunk,
+        longform_batch_size=args.batch_size,
+    )
+    model = ModelWrapper(settings)
+    if "native_chunking" in model.capabilities:
+        print(f"{args.model_type} chunks natively; the long-form stage doesn't apply")
+        return
+    model.warmup()
+    clip = load_clip(args.minutes)
+
+    single, single_text = timed(lambda: model.backend.transcribe(clip, SAMPLE_RATE, args.language))
+    split, split_text = timed(lambda: model.transcribe(clip, SAMPLE_RATE, args.language))
+
+    how = f"batch {args.batch_size}" if "batch" in model.capabilities else "chunks one at a time"
+    print(f"{args.model_type} {args.model_name}, {args.minutes:.1f} min of audio, {args.chunk:.0f}s chunks, {how}")
+    print(f"{'single call':<12} {single:>8.2f} s  {len(single_text.split()):>6} words  RTF {single / clip.size * SAMPLE_RATE:.3f}")
+    print(f"{'long-form':<12} {split:>8.2f} s  {len(split_text.split()):>6} words  RTF {split / clip.size * SAMPLE_RATE:.3f}")
+    print(f"speedup {single / split:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Short NeMo utterances: transcribe() vs. the direct-tensor fast path.
+
+Cuts 2-5 s clips from test_audio_data/test.mp3 and decodes each --repeats
+times through the model's transcribe() (dataloader, manifest, collation) and
+through fast_transcribe() (preprocessor -> encoder -> decoding on the array).
+Needs librosa, NeMo and the model:
+
+    uv run python benchmarks/bench_nemo_fast_path.py --model-type parakeet
+    uv run python benchmarks/bench_nemo_fast_path.py --model-type canary --device cuda --language en-en
+"""
+
+import argparse
+import statistics
+import time
+
+import librosa
+
+from faster_whisper_hotkey.models import ModelWrapper
+from faster_whisper_hotkey.settings import Settings
+
+SAMPLE_RATE = 16000
+AUDIO_PATH = "test_audio_data/test.mp3"
+MODEL_NAMES = {
+    "parakeet": "nvidia/parakeet-tdt-0.6b-v3",
+    "canary": "nvidia/canary-1b-v2",
+}
+
+
+def median_ms(fn, repeats: int) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--model-type", choices=sorted(MODEL_NAMES), default="parakeet")
+    parser.add_argument("--model-name")
+    parser.add_argument("--compute-type", default="float32")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--language", default="en-en")
+    parser.add_argument("--seconds", type=float, nargs="+", default=[2.0, 3.0, 4.0, 5.0])
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    settings = Settings(
+        device_name="",
+        model_type=args.model_type,
+        model_name=args.model_name or MODEL_NAMES[args.model_type],
+        compute_type=args.compute_type,
+        device=args.device,
+        language=args.language if args.model_type == "canary" else "",
+        hotkey="pause",
+    )
+    model = ModelWrapper(settings)
+    model.warmup()
+    backend = model.backend
+    language = settings.language or None
+    audio, _ = librosa.load(AUDIO_PATH, sr=SAMPLE_RATE, dtype="float32")
+
+    # Canary records its decoder prompt on the first transcribe() per language pair
+    model.transcribe(audio[: 2 * SAMPLE_RATE], SAMPLE_RATE, language)
+    if backend.fast_transcribe(audio[: 2 * SAMPLE_RATE], SAMPLE_RATE, language) is None:
+        print(f"{args.model_type}: no direct-tensor path for this checkpoint, transcribe() is used")
+        return
+
+    print(f"{settings.model_name} ({args.compute_type}, {args.device}), median of {args.repeats}")
+    print(f"{'clip':>6} {'transcribe':>12} {'fast path':>12} {'saved':>10}")
+    for seconds in args.seconds:
+        clip = audio[: int(seconds * SAMPLE_RATE)]
+        slow = median_ms(lambda: backend.transcribe(clip, SAMPLE_RATE, language), args.repeats)
+        fast = median_ms(lambda: backend.fast_transcribe(clip, SAMPLE_RATE, language), args.repeats)
+        print(f"{seconds:>5.1f}s {slow:>10.1f}ms {fast:>10.1f}ms {slow - fast:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Press-to-first-sample latency: per-press stream vs. always-open stream with pre-roll.
+
+Needs a real input device. "Press" is simulated; latency is the time from the
+press to the capture of the recording's first sample (from the callback's ADC
+timestamps), so negative values mean the recording starts before the press.
+In always-open mode that is the pre-roll plus however far the ring lagged
+behind the press.
+
+    uv run python benchmarks/bench_press_latency.py [--trials 10] [--preroll-ms 300]
+"""
+
+import argparse
+import threading
+import time
+
+import numpy as np
+import sounddevice as sd
+
+from faster_whisper_hotkey.audio import RingBuffer
+
+SAMPLE_RATE = 16000
+BLOCKSIZE = 4000
+
+
+def adc_start(frames: int, time_, latency: float) -> float:
+    """perf_counter time at which the block's first sample was captured."""
+    delay = time_.currentTime - time_.inputBufferAdcTime
+    if not 0.0 < delay < 1.0 + frames / SAMPLE_RATE:
+        # Host API without timestamps
+        delay = frames / SAMPLE_RATE + latency
+    return time.perf_counter() - delay
+
+
+def per_press_latencies(trials: int) -> list[float]:
+    latencies = []
+    for _ in range(trials):
+        first_block = threading.Event()
+        state = {"latency": 0.0}
+
+        def callback(indata, frames, time_, status, first_block=first_block, state=state):
+            if not first_block.is_set():
+                state["t"] = adc_start(frames, time_, state["latency"])
+                first_block.set()
+
+        press = time.perf_counter()
+        stream = sd.InputStream(
+            callback=callback, channels=1, samplerate=SAMPLE_RATE, blocksize=BLOCKSIZE, device="default"
+        )
+        state["latency"] = float(stream.latency or 0.0)
+        stream.start()
+        first_block.wait(timeout=5)
+        stream.stop()
+        stream.close()
+        latencies.append(state["t"] - press)
+        time.sleep(0.2)
+    return latencies
+
+
+def always_open_latencies(trials: int, preroll_ms: int) -> list[float]:
+    ring = RingBuffer(60 * SAMPLE_RATE)
+    preroll = int(preroll_ms * SAMPLE_RATE / 1000)
+    state = {"latency": 0.0, "adc_end": None}
+
+    def callback(indata, frames, time_, status):
+        ring.write(indata)
+        state["adc_end"] = adc_start(frames, time_, state["latency"]) + frames / SAMPLE_RATE
+
+    latencies = []
+    with sd.InputStream(
+        callback=callback, channels=1, samplerate=SAMPLE_RATE, blocksize=BLOCKSIZE, device="default"
+    ) as stream:
+        state["latency"] = float(stream.latency or 0.0)
+        time.sleep(1.0)  # let the pre-roll fill
+        rng = np.random.default_rng(0)
+        for _ in range(trials):
+            # Presses land anywhere within a block
+            time.sleep(0.2 + rng.uniform(0, BLOCKSIZE / SAMPLE_RATE))
+            press = time.perf_counter()
+            adc_end = state["adc_end"]
+            write_index = ring.write_index
+            start_index = max(write_index - preroll, ring.oldest_index(write_index))
+            # The ring's newest sample was captured at adc_end, before the press
+            latencies.append(adc_end - (write_index - start_index) / SAMPLE_RATE - press)
+    return latencies
+
+
+def report(name: str, latencies: list[float]):
+    ms = np.array(latencies) * 1000
+    print(f"{name:<12} {ms.mean():>9.1f} {np.median(ms):>9.1f} {ms.min():>9.1f} {ms.max():>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--trials", type=int, default=10)
+    parser.add_argument("--preroll-ms", type=int, default=300)
+    args = parser.parse_args()
+
+    print(f"{'mode':<12} {'mean ms':>9} {'p50 ms':>9} {'min ms':>9} {'max ms':>9}")
+    report("per-press", per_press_latencies(args.trials))
+    report("always-open", always_open_latencies(args.trials, args.preroll_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Release-to-text latency: decode-on-release vs. streaming while the key is held.
+
+Plays test_audio_data/test.mp3 (tiled/cut to --seconds) into a capture ring in
+--interval chunks, running one StreamingSession step per chunk as the
+background thread would, then times what is left at release. Also reports
+whether each streaming step kept up with real time. Needs librosa and the model:
+
+    uv run python benchmarks/bench_streaming_release.py --model-type whisper --model-name small
+    uv run python benchmarks/bench_streaming_release.py --model-type parakeet \\
+        --model-name nvidia/parakeet-tdt-0.6b-v2 --compute-type float16 --device cuda
+"""
+
+import argparse
+import time
+
+import librosa
+import numpy as np
+
+from faster_whisper_hotkey.audio import RingBuffer, normalize_peak, to_mono
+from faster_whisper_hotkey.models import ModelWrapper
+from faster_whisper_hotkey.settings import Settings
+from faster_whisper_hotkey.streaming import StreamingSession
+from faster_whisper_hotkey.vad import trim_silence
+
+SAMPLE_RATE = 16000
+AUDIO_PATH = "test_audio_data/test.mp3"
+
+
+def load_clip(seconds: float) -> np.ndarray:
+    audio, _ = librosa.load(AUDIO_PATH, sr=SAMPLE_RATE, dtype="float32")
+    n = int(seconds * SAMPLE_RATE)
+    return np.tile(audio, n // audio.size + 1)[:n]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--model-type", default="whisper")
+    parser.add_argument("--model-name", default="small")
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--seconds", type=float, default=30.0)
+    parser.add_argument("--interval", type=float, default=2.0)
+    parser.add_argument("--max-window", type=float, default=20.0)
+    args = parser.parse_args()
+
+    settings = Settings(
+        device_name="",
+        model_type=args.model_type,
+        model_name=args.model_name,
+        compute_type=args.compute_type,
+        device=args.device,
+        language=args.language,
+        hotkey="pause",
+    )
+    model = ModelWrapper(settings)
+    model.warmup()
+    clip = load_clip(args.seconds)
+
+    def decode(audio: np.ndarray) -> str:
+        speech, _ = trim_silence(normalize_peak(audio), SAMPLE_RATE)
+        return model.transcribe(speech, SAMPLE_RATE, args.language) if speech.size else ""
+
+    # Decode everything on release
+    start = time.perf_counter()
+    decode(clip.copy())
+    one_shot = time.perf_counter() - start
+
+    # Streaming: the same audio arrives in interval-sized chunks
+    ring = RingBuffer(int((args.seconds + 1) * SAMPLE_RATE))
+    session = StreamingSession(
+        read=lambda s, e: to_mono(ring.read(s, e)),
+        write_index=lambda: ring.write_index,
+        decode=decode,
+        start_index=0,
+        interval=args.interval,
+        max_window=args.max_window,
+    )
+    chunk = int(args.interval * SAMPLE_RATE)
+    step_times = []
+    for offset in range(0, clip.size, chunk):
+        ring.write(clip[offset : offset + chunk])
+        start = time.perf_counter()
+        session.step()
+        step_times.append(time.perf_counter() - start)
+    session.stop(ring.write_index)
+    start = time.perf_counter()
+    committed, tail = session.finish()
+    decode(tail)
+    streamed = time.perf_counter() - start
+
+    steps = np.array(step_times)
+    print(f"{args.model_type} {args.model_name}, {args.seconds:.0f}s of audio, {args.interval:.1f}s interval")
+    print(f"{'decode on release':<22} {one_shot * 1000:>8.0f} ms after release")
+    print(
+        f"{'streaming':<22} {streamed * 1000:>8.0f} ms after release "
+        f"({len(committed)} pieces committed, {tail.size / SAMPLE_RATE:.1f}s tail)"
+    )
+    print(
+        f"streaming steps: mean {steps.mean() * 1000:.0f} ms, max {steps.max() * 1000:.0f} ms, "
+        f"{int((steps > args.interval).sum())} of {steps.size} slower than real time"
+    )
+
+
+if __name__ == "__main__":
+    main()
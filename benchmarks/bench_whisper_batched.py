@@ -0,0 +1,78 @@
+"""
+Long whisper recordings: sequential 30 s windows vs. BatchedInferencePipeline.
+
+Tiles test_audio_data/test.mp3 to --minutes and decodes it with
+WhisperModel.transcribe, then with the batched pipeline at each --batch-sizes
+value. Needs librosa and the model:
+
+    uv run python benchmarks/bench_whisper_batched.py --model-name small --minutes 5
+    uv run python benchmarks/bench_whisper_batched.py --device cuda --compute-type float16 --batch-sizes 8 16
+"""
+
+import argparse
+import time
+
+import librosa
+import numpy as np
+
+from faster_whisper_hotkey.models import ModelWrapper
+from faster_whisper_hotkey.settings import Settings
+
+SAMPLE_RATE = 16000
+AUDIO_PATH = "test_audio_data/test.mp3"
+
+
+def load_clip(minutes: float) -> np.ndarray:
+    audio, _ = librosa.load(AUDIO_PATH, sr=SAMPLE_RATE, dtype="float32")
+    n = int(minutes * 60 * SAMPLE_RATE)
+    return np.tile(audio, n // audio.size + 1)[:n]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    text = fn()
+    return time.perf_counter() - start, text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--model-name", default="small")
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--minutes", type=float, default=5.0)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[4, 8, 16])
+    args = parser.parse_args()
+
+    settings = Settings(
+        device_name="",
+        model_type="whisper",
+        model_name=args.model_name,
+        compute_type=args.compute_type,
+        device=args.device,
+        language=args.language,
+        hotkey="pause",
+    )
+    model = ModelWrapper(settings)
+    model.warmup()
+    backend = model.backend
+    clip = load_clip(args.minutes)
+
+    print(f"whisper {args.model_name} ({args.compute_type}, {args.device}), {args.minutes:.1f} min of audio")
+    backend.batch_threshold = 0.0
+    sequential, text = timed(lambda: model.transcribe(clip, SAMPLE_RATE, args.language))
+    print(f"{'sequential':<12} {sequential:>8.2f} s  {len(text.split()):>6} words  RTF {sequential / clip.size * SAMPLE_RATE:.3f}")
+
+    backend.batch_threshold = 1.0
+    for batch_size in args.batch_sizes:
+        backend.batch_size = batch_size
+        batched, text = timed(lambda: model.transcribe(clip, SAMPLE_RATE, args.language))
+        label = f"batch {batch_size}"
+        print(
+            f"{label:<12} {batched:>8.2f} s  {len(text.split()):>6} words  "
+            f"RTF {batched / clip.size * SAMPLE_RATE:.3f}  speedup {sequential / batched:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
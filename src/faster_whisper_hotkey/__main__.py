@@ -24,15 +24,68 @@ def main():
         default=None,
         help="path to custom settings file (default: ~/.config/faster_whisper_hotkey/transcriber_settings.json)",
     )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="load the model once and serve it to hotkey clients over a Unix socket (uses saved settings)",
+    )
+    parser.add_argument(
+        "--client",
+        action="store_true",
+        help="send audio to a running --daemon instead of loading the model in-process",
+    )
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="daemon socket path (default: $XDG_RUNTIME_DIR/faster-whisper-hotkey.sock)",
+    )
+    parser.add_argument(
+        "--socket-mode",
+        type=lambda v: int(v, 8),
+        default=0o600,
+        metavar="OCTAL",
+        help="permissions of the daemon socket, e.g. 660 to share it with your group (default: 600)",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print wall time, CPU time and RSS delta for each startup phase",
+    )
+    parser.add_argument(
+        "--profile-startup-json",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="also write the startup profile as JSON to PATH (implies --profile-startup)",
+    )
     args = parser.parse_args()
 
     # Set debug flag before any imports so _setup_logging() picks it up
     if args.debug:
         os.environ["FASTER_WHISPER_HOTKEY_DEBUG"] = "1"
+    # Same for the profiler, which reads its flags at import time
+    if args.profile_startup or args.profile_startup_json:
+        os.environ["FASTER_WHISPER_HOTKEY_PROFILE_STARTUP"] = "1"
+    if args.profile_startup_json:
+        os.environ["FASTER_WHISPER_HOTKEY_PROFILE_JSON"] = args.profile_startup_json
+
+    from faster_whisper_hotkey import startup_profile
+
+    with startup_profile.phase("import transcribe"):
+        from faster_whisper_hotkey.transcribe import main as transcribe_main
+
+    if args.daemon:
+        from faster_whisper_hotkey.transcribe import run_daemon
 
-    from faster_whisper_hotkey.transcribe import main as transcribe_main
+        run_daemon(settings_file=args.config, socket_path=args.socket, socket_mode=args.socket_mode)
+        return
 
-    transcribe_main(headless=args.headless, settings_file=args.config)
+    if args.client:
+        transcribe_main(headless=args.headless, settings_file=args.config, daemon_socket=args.socket or "")
+    else:
+        transcribe_main(headless=args.headless, settings_file=args.config)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,325 @@
+"""
+Capture-side audio buffers and processing.
+
+Everything the PortAudio callback touches lives here and is written so the
+callback only copies samples into preallocated memory; downmixing,
+normalization and any other per-utterance work runs on the caller's thread.
+"""
+
+import bisect
+import math
+import mmap
+import tempfile
+import threading
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Single-producer ring buffer of audio frames.
+
+    The producer (the audio callback) copies each block into preallocated
+    storage and only then publishes the new `write_index`, the total number
+    of frames ever written. Consumers read absolute frame ranges behind that
+    index. A plain int assignment is atomic under the GIL, so no lock is
+    needed on either side.
+    """
+
+    def __init__(self, capacity: int, channels: int = 1, dtype=np.float32):
+        self.capacity = capacity
+        self.channels = channels
+        self._data = np.zeros((capacity, channels), dtype=dtype)
+        self.write_index = 0
+
+    def write(self, frames: np.ndarray):
+        """Copy `frames` (shape (n, channels) or (n,)) in; never allocates."""
+        n = len(frames)
+        if n > self.capacity:
+            frames = frames[n - self.capacity :]
+        m = len(frames)
+        if frames.ndim == 1:
+            frames = frames.reshape(m, 1)
+        start = (self.write_index + n - m) % self.capacity
+        first = min(m, self.capacity - start)
+        self._data[start : start + first] = frames[:first]
+        if first < m:
+            self._data[: m - first] = frames[first:]
+        # Publish only after the samples are in place
+        self.write_index += n
+
+    def oldest_index(self, end: int | None = None) -> int:
+        """Oldest absolute frame index still held, relative to `end` (default: now)."""
+        end = self.write_index if end is None else end
+        return max(0, end - self.capacity)
+
+    def read(self, start: int, end: int | None = None, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Copy frames [start, end) out as a contiguous (n, channels) array.
+
+        Frames that have already been overwritten are skipped, so the result
+        may be shorter than end - start; compare against `oldest_index()` to
+        detect that. If `out` is given it must hold at least n frames; a view
+        of it is returned.
+        """
+        end = self.write_index if end is None else end
+        start = max(start, self.oldest_index(end))
+        n = max(0, end - start)
+        if out is None:
+            out = np.empty((n, self.channels), dtype=self._data.dtype)
+        else:
+            out = out[:n]
+        if n == 0:
+            return out
+        pos = start % self.capacity
+        first = min(n, self.capacity - pos)
+        out[:first] = self._data[pos : pos + first]
+        if first < n:
+            out[first:] = self._data[: n - first]
+        return out
+
+
+class PolyphaseResampler:
+    """
+    Streaming rational-ratio resampler (windowed-sinc polyphase FIR).
+
+    process() takes mono blocks of any size at `in_rate` and returns every
+    output sample they make available at `out_rate`; filter history carries
+    over between calls, so feeding a signal block by block gives the same
+    result as feeding it at once. Each call is a single gather + einsum.
+    """
+
+    def __init__(self, in_rate: int, out_rate: int, taps_per_phase: int = 128, kaiser_beta: float = 7.0):
+        g = math.gcd(int(in_rate), int(out_rate))
+        self.in_rate, self.out_rate = int(in_rate), int(out_rate)
+        self.up, self.down = self.out_rate // g, self.in_rate // g
+        self.taps = taps_per_phase
+
+        # Prototype low-pass at the upsampled rate, cut off just below the
+        # lower of the two Nyquist frequencies. With the defaults, for the
+        # usual 48/44.1/32/22.05 kHz -> 16 kHz, everything from 1.03x that
+        # Nyquist up is at least 70 dB down (so aliases can only land in the
+        # top 3% of the output band), and the passband is flat to 0.8x
+        # Nyquist and about 1 dB down at 0.875x
+        n = self.taps * self.up
+        cutoff = 0.5 / max(self.up, self.down) * 0.92
+        t = np.arange(n) - (n - 1) / 2
+        h = 2 * cutoff * np.sinc(2 * cutoff * t) * np.kaiser(n, kaiser_beta) * self.up
+        # Row p holds h[p + j*up] for j = taps-1 .. 0, matching a forward window
+        self._phases = h.reshape(self.taps, self.up).T[:, ::-1].astype(np.float32).copy()
+        self.reset()
+
+    def reset(self):
+        self._history = np.zeros(self.taps - 1, dtype=np.float32)
+        self._in_count = 0
+        self._out_count = 0
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        block = np.asarray(block, dtype=np.float32).reshape(-1)
+        x = np.concatenate((self._history, block))
+        in_end = self._in_count + block.size
+        # Outputs whose newest input sample has arrived
+        last = (in_end * self.up - 1) // self.down
+        k = np.arange(self._out_count, last + 1, dtype=np.int64)
+        if k.size:
+            m = k * self.down
+            windows = np.lib.stride_tricks.sliding_window_view(x, self.taps)
+            starts = m // self.up - self._in_count
+            out = np.einsum("ij,ij->i", windows[starts], self._phases[m % self.up])
+        else:
+            out = np.zeros(0, dtype=np.float32)
+        self._history = x[x.size - (self.taps - 1) :].copy()
+        self._in_count = in_end
+        self._out_count = last + 1
+        return out
+
+
+class CaptureStats:
+    """
+    Audio-path health counters, cheap enough to update from the callback.
+
+    Tracks input overflows/underflows, a histogram of callback execution
+    time and one of inter-callback jitter (deviation of the interval between
+    callbacks from the block duration), plus the stream's reported latency.
+    All counters live in one int64 array so they can sit in shared memory
+    when a capture process owns the stream; snapshot() + summary(since=...)
+    give per-recording numbers.
+    """
+
+    # Histogram bucket upper edges in microseconds; the last bucket is open-ended
+    BUCKET_EDGES_US = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000)
+    N_BUCKETS = len(BUCKET_EDGES_US) + 1
+    _OVERFLOWS, _UNDERFLOWS, _CALLBACKS, _MAX_DURATION_US, _MAX_JITTER_US = range(5)
+    _DURATION = 5
+    _JITTER = _DURATION + N_BUCKETS
+    SIZE = _JITTER + N_BUCKETS
+
+    def __init__(self, counters: np.ndarray | None = None):
+        self.counters = counters if counters is not None else np.zeros(self.SIZE, dtype=np.int64)
+        self.latency = 0.0
+        self._last_start_ns: int | None = None
+
+    def reset_timing(self):
+        """Forget the previous callback (call when a stream is (re)opened)."""
+        self._last_start_ns = None
+
+    def record_status(self, status):
+        if status.input_overflow:
+            self.counters[self._OVERFLOWS] += 1
+        if status.input_underflow:
+            self.counters[self._UNDERFLOWS] += 1
+
+    def record_callback(self, start_ns: int, end_ns: int, block_ns: int):
+        counters = self.counters
+        duration_us = (end_ns - start_ns) // 1000
+        counters[self._DURATION + bisect.bisect_left(self.BUCKET_EDGES_US, duration_us)] += 1
+        counters[self._MAX_DURATION_US] = max(counters[self._MAX_DURATION_US], duration_us)
+        if self._last_start_ns is not None:
+            jitter_us = abs(start_ns - self._last_start_ns - block_ns) // 1000
+            counters[self._JITTER + bisect.bisect_left(self.BUCKET_EDGES_US, jitter_us)] += 1
+            counters[self._MAX_JITTER_US] = max(counters[self._MAX_JITTER_US], jitter_us)
+        self._last_start_ns = start_ns
+        counters[self._CALLBACKS] += 1
+
+    def snapshot(self) -> np.ndarray:
+        return self.counters.copy()
+
+    @classmethod
+    def _histogram(cls, counts: np.ndarray) -> dict[str, int]:
+        labels = [f"<={edge}" for edge in cls.BUCKET_EDGES_US] + [f">{cls.BUCKET_EDGES_US[-1]}"]
+        return dict(zip(labels, (int(c) for c in counts)))
+
+    def summary(self, since: np.ndarray | None = None) -> dict:
+        """Counts since the `since` snapshot (maxima are since the counters were created)."""
+        counts = self.snapshot()
+        if since is not None:
+            counts = counts - since
+            counts[self._MAX_DURATION_US] = self.counters[self._MAX_DURATION_US]
+            counts[self._MAX_JITTER_US] = self.counters[self._MAX_JITTER_US]
+        return {
+            "overflows": int(counts[self._OVERFLOWS]),
+            "underflows": int(counts[self._UNDERFLOWS]),
+            "callbacks": int(counts[self._CALLBACKS]),
+            "latency_ms": self.latency * 1000,
+            "max_callback_us": int(counts[self._MAX_DURATION_US]),
+            "max_jitter_us": int(counts[self._MAX_JITTER_US]),
+            "callback_us": self._histogram(counts[self._DURATION : self._DURATION + self.N_BUCKETS]),
+            "jitter_us": self._histogram(counts[self._JITTER : self._JITTER + self.N_BUCKETS]),
+        }
+
+    @staticmethod
+    def format(summary: dict) -> str:
+        rows = [
+            (
+                f"callbacks {summary['callbacks']}, input overflows {summary['overflows']}, "
+                f"underflows {summary['underflows']}, stream latency {summary['latency_ms']:.1f} ms"
+            ),
+            f"{'bucket µs':<10} {'callback':>9} {'jitter':>9}",
+        ]
+        for label, count in summary["callback_us"].items():
+            rows.append(f"{label:<10} {count:>9} {summary['jitter_us'][label]:>9}")
+        rows.append(f"{'max':<10} {summary['max_callback_us']:>9} {summary['max_jitter_us']:>9}")
+        return "\n".join(rows)
+
+
+def to_mono(audio_data: np.ndarray) -> np.ndarray:
+    """Downmix (n, channels) audio to mono float32 by averaging channels."""
+    if audio_data.ndim > 1:
+        if audio_data.shape[1] == 1:
+            return np.ascontiguousarray(audio_data[:, 0], dtype=np.float32)
+        return audio_data.mean(axis=1, dtype=np.float32)
+    return audio_data.astype(np.float32, copy=False)
+
+
+def normalize_peak(audio_data: np.ndarray) -> np.ndarray:
+    """Scale a whole utterance in place so its peak is 1.0 (silence is left as is)."""
+    if audio_data.size == 0:
+        return audio_data
+    peak = float(np.abs(audio_data).max())
+    if not np.isclose(peak, 0):
+        audio_data *= 1.0 / peak
+    return audio_data
+
+
+class BufferPool:
+    """
+    Recycles float32 utterance buffers between recordings.
+
+    acquire(n) hands out a length-n view of a pooled block (block sizes are
+    rounded up to `granularity` samples so similar utterances share blocks);
+    release() takes that view - or anything derived from it without a copy -
+    and returns the block once the consumer is done. Steady-state dictation
+    therefore reuses the same few blocks instead of allocating per utterance.
+    """
+
+    def __init__(self, granularity: int = 30 * 16000, max_free: int = 2):
+        self.granularity = granularity
+        self.max_free = max_free
+        self._free: list[np.ndarray] = []
+        self._in_use: dict[int, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, n: int) -> np.ndarray:
+        with self._lock:
+            fitting = [block for block in self._free if block.size >= n]
+            if fitting:
+                block = min(fitting, key=lambda b: b.size)
+                self._free.remove(block)
+            else:
+                size = max(1, -(-n // self.granularity)) * self.granularity
+                block = np.empty(size, dtype=np.float32)
+            self._in_use[id(block)] = block
+        return block[:n]
+
+    def release(self, audio_data: np.ndarray) -> bool:
+        """Return the block behind `audio_data`; False if it isn't from this pool."""
+        if not isinstance(audio_data, np.ndarray):
+            return False
+        owner = audio_data if audio_data.base is None else audio_data.base
+        with self._lock:
+            block = self._in_use.pop(id(owner), None)
+            if block is None:
+                return False
+            self._free.append(block)
+            if len(self._free) > self.max_free:
+                # Keep the largest blocks; they can serve any shorter utterance
+                self._free.remove(min(self._free, key=lambda b: b.size))
+        return True
+
+    @property
+    def pooled_bytes(self) -> int:
+        with self._lock:
+            return sum(b.nbytes for b in self._free) + sum(b.nbytes for b in self._in_use.values())
+
+
+class SpillFile:
+    """
+    Append-only float32 file for recordings that outgrow the in-RAM ring.
+
+    The file is unlinked on creation; map() returns the samples as a
+    writable array backed by a shared mapping of it, so the model reads them
+    zero-copy and the kernel can page them out instead of holding them in RSS.
+    """
+
+    def __init__(self, directory: str | None = None):
+        self._file = tempfile.TemporaryFile(prefix="fwh-recording-", suffix=".f32", dir=directory or None)  # noqa: SIM115
+        self.frames = 0
+
+    def append(self, samples: np.ndarray):
+        samples = np.ascontiguousarray(samples, dtype=np.float32)
+        self._file.write(memoryview(samples).cast("B"))
+        self.frames += samples.size
+
+    def map(self) -> np.ndarray:
+        """Map everything appended so far; the file closes when the array is freed."""
+        self._file.flush()
+        if self.frames == 0:
+            self.close()
+            return np.zeros(0, dtype=np.float32)
+        mapping = mmap.mmap(self._file.fileno(), self.frames * 4)
+        # The mapping keeps its own reference to the file
+        self.close()
+        return np.frombuffer(mapping, dtype=np.float32)
+
+    def close(self):
+        self._file.close()
@@ -0,0 +1,174 @@
+"""
+Out-of-process audio capture.
+
+A small spawned process owns the sounddevice InputStream and copies every
+block into a RingBuffer that lives in POSIX shared memory; the main process
+reads it without copying through a pipe. Inference in the main process
+(torch/NumPy holding the GIL) can then never delay the audio callback.
+
+The child imports only numpy, sounddevice and this module.
+"""
+
+import logging
+import mmap
+import multiprocessing
+import os
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .audio import CaptureStats, RingBuffer
+
+logger = logging.getLogger(__name__)
+
+# Header in front of the samples; slot 0 (int64) is the write index
+_WRITE_INDEX = 0
+_HEADER_BYTES = 64
+
+
+class SharedRingBuffer(RingBuffer):
+    """
+    RingBuffer whose samples and write index live in shared memory.
+
+    The creating process owns (and unlinks) the segment; other processes
+    attach by name. write_index is an aligned int64 in the header, stored
+    only after the samples it covers, so a reader in another process sees
+    the same single-producer guarantees as with RingBuffer. `extra` int64
+    slots after the header are shared too (used for CaptureStats counters).
+    """
+
+    def __init__(
+        self, capacity: int, channels: int = 1, dtype=np.float32, name: str | None = None, extra: int = 0
+    ):
+        self.capacity = capacity
+        self.channels = channels
+        data_offset = _HEADER_BYTES + extra * 8
+        size = data_offset + capacity * channels * np.dtype(dtype).itemsize
+        self._shm = None
+        self._mmap = None
+        if name is None:
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+            self.name = self._shm.name
+            buffer = self._shm.buf
+        else:
+            # Attach through /dev/shm directly so the resource tracker doesn't
+            # adopt (and later unlink) a segment this process doesn't own
+            fd = os.open(os.path.join("/dev/shm", name.lstrip("/")), os.O_RDWR)
+            try:
+                self._mmap = mmap.mmap(fd, size)
+            finally:
+                os.close(fd)
+            self.name = name
+            buffer = self._mmap
+        self._header = np.ndarray((_HEADER_BYTES // 8,), dtype=np.int64, buffer=buffer)
+        self.extra = np.ndarray((extra,), dtype=np.int64, buffer=buffer, offset=_HEADER_BYTES)
+        self._data = np.ndarray((capacity, channels), dtype=dtype, buffer=buffer, offset=data_offset)
+
+    @property
+    def write_index(self) -> int:
+        return int(self._header[_WRITE_INDEX])
+
+    @write_index.setter
+    def write_index(self, value: int):
+        self._header[_WRITE_INDEX] = value
+
+    def close(self):
+        # Views must go before the buffer can be released
+        self._header = self._data = self.extra = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+def _capture_main(ring_name, capacity, channels, stream_kwargs, stop_event, ready_event, latency):
+    """Entry point of the capture process."""
+    import sounddevice as sd
+
+    ring = SharedRingBuffer(capacity, channels, name=ring_name, extra=CaptureStats.SIZE)
+    stats = CaptureStats(ring.extra)
+    block_ns = int(stream_kwargs["blocksize"] * 1e9 / stream_kwargs["samplerate"])
+
+    def callback(indata, frames, time_, status):
+        start = time.perf_counter_ns()
+        if status:
+            stats.record_status(status)
+        ring.write(indata)
+        stats.record_callback(start, time.perf_counter_ns(), block_ns)
+
+    try:
+        with sd.InputStream(callback=callback, channels=channels, **stream_kwargs) as stream:
+            latency.value = float(stream.latency)
+            ready_event.set()
+            stop_event.wait()
+    finally:
+        stats.counters = None
+        ring.close()
+
+
+class CaptureProcess:
+    """
+    Runs the input stream in a child process, writing into `ring`.
+
+    Provides the start/stop/close/latency surface of sd.InputStream that
+    MicrophoneTranscriber uses, so it can stand in for one.
+    """
+
+    def __init__(
+        self,
+        samplerate: int,
+        channels: int = 1,
+        blocksize: int = 0,
+        latency="high",
+        device="default",
+        buffer_seconds: float = 10.0,
+    ):
+        self.ring = SharedRingBuffer(int(buffer_seconds * samplerate), channels, extra=CaptureStats.SIZE)
+        self.stats = CaptureStats(self.ring.extra)
+        ctx = multiprocessing.get_context("spawn")
+        self._stop = ctx.Event()
+        self._ready = ctx.Event()
+        self._latency = ctx.Value("d", 0.0)
+        stream_kwargs = {"samplerate": samplerate, "blocksize": blocksize, "latency": latency, "device": device}
+        self._process = ctx.Process(
+            target=_capture_main,
+            args=(self.ring.name, self.ring.capacity, channels, stream_kwargs, self._stop, self._ready, self._latency),
+            name="audio-capture",
+            daemon=True,
+        )
+        self.latency = 0.0
+
+    def start(self, timeout: float = 10.0):
+        self._process.start()
+        if not self._ready.wait(timeout):
+            self.stop()
+            self.close()
+            raise RuntimeError(f"capture process did not start (exit code {self._process.exitcode})")
+        self.latency = self.stats.latency = self._latency.value
+        logger.debug(f"Capture process {self._process.pid} running")
+
+    def is_alive(self) -> bool:
+        """False once the child has exited, whether stopped or crashed."""
+        return self._process.is_alive()
+
+    @property
+    def exitcode(self) -> int | None:
+        return self._process.exitcode
+
+    def stop(self):
+        self._stop.set()
+        if self._process.pid is not None:
+            self._process.join(timeout=5)
+            if self._process.is_alive():
+                self._process.terminate()
+
+    def close(self):
+        if self.ring is not None:
+            # Keep the final counts readable after the segment is gone
+            self.stats.counters = self.stats.snapshot()
+            self.ring.close()
+            self.ring = None
@@ -2,6 +2,8 @@ import json
 import logging
 from importlib.resources import files
 
+from . import startup_profile
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,7 +16,7 @@ def get_resource_path(filename: str) -> str:
 
 try:
     config_path = get_resource_path("available_languages.json")
-    with open(config_path, encoding="utf-8") as f:
+    with startup_profile.phase("config.py JSON loading"), open(config_path, encoding="utf-8") as f:
         _CONFIG = json.load(f)
 except (FileNotFoundError, json.JSONDecodeError) as e:
     logger.error(f"Configuration error while loading available_languages.json: {e}")
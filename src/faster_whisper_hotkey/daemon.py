@@ -0,0 +1,239 @@
+"""
+Persistent model daemon and thin client.
+
+The daemon owns one ModelWrapper and serves transcription requests over a
+Unix domain socket, so restarting the hotkey front end (or running one per
+user on a shared workstation) doesn't reload the model.
+
+Wire format (all integers little-endian):
+
+    request:  magic b"FWH2" | dtype u8 | profile u8 | sample_rate u32
+              | n_samples u64 | language_len u16 | language utf-8
+              | raw PCM samples
+    response: status u8 | text_len u32 | text utf-8
+
+dtype is DTYPE_INT16 or DTYPE_FLOAT32; samples are sent as-is, without any
+re-encoding. profile indexes PROFILE_CODES (0 = the daemon's own
+decoding_profile). status is 0 on success, 1 on error (text holds the
+message). Bump the magic whenever the layout changes.
+"""
+
+import logging
+import os
+import socket
+import socketserver
+import struct
+import threading
+
+import numpy as np
+
+from . import startup_profile
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"FWH2"
+DTYPE_INT16 = 0
+DTYPE_FLOAT32 = 1
+_DTYPES = {DTYPE_INT16: np.dtype("<i2"), DTYPE_FLOAT32: np.dtype("<f4")}
+# Wire codes of decoding profiles; append only, so codes stay stable
+PROFILE_CODES = (None, "fastest", "balanced", "accurate")
+
+_REQUEST_HEADER = struct.Struct("<4sBBIQH")
+_RESPONSE_HEADER = struct.Struct("<BI")
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+
+def default_socket_path() -> str:
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or f"/tmp/faster-whisper-hotkey-{os.getuid()}"
+    return os.path.join(runtime_dir, "faster-whisper-hotkey.sock")
+
+
+def _recv_exact_into(sock: socket.socket, view: memoryview):
+    while len(view):
+        n = sock.recv_into(view)
+        if n == 0:
+            raise ConnectionError("connection closed mid-message")
+        view = view[n:]
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buf = bytearray(size)
+    _recv_exact_into(sock, memoryview(buf))
+    return bytes(buf)
+
+
+# ----------------------------------------------------------------------
+# Server
+# ----------------------------------------------------------------------
+class _RequestHandler(socketserver.BaseRequestHandler):
+    server: "ModelDaemon"
+
+    def handle(self):
+        sock = self.request
+        while True:
+            try:
+                header = sock.recv(_REQUEST_HEADER.size, socket.MSG_WAITALL)
+            except OSError:
+                return
+            if not header:
+                return  # client closed the connection
+            if len(header) != _REQUEST_HEADER.size:
+                return
+            magic, dtype_code, profile_code, sample_rate, n_samples, lang_len = _REQUEST_HEADER.unpack(header)
+            if magic != MAGIC or dtype_code not in _DTYPES or profile_code >= len(PROFILE_CODES):
+                logger.warning("Daemon: malformed request or client version mismatch, closing connection")
+                return
+
+            try:
+                language = _recv_exact(sock, lang_len).decode("utf-8") or None
+                # Receive the PCM straight into the array that goes to the model
+                samples = np.empty(n_samples, dtype=_DTYPES[dtype_code])
+                _recv_exact_into(sock, memoryview(samples).cast("B"))
+            except ConnectionError:
+                return
+
+            if dtype_code == DTYPE_INT16:
+                audio = samples.astype(np.float32) / 32768.0
+            else:
+                audio = samples.astype(np.float32, copy=False)
+
+            try:
+                with self.server.model_lock:
+                    text = self.server.model_wrapper.transcribe(
+                        audio, sample_rate=sample_rate, language=language, profile=PROFILE_CODES[profile_code]
+                    )
+                status = STATUS_OK
+            except Exception as e:
+                logger.error(f"Daemon: transcription failed: {e}")
+                text, status = str(e), STATUS_ERROR
+
+            payload = text.encode("utf-8")
+            sock.sendall(_RESPONSE_HEADER.pack(status, len(payload)) + payload)
+
+
+class ModelDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server that shares one loaded model between clients."""
+
+    daemon_threads = True
+
+    def __init__(self, model_wrapper, socket_path: str, socket_mode: int = 0o600):
+        self.model_wrapper = model_wrapper
+        # Models aren't thread-safe; clients are served one request at a time
+        self.model_lock = threading.Lock()
+        self.socket_path = socket_path
+
+        os.makedirs(os.path.dirname(socket_path) or ".", exist_ok=True)
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        super().__init__(socket_path, _RequestHandler)
+        os.chmod(socket_path, socket_mode)
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def serve(settings, socket_path: str | None = None, socket_mode: int = 0o600):
+    """Load the model once and serve it until interrupted."""
+    from .models import ModelWrapper
+
+    socket_path = socket_path or default_socket_path()
+    try:
+        with startup_profile.phase("ModelWrapper"):
+            model_wrapper = ModelWrapper(settings)
+        if getattr(settings, "warmup", False):
+            with startup_profile.phase("warm-up"):
+                model_wrapper.warmup()
+    finally:
+        # Failed loads are when the breakdown is most useful
+        startup_profile.finish()
+
+    with ModelDaemon(model_wrapper, socket_path, socket_mode) as server:
+        logger.info(f"Model daemon serving {settings.model_type} on {socket_path}")
+        # Clients can connect while a first-launch snapshot is written
+        threading.Thread(target=model_wrapper.save_snapshot, name="snapshot-save", daemon=True).start()
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Model daemon stopped")
+
+
+# ----------------------------------------------------------------------
+# Client
+# ----------------------------------------------------------------------
+class RemoteModel:
+    """
+    Drop-in stand-in for ModelWrapper that forwards audio to a running daemon.
+
+    Only the transcribe/warmup surface used by MicrophoneTranscriber is
+    provided; nothing model-related is imported on the client side.
+    """
+
+    def __init__(self, socket_path: str | None = None, timeout: float | None = None):
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._sock = self._connect()
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _request(self, header: bytes, audio: np.ndarray) -> tuple[int, str]:
+        self._sock.sendall(header)
+        self._sock.sendall(memoryview(audio).cast("B"))
+        status, text_len = _RESPONSE_HEADER.unpack(_recv_exact(self._sock, _RESPONSE_HEADER.size))
+        return status, _recv_exact(self._sock, text_len).decode("utf-8")
+
+    def warmup(self, *args, **kwargs):
+        """The daemon warms its model up once at start; nothing to do here."""
+        return []
+
+    def save_snapshot(self):
+        """Snapshots belong to the daemon's ModelWrapper; nothing to do here."""
+
+    def transcribe(
+        self, audio_data, sample_rate: int = 16000, language: str | None = None, profile: str | None = None
+    ) -> str:
+        audio = np.asarray(audio_data)
+        if audio.dtype == np.int16:
+            dtype_code = DTYPE_INT16
+        else:
+            dtype_code = DTYPE_FLOAT32
+            audio = audio.astype(np.float32, copy=False)
+        audio = np.ascontiguousarray(audio.reshape(-1))
+
+        lang = (language or "").encode("utf-8")
+        profile_code = PROFILE_CODES.index(profile.lower()) if profile and profile.lower() in PROFILE_CODES else 0
+        header = _REQUEST_HEADER.pack(MAGIC, dtype_code, profile_code, sample_rate, audio.size, len(lang)) + lang
+        with self._lock:
+            try:
+                status, text = self._request(header, audio)
+            except OSError as e:
+                # The daemon may have restarted since the last request:
+                # reconnect once before giving up on this utterance
+                logger.warning(f"Model daemon connection lost ({e}), reconnecting")
+                self._sock.close()
+                try:
+                    self._sock = self._connect()
+                    status, text = self._request(header, audio)
+                except OSError as retry_error:
+                    logger.error(f"Model daemon unreachable: {retry_error}")
+                    return ""
+        if status != STATUS_OK:
+            logger.error(f"Model daemon error: {text}")
+            return ""
+        return text
+
+    def close(self):
+        with self._lock:
+            self._sock.close()
@@ -0,0 +1,96 @@
+"""
+Long-form transcription for backends without native chunking.
+
+Recordings longer than a threshold are split at pauses into chunks of at
+most `chunk_s` seconds, the chunks are decoded - in batches for backends
+with the "batch" capability, otherwise one after another - and the texts are
+joined in order. Each call then stays within the model's context, and the
+decode cost grows linearly with length.
+
+Non-batching backends aren't decoded from several threads: the processor's
+fast tokenizer isn't reentrant, and concurrent generate() calls only split
+the same intra-op threads between them.
+"""
+
+import logging
+
+import numpy as np
+
+from .vad import FRAME_S, speech_frames
+
+logger = logging.getLogger(__name__)
+
+
+def split_at_pauses(
+    audio: np.ndarray,
+    sample_rate: int,
+    chunk_s: float = 30.0,
+    min_chunk_s: float = 10.0,
+    aggressiveness: int = 1,
+) -> list[tuple[int, int]]:
+    """
+    Contiguous (start, end) sample ranges of at most `chunk_s` covering `audio`.
+
+    Each cut goes in the middle of the longest pause between `min_chunk_s`
+    and `chunk_s` after the previous one (the later one on ties), or at the
+    quietest frame there if nobody paused.
+    """
+    n = audio.size
+    max_len = int(chunk_s * sample_rate)
+    if n <= max_len:
+        return [(0, n)]
+
+    frame = int(sample_rate * FRAME_S)
+    speech = speech_frames(audio, sample_rate, aggressiveness)
+    n_frames = speech.size
+    energy = np.mean(np.square(audio[: n_frames * frame].reshape(n_frames, frame), dtype=np.float64), axis=1)
+    edges = np.flatnonzero(np.diff(np.concatenate(([1], speech.astype(np.int8), [1]))))
+    # Pause middles (in samples) and lengths (in frames)
+    middles = (edges[::2] + edges[1::2]) // 2 * frame
+    lengths = edges[1::2] - edges[::2]
+
+    ranges = []
+    start = 0
+    while n - start > max_len:
+        lo, hi = start + int(min_chunk_s * sample_rate), start + max_len
+        inside = np.flatnonzero((middles > lo) & (middles <= hi))
+        if inside.size:
+            best = inside[np.flatnonzero(lengths[inside] == lengths[inside].max())[-1]]
+            cut = int(middles[best])
+        else:
+            first, last = -(-lo // frame), min(hi // frame, n_frames)
+            cut = int(first + np.argmin(energy[first:last])) * frame if last > first else hi
+        ranges.append((start, cut))
+        start = cut
+    ranges.append((start, n))
+    return ranges
+
+
+def transcribe_long(
+    backend,
+    audio: np.ndarray,
+    sample_rate: int,
+    language: str | None,
+    chunk_s: float = 30.0,
+    batch_size: int = 8,
+    aggressiveness: int = 1,
+) -> str:
+    """Split `audio` at pauses, decode the chunks and join the texts in order."""
+    ranges = split_at_pauses(audio, sample_rate, chunk_s, min(chunk_s / 3, 10.0), aggressiveness)
+    chunks = [audio[start:end] for start, end in ranges]
+    if len(chunks) == 1:
+        return backend.transcribe(audio, sample_rate, language)
+
+    if "batch" in backend.capabilities:
+        texts = []
+        for i in range(0, len(chunks), batch_size):
+            texts.extend(backend.transcribe_batch(chunks[i : i + batch_size], sample_rate, language))
+        how = f"batches of {batch_size}"
+    else:
+        texts = [backend.transcribe(chunk, sample_rate, language) for chunk in chunks]
+        how = "one at a time"
+    logger.debug(
+        f"Long-form: {audio.size / sample_rate:.1f}s in {len(chunks)} chunks "
+        f"(longest {max(e - s for s, e in ranges) / sample_rate:.1f}s), {how}"
+    )
+    return " ".join(text.strip() for text in texts if text and text.strip())
@@ -1,15 +1,34 @@
 import contextlib
+import importlib
 import logging
 import os
-
-from transformers import (
-    AutoModel,
-    AutoModelForSpeechSeq2Seq,
-    AutoProcessor,
-    BitsAndBytesConfig,
-    CohereAsrForConditionalGeneration,
-    VoxtralForConditionalGeneration,
-)
+import sys
+import time
+
+import numpy as np
+import soundfile as sf
+
+from . import longform, startup_profile
+from .profiles import get_profile
+from .snapshot_cache import SnapshotCache
+
+# Heavy backend dependencies, resolved on first access through the module
+# __getattr__ below. Nothing here is imported until ModelWrapper picks the
+# backend that needs it, so a whisper-only process never loads torch, NeMo
+# or transformers.
+_LAZY_IMPORTS: dict[str, tuple[str, str | None]] = {
+    "torch": ("torch", None),
+    "WhisperModel": ("faster_whisper", "WhisperModel"),
+    "BatchedInferencePipeline": ("faster_whisper", "BatchedInferencePipeline"),
+    "ASRModel": ("nemo.collections.asr.models", "ASRModel"),
+    "EncDecMultiTaskModel": ("nemo.collections.asr.models", "EncDecMultiTaskModel"),
+    "AutoModel": ("transformers", "AutoModel"),
+    "AutoModelForSpeechSeq2Seq": ("transformers", "AutoModelForSpeechSeq2Seq"),
+    "AutoProcessor": ("transformers", "AutoProcessor"),
+    "BitsAndBytesConfig": ("transformers", "BitsAndBytesConfig"),
+    "CohereAsrForConditionalGeneration": ("transformers", "CohereAsrForConditionalGeneration"),
+    "VoxtralForConditionalGeneration": ("transformers", "VoxtralForConditionalGeneration"),
+}
 
 
 @contextlib.contextmanager
@@ -73,25 +92,65 @@ def suppress_nemo():
             setattr(obj, attr, orig)
 
 
-# Suppress OneLogger/NeMo initialization warnings at import time
-with suppress_output():
-    import tempfile
+@contextlib.contextmanager
+def _memfd_wavs(batch, sample_rate: int):
+    """
+    WAV files of `batch` in anonymous memory (memfd), for model APIs that only
+    take paths. Yields /proc/self/fd paths, valid until the context exits;
+    nothing touches the filesystem.
+    """
+    fds = []
+    try:
+        for audio_data in batch:
+            fds.append(os.memfd_create("utterance.wav", os.MFD_CLOEXEC))
+            with open(fds[-1], "wb", closefd=False) as f:
+                sf.write(f, audio_data, sample_rate, format="WAV", subtype="FLOAT")
+        yield [f"/proc/self/fd/{fd}" for fd in fds]
+    finally:
+        for fd in fds:
+            os.close(fd)
 
-    import soundfile as sf
-    import torch
-    from faster_whisper import WhisperModel
-    from nemo.collections.asr.models import ASRModel, EncDecMultiTaskModel
 
-    # Patch SentencePieceTokenizer.eos_id for canary models.
-    # Canary's tokenizer has <s> (token 3) as EOS, but SentencePiece doesn't
-    # flag it as a special token, so tokenizer.eos_id() returns -1. The NeMo
-    # canary2 prompt formatter asserts answer_ids[-1] == tokenizer.eos, which
-    # fails (3 != -1). We detect canary by its unique <|startoftranscript|> token.
-    from nemo.collections.common.tokenizers.sentencepiece_tokenizer import (
-        SentencePieceTokenizer,
-    )
+def __getattr__(name):
+    """Import a heavy backend dependency the first time it is accessed."""
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    # Suppress OneLogger/NeMo initialization warnings at import time
+    with suppress_output():
+        module = importlib.import_module(module_name)
+    value = getattr(module, attr) if attr else module
+    globals()[name] = value
+    return value
+
+
+def _dep(name: str):
+    """Resolve a lazy dependency via the module, so patched attributes win."""
+    return getattr(sys.modules[__name__], name)
+
+
+_canary_eos_patched = False
+
+
+def _patch_canary_eos_id():
+    """Patch SentencePieceTokenizer.eos_id for canary models (idempotent).
 
-    _original_eos_id = SentencePieceTokenizer.eos_id
+    Canary's tokenizer has <s> (token 3) as EOS, but SentencePiece doesn't
+    flag it as a special token, so tokenizer.eos_id() returns -1. The NeMo
+    canary2 prompt formatter asserts answer_ids[-1] == tokenizer.eos, which
+    fails (3 != -1). We detect canary by its unique <|startoftranscript|> token.
+    """
+    global _canary_eos_patched
+    if _canary_eos_patched:
+        return
+
+    with suppress_output():
+        from nemo.collections.common.tokenizers.sentencepiece_tokenizer import (
+            SentencePieceTokenizer,
+        )
+
+    original_eos_id = SentencePieceTokenizer.eos_id
 
     @property  # type: ignore[misc]
     def _patched_eos_id(self):
@@ -103,29 +162,127 @@ with suppress_output():
                 return 3  # CANARY_EOS = "<s>"
         except Exception:
             pass
-        return _original_eos_id.fget(self)
+        return original_eos_id.fget(self)
 
     SentencePieceTokenizer.eos_id = _patched_eos_id
+    _canary_eos_patched = True
+
 
 logger = logging.getLogger(__name__)
 
 
-def _materialize_weights(model):
+# madvise(2) advice values (Linux)
+_MADV_WILLNEED = 3
+_MADV_DONTNEED = 4
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# How _materialize_weights brings safetensors-mmap'd weights into RAM
+MATERIALIZATION_STRATEGIES = ("clone", "module", "prefetch")
+
+
+def _file_backed_ranges() -> list[tuple[int, int]]:
+    """Address ranges of this process that are mapped from a file."""
+    ranges = []
+    try:
+        with open("/proc/self/maps") as f:
+            for line in f:
+                fields = line.split()
+                # address perms offset dev inode [path]; inode 0 means anonymous
+                if len(fields) >= 6 and fields[4] != "0":
+                    start, end = (int(x, 16) for x in fields[0].split("-"))
+                    ranges.append((start, end))
+    except OSError:
+        pass
+    return ranges
+
+
+def _madvise_tensor(tensor, advice: int, file_backed: list[tuple[int, int]] | None = None) -> bool:
+    """
+    madvise() the memory behind `tensor`.
+
+    WILLNEED rounds outward to whole pages (harmless on neighbours);
+    DONTNEED rounds inward and is only issued on file-backed mappings, so
+    it can never zero anonymous memory or pages shared with another tensor.
+    """
+    import ctypes
+
+    nbytes = tensor.untyped_storage().nbytes()
+    start, end = tensor.untyped_storage().data_ptr(), tensor.untyped_storage().data_ptr() + nbytes
+    if advice == _MADV_DONTNEED:
+        if file_backed is None or not any(lo <= start and end <= hi for lo, hi in file_backed):
+            return False
+        start = -(-start // _PAGE_SIZE) * _PAGE_SIZE
+        end = end // _PAGE_SIZE * _PAGE_SIZE
+    else:
+        start = start // _PAGE_SIZE * _PAGE_SIZE
+        end = -(-end // _PAGE_SIZE) * _PAGE_SIZE
+    if end <= start:
+        return False
+    libc = ctypes.CDLL(None, use_errno=True)
+    return libc.madvise(ctypes.c_void_p(start), ctypes.c_size_t(end - start), advice) == 0
+
+
+def _materialize_weights(model, strategy: str = "module"):
     """Force all model parameters and buffers into RAM.
 
     safetensors uses memory-mapped files by default. Even with
     low_cpu_mem_usage=False and no device_map, tensors loaded from
     safetensors remain mmap'd — data is read from disk on-demand
-    during inference, causing severe slowdowns. This function clones
-    every parameter and buffer to break the mmap and ensure weights
-    reside in actual RAM.
+    during inference, causing severe slowdowns.
+
+    Strategies:
+      - "clone": clone every parameter and buffer. The mmap'd pages stay
+        resident until the whole mapping goes away, so peak RSS is roughly
+        twice the model size.
+      - "module": copy module by module and drop each source tensor's pages
+        (madvise DONTNEED) right after copying it, so peak RSS stays close
+        to one model plus one tensor.
+      - "prefetch": keep the mmap but ask the kernel to read it all in
+        ahead of use (madvise WILLNEED); no copy at all, and the page cache
+        is shared with other processes using the same files.
     """
-    for p in model.parameters():
-        p.data = p.data.clone()
-    for b in model.buffers():
-        b.data = b.data.clone()
-
-# Optional types import (already available in Python 3.9+)
+    if strategy not in MATERIALIZATION_STRATEGIES:
+        logger.warning(f"Unknown weight materialization '{strategy}', using 'module'")
+        strategy = "module"
+
+    startup_profile.reset_peak_rss()
+    rss_before = startup_profile.current_rss_bytes()
+    with startup_profile.phase(f"_materialize_weights ({strategy})"):
+        if strategy == "clone":
+            for p in model.parameters():
+                p.data = p.data.clone()
+            for b in model.buffers():
+                b.data = b.data.clone()
+
+        elif strategy == "module":
+            file_backed = _file_backed_ranges()
+            seen: set[int] = set()
+            for module in model.modules():
+                tensors = list(module.parameters(recurse=False)) + list(module.buffers(recurse=False))
+                for t in tensors:
+                    # Tied weights are the same Parameter; copy them once
+                    if id(t) in seen:
+                        continue
+                    seen.add(id(t))
+                    source = t.data
+                    t.data = source.clone()
+                    _madvise_tensor(source, _MADV_DONTNEED, file_backed)
+                    del source
+
+        else:  # prefetch
+            seen_storages: set[int] = set()
+            for t in list(model.parameters()) + list(model.buffers()):
+                ptr = t.untyped_storage().data_ptr()
+                if ptr not in seen_storages:
+                    seen_storages.add(ptr)
+                    _madvise_tensor(t, _MADV_WILLNEED)
+
+    mb = 1024 * 1024
+    peak = startup_profile.peak_rss_bytes()
+    logger.info(
+        f"Materialized weights ({strategy}): peak RSS {peak / mb:.0f} MB "
+        f"(+{(peak - rss_before) / mb:.0f} MB), now {startup_profile.current_rss_bytes() / mb:.0f} MB"
+    )
 
 
 def _check_transformers_version():
@@ -141,387 +298,686 @@ def _check_transformers_version():
         )
 
 
-class ModelWrapper:
+def _torch_dtype(compute_type: str | None, default):
+    """Map a compute_type string to a torch dtype, falling back to `default`."""
+    torch = _dep("torch")
+    return {
+        "float32": torch.float32,
+        "bfloat16": torch.bfloat16,
+        "float16": torch.float16,
+    }.get(compute_type or "", default)
+
+
+def _quantization_config(compute_type: str | None):
+    """Return a bitsandbytes config for int8/int4, or None for other compute types."""
+    if compute_type not in ("int8", "int4"):
+        return None
+    BitsAndBytesConfig = _dep("BitsAndBytesConfig")
+    return BitsAndBytesConfig(
+        load_in_8bit=compute_type == "int8",
+        load_in_4bit=compute_type == "int4",
+    )
+
+
+# ----------------------------------------------------------------------
+# Backends
+# ----------------------------------------------------------------------
+class Backend:
     """
-    Encapsulates loading and running different model types (whisper, parakeet, canary, voxtral, cohere).
+    One loaded ASR model and the code to run it.
+
+    Subclasses implement `load` and `transcribe`; everything else has a
+    sensible default. `profile` is the DecodingProfile to decode with;
+    backends map the fields they have knobs for. Backends are looked up by model_type through
+    `get_backend_class`, so third-party packages can add or override one
+    by exposing it under the `faster_whisper_hotkey.backends` entry point group.
     """
 
+    #: Feature flags callers may check before relying on optional behaviour.
+    capabilities: frozenset[str] = frozenset()
+    #: Whether the loaded module can be saved/restored by SnapshotCache.
+    supports_snapshot = False
+
     def __init__(self, settings):
         self.settings = settings
-        self.model_type = settings.model_type.lower()
+        self.device = settings.device
+        self.compute_type = getattr(settings, "compute_type", None)
+        self.materialization = getattr(settings, "weight_materialization", "module")
+        self.profile = get_profile(getattr(settings, "decoding_profile", None))
         self.model = None
         self.processor = None
-        self.TranscriptionRequest = None
-        self._model_ref = None
-        self._load_model()
 
-    def _load_model(self):
-        mt = self.model_type
-        device = self.settings.device
-        compute_type = getattr(self.settings, "compute_type", None)
-
-        if mt == "whisper":
-            self.model = WhisperModel(
-                model_size_or_path=self.settings.model_name,
-                device=device,
-                compute_type=compute_type,
-            )
+    def load(self):
+        raise NotImplementedError
 
-        elif mt == "parakeet":
-            with suppress_nemo():
-                if compute_type in ("int8", "int4") and device == "cuda":
-                    quant_cfg = BitsAndBytesConfig(
-                        load_in_8bit=True if compute_type == "int8" else False,
-                        load_in_4bit=True if compute_type == "int4" else False,
-                    )
-                    self.model = ASRModel.from_pretrained(
-                        model_name=self.settings.model_name,
-                        map_location=self.settings.device,
-                    ).eval()
-                else:
-                    self.model = ASRModel.from_pretrained(
-                        model_name=self.settings.model_name,
-                        map_location=self.settings.device,
-                    ).eval()
-                self._model_ref = self.model
-
-            if compute_type and compute_type not in ("int8", "int4"):
-                self.model = self.model.to(
-                    {"float32": torch.float32, "bfloat16": torch.bfloat16, "float16": torch.float16}.get(
-                        compute_type, torch.float32
-                    )
-                )
-
-        elif mt == "canary":
-            with suppress_nemo():
-                if compute_type in ("int8", "int4") and device == "cuda":
-                    quant_cfg = BitsAndBytesConfig(
-                        load_in_8bit=True if compute_type == "int8" else False,
-                        load_in_4bit=True if compute_type == "int4" else False,
-                    )
-                    self.model = EncDecMultiTaskModel.from_pretrained(
-                        self.settings.model_name, map_location=self.settings.device
-                    ).eval()
-                else:
-                    self.model = EncDecMultiTaskModel.from_pretrained(
-                        self.settings.model_name, map_location=self.settings.device
-                    ).eval()
-                self._model_ref = self.model
-
-            if compute_type and compute_type not in ("int8", "int4"):
-                self.model = self.model.to(
-                    {"float32": torch.float32, "bfloat16": torch.bfloat16, "float16": torch.float16}.get(
-                        compute_type, torch.float32
-                    )
-                )
-
-        elif mt == "voxtral":
-            repo_id = self.settings.model_name
-            self.processor = AutoProcessor.from_pretrained(repo_id)
-            device_map = {"": device}
-
-            if self.settings.compute_type == "int8":
-                quant_cfg = BitsAndBytesConfig(load_in_8bit=True)
-                self.model = VoxtralForConditionalGeneration.from_pretrained(
-                    repo_id,
-                    quantization_config=quant_cfg,
-                    device_map=device_map,
-                ).eval()
-
-            elif self.settings.compute_type == "int4":
-                quant_cfg = BitsAndBytesConfig(load_in_4bit=True)
-                self.model = VoxtralForConditionalGeneration.from_pretrained(
-                    repo_id,
-                    quantization_config=quant_cfg,
-                    device_map=device_map,
-                ).eval()
+    def load_processor(self):
+        """Load tokenizer/processor state that isn't part of a model snapshot."""
 
-            else:
-                compute_dtype = {
-                    "float32": torch.float32,
-                    "float16": torch.float16,
-                    "bfloat16": torch.bfloat16,
-                }.get(self.settings.compute_type, torch.float16)
-
-                if device == "cpu":
-                    self.model = VoxtralForConditionalGeneration.from_pretrained(
-                        repo_id,
-                        dtype=compute_dtype,
-                        low_cpu_mem_usage=False,
-                    )
-                    _materialize_weights(self.model)
-                else:
-                    self.model = VoxtralForConditionalGeneration.from_pretrained(
-                        repo_id,
-                        dtype=compute_dtype,
-                        device_map=device_map,
-                    )
-                self.model = self.model.eval()
-
-        elif mt == "cohere":
-            repo_id = self.settings.model_name
-            device_map = {"": self.settings.device}
-
-            self.processor = AutoProcessor.from_pretrained(repo_id)
-
-            if compute_type in ("int8", "int4") and device == "cuda":
-                quant_cfg = BitsAndBytesConfig(
-                    load_in_8bit=True if compute_type == "int8" else False,
-                    load_in_4bit=True if compute_type == "int4" else False,
-                )
-                self.model = CohereAsrForConditionalGeneration.from_pretrained(
-                    repo_id,
-                    device_map=device_map,
-                    quantization_config=quant_cfg,
-                )
-            else:
-                _dtype = {"bfloat16": torch.bfloat16, "float16": torch.float16, "float32": torch.float32}.get(
-                    compute_type, torch.bfloat16 if device == "cuda" else torch.float32
-                ) if compute_type and compute_type not in ("int8", "int4") else torch.float32
-
-                if device == "cpu":
-                    self.model = CohereAsrForConditionalGeneration.from_pretrained(
-                        repo_id,
-                        torch_dtype=_dtype,
-                        low_cpu_mem_usage=False,
-                    )
-                    _materialize_weights(self.model)
-                else:
-                    self.model = CohereAsrForConditionalGeneration.from_pretrained(
-                        repo_id,
-                        device_map=device_map,
-                    )
-                    self.model = self.model.to(dtype=_dtype)
-                self.model = self.model.eval()
+    def load_snapshot(self, model):
+        """
+        Adopt a module restored from the snapshot cache instead of calling
+        `load`. `load_processor` has already run, before unpickling, so
+        trust_remote_code classes are importable.
+        """
+        self.model = model.eval()
 
-        elif mt == "granite":
-            repo_id = self.settings.model_name
-            device_map = {"": self.settings.device}
+    def warmup(self, audio_data, sample_rate: int = 16000):
+        """
+        Run one throwaway inference so lazy kernels/allocators are initialized,
+        through the same path real utterances take.
+        """
+        language = getattr(self.settings, "language", None)
+        if self.fast_transcribe(audio_data, sample_rate, language) is None:
+            self.transcribe(audio_data, sample_rate, language)
 
-            _check_transformers_version()
+    def fast_transcribe(self, audio_data, sample_rate: int, language: str | None) -> str | None:
+        """Optional fast path; return None to fall through to `transcribe`."""
+        return None
 
-            self.processor = AutoProcessor.from_pretrained(
-                repo_id, trust_remote_code=True
+    def open_stream(self, sample_rate: int, language: str | None):
+        """
+        Start an incremental decode of one utterance, for backends with the
+        "streaming" capability: an object with `feed(audio) -> str` (text so
+        far) and `finish() -> str` (final text). None if unsupported.
+        """
+
+    def transcribe(self, audio_data, sample_rate: int, language: str | None) -> str:
+        raise NotImplementedError
+
+    def _warn_if_token_capped(self, generated: int, cap: int, fixed_cap: int):
+        """Warn when generate() stopped at max_new_tokens: the text is most likely cut short."""
+        if generated < cap:
+            return
+        if cap < fixed_cap:
+            logger.warning(
+                f"Transcription stopped at this decoding profile's {cap}-token cap and is probably cut short; "
+                "the 'balanced' profile allows more"
             )
+        else:
+            logger.warning(f"Transcription stopped at the {cap}-token limit and is probably cut short")
 
-            if compute_type in ("int8", "int4") and device == "cuda":
-                quant_cfg = BitsAndBytesConfig(
-                    load_in_8bit=True if compute_type == "int8" else False,
-                    load_in_4bit=True if compute_type == "int4" else False,
-                )
-                self.model = AutoModelForSpeechSeq2Seq.from_pretrained(
-                    repo_id,
-                    device_map=device_map,
-                    quantization_config=quant_cfg,
-                    trust_remote_code=True,
-                ).eval()
-            else:
-                _dtype = compute_type and {"bfloat16": torch.bfloat16, "float16": torch.float16, "float32": torch.float32}.get(
-                    compute_type
-                ) or (torch.bfloat16 if device == "cuda" else torch.float32)
-
-                if device == "cpu":
-                    self.model = AutoModelForSpeechSeq2Seq.from_pretrained(
-                        repo_id,
-                        torch_dtype=_dtype,
-                        trust_remote_code=True,
-                        low_cpu_mem_usage=False,
-                    )
-                    _materialize_weights(self.model)
-                else:
-                    self.model = AutoModelForSpeechSeq2Seq.from_pretrained(
-                        repo_id,
-                        device_map=device_map,
-                        torch_dtype=_dtype,
-                        trust_remote_code=True,
-                    )
-                self.model = self.model.eval()
+    def transcribe_batch(self, batch, sample_rate: int, language: str | None) -> list[str]:
+        """Transcribe several clips; backends with native batching override this."""
+        return [self.transcribe(audio_data, sample_rate, language) for audio_data in batch]
+
+    def unload(self):
+        """Drop model references and release cached accelerator memory."""
+        self.model = None
+        self.processor = None
+        torch = sys.modules.get("torch")
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
 
-        elif mt == "granite-nar":
-            repo_id = self.settings.model_name
-            device_map = {"": self.settings.device}
 
-            _check_transformers_version()
+# faster-whisper's own default: retry hotter when a window fails its checks
+FALLBACK_TEMPERATURES = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
 
-            self.processor = AutoProcessor.from_pretrained(
-                repo_id, trust_remote_code=True
-            )
 
-            if compute_type in ("int8", "int4") and device == "cuda":
-                quant_cfg = BitsAndBytesConfig(
-                    load_in_8bit=True if compute_type == "int8" else False,
-                    load_in_4bit=True if compute_type == "int4" else False,
-                )
-                self.model = AutoModel.from_pretrained(
-                    repo_id,
-                    trust_remote_code=True,
-                    attn_implementation="flash_attention_2",
-                    device_map=device_map,
-                    quantization_config=quant_cfg,
-                ).eval()
-            else:
-                _dtype = compute_type and {"bfloat16": torch.bfloat16, "float16": torch.float16, "float32": torch.float32}.get(
-                    compute_type
-                ) or (torch.bfloat16 if device == "cuda" else torch.float32)
-
-                if device == "cpu":
-                    self.model = AutoModel.from_pretrained(
-                        repo_id,
-                        trust_remote_code=True,
-                        attn_implementation="sdpa",
-                        torch_dtype=_dtype,
-                        low_cpu_mem_usage=False,
-                    )
-                    _materialize_weights(self.model)
-                else:
-                    self.model = AutoModel.from_pretrained(
-                        repo_id,
-                        trust_remote_code=True,
-                        attn_implementation="flash_attention_2",
-                        device_map=device_map,
-                        torch_dtype=_dtype,
-                    )
-                self.model = self.model.eval()
+class WhisperBackend(Backend):
+    # Long audio is decoded in 30 s windows by faster-whisper itself
+    capabilities = frozenset({"native_chunking", "language_detection"})
+
+    def __init__(self, settings):
+        super().__init__(settings)
+        # Recordings longer than this go through BatchedInferencePipeline (0 = never)
+        self.batch_threshold = float(getattr(settings, "whisper_batch_threshold", 60.0))
+        self.batch_size = int(getattr(settings, "whisper_batch_size", 8))
+        self._pipeline = None
+
+    def load(self):
+        WhisperModel = _dep("WhisperModel")
+
+        self.model = WhisperModel(
+            model_size_or_path=self.settings.model_name,
+            device=self.device,
+            compute_type=self.compute_type,
+        )
 
+    def _batched_pipeline(self):
+        """BatchedInferencePipeline sharing the loaded model, built on first use."""
+        if self._pipeline is None or self._pipeline.model is not self.model:
+            BatchedInferencePipeline = _dep("BatchedInferencePipeline")
+            self._pipeline = BatchedInferencePipeline(model=self.model)
+        return self._pipeline
+
+    def transcribe(self, audio_data, sample_rate: int, language: str | None) -> str:
+        profile = self.profile
+        options = {
+            "beam_size": profile.beam_size,
+            "temperature": FALLBACK_TEMPERATURES if profile.temperature_fallback else 0.0,
+            "condition_on_previous_text": profile.condition_on_previous_text,
+            # The pipeline defaults this to True, unlike WhisperModel
+            "without_timestamps": profile.without_timestamps,
+            "language": language if language and language != "auto" else None,
+        }
+        if 0 < self.batch_threshold < len(audio_data) / sample_rate:
+            # The pipeline splits at speech boundaries (Silero VAD) and decodes
+            # up to batch_size 30 s windows per CTranslate2 call, instead of
+            # one window after another
+            segments, _ = self._batched_pipeline().transcribe(audio_data, batch_size=self.batch_size, **options)
         else:
-            raise ValueError(f"Unknown model type: {self.model_type}")
+            segments, _ = self.model.transcribe(audio_data, **options)
+        return " ".join(segment.text.strip() for segment in segments)
 
-    def transcribe(
-        self, audio_data, sample_rate: int = 16000, language: str | None = None
-    ) -> str:
-        """
-        Transcribe a numpy array of audio samples and return transcribed text.
-        For some models (canary, voxtral) we write to a temp file and call model utilities requiring a file.
-        For Voxtral-Mini-3B-2507, handles potential input size limits by chunking.
-        """
-        mt = self.model_type
+    def unload(self):
+        self._pipeline = None
+        super().unload()
+
+
+class _NemoBackend(Backend):
+    """
+    Shared loading for NeMo checkpoints (parakeet, canary).
+
+    `transcribe()` builds a manifest, dataset and DataLoader on every call,
+    which dominates short clips. `fast_transcribe` instead runs the
+    preprocessor, encoder and decoding strategy directly on a tensor of the
+    clip; checkpoints it doesn't recognize - or the first error - send it
+    back to `transcribe()` for good.
+    """
+
+    model_class_name = ""
+    supports_snapshot = True
+
+    def __init__(self, settings):
+        super().__init__(settings)
+        self._fast = False
+        self._dtype = None  # parameter dtype the fast path feeds the model
+
+    def load(self):
+        model_class = _dep(self.model_class_name)
+
+        with suppress_nemo():
+            self.model = model_class.from_pretrained(
+                model_name=self.settings.model_name,
+                map_location=self.device,
+            ).eval()
+
+        if self.compute_type and self.compute_type not in ("int8", "int4"):
+            torch = _dep("torch")
+            self.model = self.model.to(_torch_dtype(self.compute_type, torch.float32))
+        self._setup_fast_path()
+
+    def load_snapshot(self, model):
+        super().load_snapshot(model)
+        self._setup_fast_path()
+
+    def _fast_path_supported(self) -> bool:
+        return False
+
+    def _setup_fast_path(self):
+        featurizer = getattr(getattr(self.model, "preprocessor", None), "featurizer", None)
+        self._fast = featurizer is not None and self._fast_path_supported()
+        if not self._fast:
+            logger.debug(f"{type(self).__name__}: no direct-tensor path for this checkpoint, using transcribe()")
+            return
+        # What transcribe() sets around every call: no dither noise, no padding
+        # of the feature frames
+        featurizer.dither = 0.0
+        featurizer.pad_to = 0
+        # float16/bfloat16 compute types need input of the same dtype
         try:
-            if mt == "whisper":
-                segments, _ = self.model.transcribe(
-                    audio_data,
-                    beam_size=5,
-                    condition_on_previous_text=False,
-                    language=(language if language and language != "auto" else None),
-                )
-                return " ".join(segment.text.strip() for segment in segments)
-
-            elif mt == "parakeet":
-                with torch.inference_mode():
-                    out = list(self.model.transcribe([audio_data]))
-                if not out:
-                    return ""
-                result = out[0]
-                if hasattr(result, "text"):
-                    return result.text
-                if isinstance(result, str):
-                    return result
-                if isinstance(result, list) and result:
-                    first = result[0]
-                    if hasattr(first, "text"):
-                        return first.text
-                    if isinstance(first, str):
-                        return first
-                return ""
-
-            elif mt == "canary":
-                lang = language or "en-en"
-                lang_parts = lang.split("-")
-                if len(lang_parts) != 2:
-                    source_lang, target_lang = "en", "en"
-                else:
-                    source_lang, target_lang = lang_parts
-
-                temp_path = None
-                try:
-                    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                        temp_path = f.name
-                    sf.write(temp_path, audio_data, sample_rate)
-                    with suppress_output():
-                        out = self.model.transcribe(
-                            audio=[temp_path],
-                            source_lang=source_lang,
-                            target_lang=target_lang,
-                        )
-                    if not out or len(out) == 0:
-                        return ""
-                    result = out[0]
-                    return result.strip() if isinstance(result, str) else result.text.strip()
-                finally:
-                    if temp_path and os.path.exists(temp_path):
-                        os.remove(temp_path)
-
-            elif mt == "voxtral":
-                return self._transcribe_voxtral(audio_data, sample_rate, language)
-
-            elif mt == "cohere":
-                return self._transcribe_cohere(audio_data, sample_rate, language)
-            elif mt == "granite":
-                device = self.settings.device
-                waveform = torch.from_numpy(audio_data).to(device)
-                # Full language names expected by granite-speech-4.1-2b prompts
-                granite_lang_names: dict[str, str] = {
-                    "en": "English",
-                    "fr": "French",
-                    "de": "German",
-                    "es": "Spanish",
-                    "ja": "Japanese",
-                    "it": "Italian",
-                    "zh": "Mandarin",
-                }
-                lang = language or "en-en"
-                lang_parts = lang.split("-") if lang else ["en", "en"]
-                if len(lang_parts) == 2 and lang_parts[0] != lang_parts[1]:
-                    target_name = granite_lang_names.get(
-                        lang_parts[1], lang_parts[1]
+            self._dtype = next(self.model.parameters()).dtype
+        except (AttributeError, StopIteration, TypeError):
+            self._dtype = None
+
+    def _signal(self, audio_data):
+        """The clip as a (1, n) tensor in the model's device and dtype, and its length."""
+        torch = _dep("torch")
+        signal = torch.from_numpy(np.ascontiguousarray(audio_data, dtype=np.float32)).unsqueeze(0)
+        signal = signal.to(device=self.device, dtype=self._dtype)
+        return signal, torch.tensor([signal.shape[1]], device=signal.device)
+
+    def _decode_tensor(self, audio_data, language: str | None) -> str | None:
+        raise NotImplementedError
+
+    def fast_transcribe(self, audio_data, sample_rate: int, language: str | None) -> str | None:
+        if not self._fast:
+            return None
+        torch = _dep("torch")
+        try:
+            with torch.inference_mode():
+                return self._decode_tensor(audio_data, language)
+        except Exception as e:
+            logger.warning(f"Direct-tensor decode failed, using transcribe() from now on: {e}")
+            self._fast = False
+            return None
+
+
+def _nemo_text(out) -> str:
+    """Text of the first hypothesis in a NeMo transcribe/stream result."""
+    if not out:
+        return ""
+    result = out[0]
+    if hasattr(result, "text"):
+        return result.text
+    if isinstance(result, str):
+        return result
+    if isinstance(result, list) and result:
+        first = result[0]
+        if hasattr(first, "text"):
+            return first.text
+        if isinstance(first, str):
+            return first
+    return ""
+
+
+def _nemo_texts(out, n: int) -> list[str]:
+    """Texts of a batched NeMo transcribe result, one per input."""
+    if out and isinstance(out[0], list):
+        # Older RNNT API: (best_hypotheses, all_hypotheses)
+        out = out[0]
+    texts = [_nemo_text([result]) for result in out]
+    return texts + [""] * (n - len(texts))
+
+
+class _NemoCacheAwareStream:
+    """
+    Cache-aware streaming decode of one utterance with a FastConformer encoder.
+
+    Audio becomes log-mel features as it arrives (only the last few frames'
+    worth of audio is kept for STFT context) and is fed to the encoder one
+    chunk at a time via `conformer_stream_step`, following NeMo's
+    CacheAwareStreamingAudioBuffer. The encoder's attention/convolution
+    caches and the decoder's hypotheses carry over between chunks, so no
+    audio is encoded twice and finishing costs one chunk, not the utterance.
+    """
+
+    def __init__(self, model, sample_rate: int = 16000):
+        torch = _dep("torch")
+        self.model = model
+        self.sample_rate = sample_rate
+        self._cfg = model.encoder.streaming_cfg
+        param = next(model.parameters())
+        self._device, self._dtype = param.device, param.dtype
+        featurizer = model.preprocessor.featurizer
+        self._hop = int(featurizer.hop_length)
+        self._pad = int(featurizer.n_fft) // 2
+        # Frames whose STFT window reaches left of the kept audio
+        self._context_frames = -(-self._pad // self._hop) + 1
+        self._audio = np.zeros(0, dtype=np.float32)
+        self._audio_frame0 = 0  # global frame index of _audio[0]
+        self._frames_taken = 0  # global frames moved into _features
+        self._features = None  # (1, n_mels, T) not yet consumed, plus pre-encode context
+        self._index = 0  # next chunk start within _features
+        self._step = 0
+        self._cache = tuple(model.encoder.get_initial_cache_state(batch_size=1))
+        self._hypotheses = None
+        self._pred_out = None
+        self.text = ""
+        self._torch = torch
+
+    def _sizes(self) -> tuple[int, int, int]:
+        def pick(value):
+            if isinstance(value, (list, tuple)):
+                return int(value[0] if self._step == 0 else value[1])
+            return int(value)
+
+        cfg = self._cfg
+        return pick(cfg.chunk_size), pick(cfg.shift_size), pick(cfg.pre_encode_cache_size)
+
+    def _add_audio(self, audio, final: bool):
+        torch = self._torch
+        self._audio = np.concatenate([self._audio, np.asarray(audio, dtype=np.float32)])
+        if self._audio.size == 0:
+            return
+        signal = torch.from_numpy(self._audio).unsqueeze(0).to(self._device, self._dtype)
+        length = torch.tensor([self._audio.size], device=self._device)
+        features, feature_length = self.model.preprocessor(input_signal=signal, length=length)
+        n_frames = int(feature_length[0])
+        if not final:
+            # Frames whose window extends past the audio will still change
+            n_frames = min(n_frames, max((self._audio.size - self._pad) // self._hop + 1, 0))
+        first = self._frames_taken - self._audio_frame0
+        if n_frames > first:
+            new = features[:, :, first:n_frames]
+            self._features = new if self._features is None else torch.cat([self._features, new], dim=-1)
+            self._frames_taken = self._audio_frame0 + n_frames
+        drop = max(self._frames_taken - self._audio_frame0 - self._context_frames, 0)
+        if drop:
+            self._audio = self._audio[drop * self._hop :]
+            self._audio_frame0 += drop
+
+    def _run_chunks(self, final: bool):
+        torch = self._torch
+        while self._features is not None:
+            total = self._features.size(-1)
+            chunk, shift, pre = self._sizes()
+            available = total - self._index
+            if available <= 0 or (available < chunk and not final):
+                break
+            x = self._features[:, :, self._index : self._index + chunk]
+            if pre:
+                context = self._features[:, :, max(0, self._index - pre) : self._index]
+                if context.size(-1) < pre:
+                    zeros = torch.zeros(
+                        (1, x.size(1), pre - context.size(-1)), device=x.device, dtype=x.dtype
                     )
-                    action = f"translate the speech to {target_name}"
-                else:
-                    action = "transcribe the speech"
-                user_prompt = (
-                    f"<|audio|>{action} with proper punctuation "
-                    "and capitalization."
-                )
-                chat = [{"role": "user", "content": user_prompt}]
-                prompt = self.processor.tokenizer.apply_chat_template(
-                    chat, tokenize=False, add_generation_prompt=True
-                )
-                model_inputs = self.processor(
-                    prompt, waveform, device=device, return_tensors="pt"
-                ).to(device)
-                model_outputs = self.model.generate(
-                    **model_inputs,
-                    max_new_tokens=400,
-                    do_sample=False,
-                    num_beams=1,
-                )
-                num_input_tokens = model_inputs["input_ids"].shape[-1]
-                new_tokens = model_outputs[0, num_input_tokens:].unsqueeze(0)
-                output_text = self.processor.tokenizer.batch_decode(
-                    new_tokens, add_special_tokens=False, skip_special_tokens=True
-                )
-                return output_text[0] if output_text else ""
-
-            elif mt == "granite-nar":
-                device = self.settings.device
-                waveform = torch.from_numpy(audio_data).to(device)
-                inputs = self.processor([waveform], device=device)
-                with torch.no_grad():
-                    output = self.model.transcribe(**inputs)
-                transcriptions = self.processor.batch_decode(
-                    output.preds, skip_special_tokens=True
-                )
-                return transcriptions[0] if transcriptions else ""
+                    context = torch.cat([zeros, context], dim=-1)
+                x = torch.cat([context, x], dim=-1)
+            last = final and self._index + shift >= total
+            outputs = self.model.conformer_stream_step(
+                processed_signal=x,
+                processed_signal_length=torch.tensor([x.size(-1)], device=x.device),
+                cache_last_channel=self._cache[0],
+                cache_last_time=self._cache[1],
+                cache_last_channel_len=self._cache[2],
+                keep_all_outputs=last,
+                previous_hypotheses=self._hypotheses,
+                previous_pred_out=self._pred_out,
+                drop_extra_pre_encoded=0 if self._step == 0 else self._cfg.drop_extra_pre_encoded,
+                return_transcription=True,
+            )
+            self._pred_out, texts, *cache, self._hypotheses = outputs
+            self._cache = tuple(cache)
+            self.text = _nemo_text(texts)
+            self._index += shift
+            self._step += 1
+            if last:
+                break
+        if self._features is not None:
+            # Keep only what later chunks still need as pre-encode context
+            _, _, pre = self._sizes()
+            keep_from = max(0, min(self._index, self._features.size(-1)) - pre)
+            self._features = self._features[:, :, keep_from:]
+            self._index -= keep_from
+
+    def feed(self, audio) -> str:
+        """Encode whatever full chunks `audio` completes; returns the text so far."""
+        with self._torch.inference_mode():
+            self._add_audio(audio, final=False)
+            self._run_chunks(final=False)
+        return self.text
+
+    def finish(self, audio=None) -> str:
+        """Encode the rest of the utterance (plus optional final audio) and return its text."""
+        with self._torch.inference_mode():
+            self._add_audio(np.zeros(0, dtype=np.float32) if audio is None else audio, final=True)
+            self._run_chunks(final=True)
+        return self.text
+
+
+class ParakeetBackend(_NemoBackend):
+    model_class_name = "ASRModel"
+    capabilities = frozenset({"batch"})
+
+    def load(self):
+        super().load()
+        self._detect_streaming()
+
+    def load_snapshot(self, model):
+        super().load_snapshot(model)
+        self._detect_streaming()
+
+    def _detect_streaming(self):
+        """Advertise "streaming" for checkpoints trained for cache-aware inference."""
+        encoder = getattr(self.model, "encoder", None)
+        cache_aware = (
+            getattr(encoder, "att_context_style", None) == "chunked_limited"
+            and hasattr(self.model, "conformer_stream_step")
+        )
+        if cache_aware and getattr(encoder, "streaming_cfg", None) is None:
+            encoder.setup_streaming_params()
+        self.capabilities = type(self).capabilities | ({"streaming"} if cache_aware else set())
+
+    def open_stream(self, sample_rate: int, language: str | None):
+        if "streaming" not in self.capabilities:
+            return None
+        return _NemoCacheAwareStream(self.model, sample_rate)
+
+    def _fast_path_supported(self) -> bool:
+        decoding = getattr(self.model, "decoding", None)
+        return hasattr(decoding, "rnnt_decoder_predictions_tensor") or hasattr(
+            decoding, "ctc_decoder_predictions_tensor"
+        )
+
+    def _decode_tensor(self, audio_data, language: str | None) -> str | None:
+        signal, length = self._signal(audio_data)
+        features, features_len = self.model.preprocessor(input_signal=signal, length=length)
+        encoded, encoded_len = self.model.encoder(audio_signal=features, length=features_len)
+        decoding = self.model.decoding
+        if hasattr(decoding, "rnnt_decoder_predictions_tensor"):
+            out = decoding.rnnt_decoder_predictions_tensor(encoder_output=encoded, encoded_lengths=encoded_len)
+        else:
+            log_probs = self.model.decoder(encoder_output=encoded)
+            out = decoding.ctc_decoder_predictions_tensor(log_probs, decoder_lengths=encoded_len)
+        return _nemo_text(out)
+
+    def transcribe(self, audio_data, sample_rate: int, language: str | None) -> str:
+        torch = _dep("torch")
+        with torch.inference_mode():
+            out = list(self.model.transcribe([audio_data]))
+        return _nemo_text(out)
+
+    def transcribe_batch(self, batch, sample_rate: int, language: str | None) -> list[str]:
+        torch = _dep("torch")
+        with torch.inference_mode():
+            out = list(self.model.transcribe(list(batch), batch_size=len(batch)))
+        return _nemo_texts(out, len(batch))
+
 
+class CanaryBackend(_NemoBackend):
+    model_class_name = "EncDecMultiTaskModel"
+    capabilities = frozenset({"translation", "batch"})
+
+    def __init__(self, settings):
+        super().__init__(settings)
+        # Clips go to NeMo as arrays; older versions that only take paths get
+        # memfd-backed WAV files instead
+        self._array_input = True
+        # Decoder prompt per (source, target) language pair, as transcribe()
+        # built it, for the direct-tensor path
+        self._prompts: dict[tuple[str, str], object] = {}
+
+    def load(self):
+        _patch_canary_eos_id()
+        super().load()
+
+    def load_snapshot(self, model):
+        _patch_canary_eos_id()
+        super().load_snapshot(model)
+
+    def transcribe(self, audio_data, sample_rate: int, language: str | None) -> str:
+        return self.transcribe_batch([audio_data], sample_rate, language)[0]
+
+    @staticmethod
+    def _lang_pair(language: str | None) -> tuple[str, str]:
+        lang_parts = (language or "en-en").split("-")
+        if len(lang_parts) != 2:
+            return "en", "en"
+        return lang_parts[0], lang_parts[1]
+
+    def _fast_path_supported(self) -> bool:
+        return hasattr(self.model, "prompt") and hasattr(
+            getattr(self.model, "decoding", None), "decode_predictions_tensor"
+        )
+
+    def _decode_tensor(self, audio_data, language: str | None) -> str | None:
+        # The prompt format differs between canary generations; the first
+        # clip of each language pair goes through transcribe(), which records it
+        prompt = self._prompts.get(self._lang_pair(language))
+        if prompt is None:
+            return None
+        signal, length = self._signal(audio_data)
+        _, _, enc_states, enc_mask = self.model.forward(input_signal=signal, input_signal_length=length)
+        out = self.model.decoding.decode_predictions_tensor(
+            encoder_hidden_states=enc_states,
+            encoder_input_mask=enc_mask,
+            decoder_input_ids=prompt.to(enc_states.device),
+            return_hypotheses=False,
+        )
+        return _nemo_text(out).strip()
+
+    @contextlib.contextmanager
+    def _recording_prompt(self, key: tuple[str, str]):
+        """Keep the decoder prompt transcribe() builds for the language pair `key`."""
+        decoding = self.model.decoding
+        # A plain method is restored by dropping the shadowing instance attribute
+        from_class = "decode_predictions_tensor" not in vars(decoding) and hasattr(
+            type(decoding), "decode_predictions_tensor"
+        )
+        decode = decoding.decode_predictions_tensor
+
+        def _record(*args, **kwargs):
+            decoder_input_ids = kwargs.get("decoder_input_ids")
+            if decoder_input_ids is not None:
+                self._prompts[key] = decoder_input_ids[:1].detach().clone()
+            return decode(*args, **kwargs)
+
+        decoding.decode_predictions_tensor = _record
+        try:
+            yield
+        finally:
+            if from_class:
+                del decoding.decode_predictions_tensor
             else:
-                raise ValueError(f"Unknown model type: {mt}")
+                decoding.decode_predictions_tensor = decode
+
+    def transcribe_batch(self, batch, sample_rate: int, language: str | None) -> list[str]:
+        source_lang, target_lang = self._lang_pair(language)
+        key = (source_lang, target_lang)
+        if self._fast and len(batch) == 1 and key not in self._prompts:
+            with self._recording_prompt(key):
+                return self._transcribe_batch(batch, sample_rate, source_lang, target_lang)
+        return self._transcribe_batch(batch, sample_rate, source_lang, target_lang)
+
+    def _transcribe_batch(self, batch, sample_rate: int, source_lang: str, target_lang: str) -> list[str]:
+        if self._array_input:
+            try:
+                return self._transcribe_inputs(list(batch), source_lang, target_lang)
+            except (TypeError, ValueError) as e:
+                array_error = e
+            # NeMo's own validation (e.g. an unsupported language pair) raises
+            # these too: only a WAV retry that succeeds shows arrays are the problem
+            with _memfd_wavs(batch, sample_rate) as paths:
+                texts = self._transcribe_inputs(paths, source_lang, target_lang)
+            logger.info(f"canary: this NeMo version doesn't take arrays ({array_error}), using in-memory WAV files")
+            self._array_input = False
+            return texts
+        with _memfd_wavs(batch, sample_rate) as paths:
+            return self._transcribe_inputs(paths, source_lang, target_lang)
+
+    def _transcribe_inputs(self, inputs: list, source_lang: str, target_lang: str) -> list[str]:
+        with suppress_output():
+            out = self.model.transcribe(
+                audio=inputs,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                batch_size=len(inputs),
+            )
+        texts = [result.strip() if isinstance(result, str) else result.text.strip() for result in (out or [])]
+        return texts + [""] * (len(inputs) - len(texts))
+
+
+class VoxtralBackend(Backend):
+    capabilities = frozenset({"native_chunking", "language_detection"})
+    supports_snapshot = True
+
+    def load_processor(self):
+        self.processor = _dep("AutoProcessor").from_pretrained(self.settings.model_name)
+
+    def load(self):
+        torch = _dep("torch")
+        VoxtralForConditionalGeneration = _dep("VoxtralForConditionalGeneration")
+
+        repo_id = self.settings.model_name
+        self.load_processor()
+        device_map = {"": self.device}
+
+        quant_cfg = _quantization_config(self.compute_type)
+        if quant_cfg is not None:
+            self.model = VoxtralForConditionalGeneration.from_pretrained(
+                repo_id,
+                quantization_config=quant_cfg,
+                device_map=device_map,
+            ).eval()
+            return
+
+        compute_dtype = _torch_dtype(self.compute_type, torch.float16)
+        if self.device == "cpu":
+            self.model = VoxtralForConditionalGeneration.from_pretrained(
+                repo_id,
+                dtype=compute_dtype,
+                low_cpu_mem_usage=False,
+            )
+            _materialize_weights(self.model, self.materialization)
+        else:
+            self.model = VoxtralForConditionalGeneration.from_pretrained(
+                repo_id,
+                dtype=compute_dtype,
+                device_map=device_map,
+            )
+        self.model = self.model.eval()
 
-        except Exception as e:
-            logger.error(f"Error during model.transcribe: {e}")
-            return ""
+    def transcribe(self, audio_data, sample_rate: int, language: str | None) -> str:
+        """Transcribe audio using Voxtral with native chunking via apply_transcription_request."""
+        torch = _dep("torch")
+        # The processor takes the samples directly; no WAV round trip
+        inputs = self.processor.apply_transcription_request(
+            audio=audio_data,
+            sampling_rate=sample_rate,
+            model_id=self.settings.model_name,
+            language=language if language and language != "auto" else None,
+            return_tensors="pt",
+        )
+        inputs = inputs.to(self.model.device)
+
+        cap = self.profile.max_new_tokens(500, len(audio_data) / sample_rate)
+        with torch.no_grad():
+            output = self.model.generate(**inputs, max_new_tokens=cap, num_beams=self.profile.num_beams)
+        # The output repeats the prompt
+        prompt = inputs.get("input_ids")
+        self._warn_if_token_capped(
+            int(output.shape[-1]) - (int(prompt.shape[-1]) if prompt is not None else 0), cap, 500
+        )
 
-    def _transcribe_cohere(
-        self, audio_data, sample_rate: int, language: str | None
-    ) -> str:
+        return self.processor.batch_decode(output, skip_special_tokens=True)[0]
+
+
+class CohereBackend(Backend):
+    capabilities = frozenset({"native_chunking"})
+    supports_snapshot = True
+
+    def load_processor(self):
+        self.processor = _dep("AutoProcessor").from_pretrained(self.settings.model_name)
+
+    def load(self):
+        torch = _dep("torch")
+        CohereAsrForConditionalGeneration = _dep("CohereAsrForConditionalGeneration")
+
+        repo_id = self.settings.model_name
+        device_map = {"": self.device}
+
+        self.load_processor()
+
+        if self.compute_type in ("int8", "int4") and self.device == "cuda":
+            self.model = CohereAsrForConditionalGeneration.from_pretrained(
+                repo_id,
+                device_map=device_map,
+                quantization_config=_quantization_config(self.compute_type),
+            )
+            return
+
+        if self.compute_type:
+            _dtype = _torch_dtype(self.compute_type, torch.bfloat16 if self.device == "cuda" else torch.float32)
+        else:
+            _dtype = torch.float32
+
+        if self.device == "cpu":
+            self.model = CohereAsrForConditionalGeneration.from_pretrained(
+                repo_id,
+                torch_dtype=_dtype,
+                low_cpu_mem_usage=False,
+            )
+            _materialize_weights(self.model, self.materialization)
+        else:
+            self.model = CohereAsrForConditionalGeneration.from_pretrained(
+                repo_id,
+                device_map=device_map,
+            )
+            self.model = self.model.to(dtype=_dtype)
+        self.model = self.model.eval()
+
+    def transcribe(self, audio_data, sample_rate: int, language: str | None) -> str:
         """Transcribe audio for cohere-transcribe-03-2026 with native chunking."""
         lang = language or "en"
         inputs = self.processor(
@@ -529,7 +985,11 @@ class ModelWrapper:
         )
         audio_chunk_index = inputs.get("audio_chunk_index")
         inputs = inputs.to(self.model.device, dtype=self.model.dtype)
-        outputs = self.model.generate(**inputs, max_new_tokens=256)
+        cap = self.profile.max_new_tokens(256, len(audio_data) / sample_rate)
+        outputs = self.model.generate(**inputs, max_new_tokens=cap, num_beams=self.profile.num_beams)
+        # Decoder sequences start with the decoder prompt, so this can fire a
+        # token or two early; one row per native chunk
+        self._warn_if_token_capped(int(outputs.shape[-1]), cap, 256)
         text = self.processor.decode(
             outputs,
             skip_special_tokens=True,
@@ -540,32 +1000,423 @@ class ModelWrapper:
             return text[0].strip() if text else ""
         return text.strip() if text else ""
 
-    def _transcribe_voxtral(
-        self, audio_data, sample_rate: int, language: str | None
+
+class _GraniteBackendBase(Backend):
+    """Shared loading for the granite-speech checkpoints."""
+
+    model_class_name = ""
+    supports_snapshot = True
+
+    def _from_pretrained_kwargs(self) -> dict:
+        return {}
+
+    def load_processor(self):
+        _check_transformers_version()
+        self.processor = _dep("AutoProcessor").from_pretrained(
+            self.settings.model_name, trust_remote_code=True
+        )
+
+    def load(self):
+        torch = _dep("torch")
+        model_class = _dep(self.model_class_name)
+
+        repo_id = self.settings.model_name
+        device_map = {"": self.device}
+
+        self.load_processor()
+
+        extra = self._from_pretrained_kwargs()
+        if self.compute_type in ("int8", "int4") and self.device == "cuda":
+            self.model = model_class.from_pretrained(
+                repo_id,
+                trust_remote_code=True,
+                device_map=device_map,
+                quantization_config=_quantization_config(self.compute_type),
+                **extra,
+            ).eval()
+            return
+
+        _dtype = _torch_dtype(self.compute_type, torch.bfloat16 if self.device == "cuda" else torch.float32)
+
+        if self.device == "cpu":
+            self.model = model_class.from_pretrained(
+                repo_id,
+                trust_remote_code=True,
+                torch_dtype=_dtype,
+                low_cpu_mem_usage=False,
+                **self._cpu_kwargs(extra),
+            )
+            _materialize_weights(self.model, self.materialization)
+        else:
+            self.model = model_class.from_pretrained(
+                repo_id,
+                trust_remote_code=True,
+                device_map=device_map,
+                torch_dtype=_dtype,
+                **extra,
+            )
+        self.model = self.model.eval()
+
+    def _cpu_kwargs(self, extra: dict) -> dict:
+        return extra
+
+
+# Full language names expected by granite-speech-4.1-2b prompts
+GRANITE_LANGUAGE_NAMES = {
+    "en": "English",
+    "fr": "French",
+    "de": "German",
+    "es": "Spanish",
+    "ja": "Japanese",
+    "it": "Italian",
+    "zh": "Mandarin",
+}
+
+
+class GraniteBackend(_GraniteBackendBase):
+    model_class_name = "AutoModelForSpeechSeq2Seq"
+    capabilities = frozenset({"translation"})
+
+    def transcribe(self, audio_data, sample_rate: int, language: str | None) -> str:
+        torch = _dep("torch")
+        device = self.device
+        waveform = torch.from_numpy(audio_data).to(device)
+        lang = language or "en-en"
+        lang_parts = lang.split("-") if lang else ["en", "en"]
+        if len(lang_parts) == 2 and lang_parts[0] != lang_parts[1]:
+            target_name = GRANITE_LANGUAGE_NAMES.get(lang_parts[1], lang_parts[1])
+            action = f"translate the speech to {target_name}"
+        else:
+            action = "transcribe the speech"
+        user_prompt = (
+            f"<|audio|>{action} with proper punctuation "
+            "and capitalization."
+        )
+        chat = [{"role": "user", "content": user_prompt}]
+        prompt = self.processor.tokenizer.apply_chat_template(
+            chat, tokenize=False, add_generation_prompt=True
+        )
+        model_inputs = self.processor(
+            prompt, waveform, device=device, return_tensors="pt"
+        ).to(device)
+        cap = self.profile.max_new_tokens(400, len(audio_data) / sample_rate)
+        model_outputs = self.model.generate(
+            **model_inputs,
+            max_new_tokens=cap,
+            do_sample=False,
+            num_beams=self.profile.num_beams,
+        )
+        num_input_tokens = model_inputs["input_ids"].shape[-1]
+        new_tokens = model_outputs[0, num_input_tokens:].unsqueeze(0)
+        self._warn_if_token_capped(int(new_tokens.shape[-1]), cap, 400)
+        output_text = self.processor.tokenizer.batch_decode(
+            new_tokens, add_special_tokens=False, skip_special_tokens=True
+        )
+        return output_text[0] if output_text else ""
+
+
+class GraniteNarBackend(_GraniteBackendBase):
+    model_class_name = "AutoModel"
+    capabilities = frozenset({"batch"})
+
+    def _from_pretrained_kwargs(self) -> dict:
+        return {"attn_implementation": "flash_attention_2"}
+
+    def _cpu_kwargs(self, extra: dict) -> dict:
+        # flash-attention is CUDA-only
+        return {**extra, "attn_implementation": "sdpa"}
+
+    def transcribe(self, audio_data, sample_rate: int, language: str | None) -> str:
+        return self.transcribe_batch([audio_data], sample_rate, language)[0]
+
+    def transcribe_batch(self, batch, sample_rate: int, language: str | None) -> list[str]:
+        torch = _dep("torch")
+        device = self.device
+        waveforms = [torch.from_numpy(audio_data).to(device) for audio_data in batch]
+        inputs = self.processor(waveforms, device=device)
+        with torch.no_grad():
+            output = self.model.transcribe(**inputs)
+        transcriptions = self.processor.batch_decode(
+            output.preds, skip_special_tokens=True
+        )
+        if not transcriptions:
+            return [""] * len(batch)
+        return list(transcriptions)
+
+
+# ----------------------------------------------------------------------
+# Backend registry
+# ----------------------------------------------------------------------
+BACKEND_ENTRY_POINT_GROUP = "faster_whisper_hotkey.backends"
+DIST_NAME = "faster-whisper-hotkey"
+
+_BUILTIN_BACKENDS: dict[str, type[Backend]] = {
+    "whisper": WhisperBackend,
+    "parakeet": ParakeetBackend,
+    "canary": CanaryBackend,
+    "voxtral": VoxtralBackend,
+    "cohere": CohereBackend,
+    "granite": GraniteBackend,
+    "granite-nar": GraniteNarBackend,
+}
+
+# Backends registered at runtime or already resolved from entry points
+_backend_registry: dict[str, type[Backend]] = {}
+
+
+def register_backend(model_type: str, backend_class: type[Backend]):
+    """Register (or override) the backend used for `model_type`."""
+    _backend_registry[model_type.lower()] = backend_class
+
+
+def _entry_point_backends():
+    """Backend entry points published by other distributions."""
+    from importlib.metadata import entry_points
+
+    try:
+        eps = entry_points(group=BACKEND_ENTRY_POINT_GROUP)
+    except Exception as e:
+        logger.debug(f"Could not read backend entry points: {e}")
+        return ()
+    # Older installs of this package registered the built-ins too; those
+    # must never shadow an out-of-tree override of the same name
+    return [ep for ep in eps if _dist_name(ep) != DIST_NAME]
+
+
+def _dist_name(ep) -> str | None:
+    name = getattr(getattr(ep, "dist", None), "name", None)
+    return name.lower().replace("_", "-") if name else None
+
+
+def get_backend_class(model_type: str) -> type[Backend]:
+    """
+    Return the backend class for `model_type`.
+
+    Runtime registrations win, then entry points from other installed
+    distributions (only the one matching `model_type` is imported), then
+    the built-in backends, so a published entry point reliably overrides
+    a built-in of the same name.
+    """
+    mt = model_type.lower()
+    if mt in _backend_registry:
+        return _backend_registry[mt]
+
+    for ep in _entry_point_backends():
+        if ep.name != mt:
+            continue
+        try:
+            backend_class = ep.load()
+        except Exception as e:
+            logger.warning(f"Failed to load backend entry point '{ep.value}': {e}")
+            break
+        _backend_registry[mt] = backend_class
+        return backend_class
+
+    if mt in _BUILTIN_BACKENDS:
+        return _BUILTIN_BACKENDS[mt]
+    raise ValueError(f"Unknown model type: {model_type}")
+
+
+# Synthetic clip lengths (seconds) used by ModelWrapper.warmup
+WARMUP_DURATIONS = (1.0, 4.0, 12.0)
+
+
+class ModelWrapper:
+    """
+    Encapsulates loading and running different model types (whisper, parakeet, canary, voxtral, cohere).
+
+    The per-model work lives in a `Backend`; this class resolves it from the
+    registry and adds timing and error handling common to all backends.
+    """
+
+    def __init__(self, settings):
+        self.settings = settings
+        self.model_type = settings.model_type.lower()
+        self.backend: Backend = get_backend_class(self.model_type)(settings)
+        # Recordings longer than this (seconds; 0 = never) go through the
+        # long-form stage unless the backend chunks natively
+        self.longform_threshold = float(getattr(settings, "longform_threshold", 60.0))
+        self.longform_chunk = float(getattr(settings, "longform_chunk", 30.0))
+        self.longform_batch_size = int(getattr(settings, "longform_batch_size", 8))
+        self._pending_snapshot: SnapshotCache | None = None
+        self._load_model()
+
+    @property
+    def model(self):
+        return self.backend.model
+
+    @property
+    def processor(self):
+        return self.backend.processor
+
+    @property
+    def capabilities(self) -> frozenset[str]:
+        return self.backend.capabilities
+
+    def _snapshot_cache(self) -> SnapshotCache | None:
+        """The snapshot cache entry for this model, if snapshots apply to it."""
+        if not getattr(self.settings, "snapshot_cache", False) or not self.backend.supports_snapshot:
+            return None
+        # bitsandbytes-quantized modules can't be pickled and restored reliably
+        if self.backend.compute_type in ("int8", "int4"):
+            return None
+        cache = SnapshotCache(self.settings)
+        reason = cache.failed()
+        if reason:
+            logger.info(f"Not using a model snapshot, an earlier attempt failed: {reason}")
+            return None
+        return cache
+
+    def _load_model(self):
+        start = time.perf_counter()
+        cache = self._snapshot_cache()
+
+        if cache is not None and cache.exists():
+            try:
+                with startup_profile.phase(f"{self.model_type} load (snapshot)"):
+                    self.backend.load_processor()
+                    self.backend.load_snapshot(cache.load(self.backend.device))
+                    # The snapshot is mmap'd on CPU just like safetensors
+                    if self.backend.device == "cpu":
+                        _materialize_weights(self.backend.model, self.backend.materialization)
+                logger.info(f"Loaded {self.model_type} from snapshot in {time.perf_counter() - start:.2f}s")
+                return
+            except Exception as e:
+                # Usually deterministic (unpicklable state, classes missing at
+                # unpickling time): don't pay for a rebuild on every launch
+                logger.warning(f"Model snapshot unusable, no longer caching this model: {e}")
+                cache.mark_failed(f"restore: {e}")
+                cache = None
+
+        with startup_profile.phase(f"{self.model_type} load (from_pretrained)"):
+            self.backend.load()
+        logger.debug(f"Loaded {self.model_type} backend in {time.perf_counter() - start:.2f}s")
+        # Writing a multi-GB snapshot shouldn't delay readiness; see save_snapshot()
+        self._pending_snapshot = cache
+
+    def save_snapshot(self):
+        """
+        Write the snapshot a from_pretrained load left pending, if any.
+
+        Callers run this once the model is marked ready; it is a no-op after
+        a snapshot hit or when snapshots don't apply.
+        """
+        cache, self._pending_snapshot = self._pending_snapshot, None
+        if cache is None:
+            return
+        start = time.perf_counter()
+        try:
+            cache.save(self.backend.model)
+            logger.info(f"Saved model snapshot to {cache.path} in {time.perf_counter() - start:.2f}s")
+        except Exception as e:
+            logger.warning(f"Could not save model snapshot, no longer caching this model: {e}")
+            cache.mark_failed(f"save: {e}")
+
+    def transcribe(
+        self,
+        audio_data,
+        sample_rate: int = 16000,
+        language: str | None = None,
+        profile: str | None = None,
     ) -> str:
-        """Transcribe audio using Voxtral with native chunking via apply_transcription_request."""
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_audio:
-            sf.write(tmp_audio.name, audio_data, sample_rate)
-            audio_path = tmp_audio.name
+        """
+        Transcribe a numpy array of audio samples and return transcribed text.
+        `profile` names a decoding profile to use instead of the configured one.
+        Errors are logged and reported as an empty transcription.
+        """
+        start = time.perf_counter()
+        try:
+            with self._use_profile(profile):
+                return self._transcribe(audio_data, sample_rate, language)
+        except Exception as e:
+            logger.error(f"Error during model.transcribe: {e}")
+            return ""
+        finally:
+            logger.debug(
+                f"{self.model_type} transcribed {len(audio_data) / sample_rate:.2f}s of audio "
+                f"in {time.perf_counter() - start:.3f}s"
+            )
 
+    @contextlib.contextmanager
+    def _use_profile(self, name: str | None):
+        """Decode with the named profile for the duration of one call (callers serialize calls)."""
+        if name is None:
+            yield
+            return
+        configured, self.backend.profile = self.backend.profile, get_profile(name)
         try:
-            inputs = self.processor.apply_transcription_request(
-                audio=audio_path,
-                model_id=self.settings.model_name,
-                language=language if language and language != "auto" else None,
-                return_tensors="pt",
+            yield
+        finally:
+            self.backend.profile = configured
+
+    def _transcribe(self, audio_data, sample_rate: int, language: str | None) -> str:
+        if self._is_long(audio_data, sample_rate):
+            return longform.transcribe_long(
+                self.backend,
+                audio_data,
+                sample_rate,
+                language,
+                chunk_s=self.longform_chunk,
+                batch_size=self.longform_batch_size,
             )
-            inputs = inputs.to(self.model.device)
+        text = self.backend.fast_transcribe(audio_data, sample_rate, language)
+        if text is None:
+            text = self.backend.transcribe(audio_data, sample_rate, language)
+        return text
+
+    def _is_long(self, audio_data, sample_rate: int) -> bool:
+        return (
+            0 < self.longform_threshold < len(audio_data) / sample_rate
+            and "native_chunking" not in self.backend.capabilities
+        )
 
-            with torch.no_grad():
-                output = self.model.generate(
-                    **inputs,
-                    max_new_tokens=500,
-                    num_beams=1,
-                )
+    def warmup(
+        self, durations=WARMUP_DURATIONS, sample_rate: int = 16000
+    ) -> list[tuple[float, float, float]]:
+        """
+        Run the backend twice on synthetic clips of each length so kernel
+        selection, allocator growth and lazy processor setup happen before
+        the first real utterance.
 
-            decoded = self.processor.batch_decode(output, skip_special_tokens=True)[0]
-            return decoded
-        finally:
-            with contextlib.suppress(Exception):
-                os.unlink(audio_path)
+        Returns (duration, cold_seconds, warm_seconds) per clip.
+        """
+        rng = np.random.default_rng(0)
+        report = []
+        for duration in durations:
+            # Low-level noise rather than pure zeros, so no backend short-circuits
+            audio = (rng.standard_normal(int(duration * sample_rate)) * 1e-3).astype(np.float32)
+            timings = []
+            for _ in range(2):
+                start = time.perf_counter()
+                try:
+                    self.backend.warmup(audio, sample_rate)
+                except Exception as e:
+                    logger.warning(f"Warm-up on {duration:.0f}s clip failed: {e}")
+                    return report
+                timings.append(time.perf_counter() - start)
+            report.append((duration, timings[0], timings[1]))
+
+        for duration, cold, warm in report:
+            logger.info(f"Warm-up {duration:>4.0f}s clip: cold {cold * 1000:7.0f} ms, warm {warm * 1000:7.0f} ms")
+        return report
+
+    def transcribe_batch(
+        self, batch, sample_rate: int = 16000, language: str | None = None
+    ) -> list[str]:
+        """Transcribe several clips in one call; failures yield empty strings."""
+        try:
+            return self.backend.transcribe_batch(batch, sample_rate, language)
+        except Exception as e:
+            logger.error(f"Error during batched model.transcribe: {e}")
+            return [""] * len(batch)
+
+    def open_stream(self, sample_rate: int = 16000, language: str | None = None):
+        """Incremental decoder for one utterance, or None if the backend can't stream."""
+        try:
+            return self.backend.open_stream(sample_rate, language)
+        except Exception as e:
+            logger.warning(f"Could not open a {self.model_type} stream: {e}")
+            return None
+
+    def unload(self):
+        self.backend.unload()
@@ -0,0 +1,70 @@
+"""
+Named decoding profiles trading accuracy for latency.
+
+A profile holds backend-neutral decoding choices; each backend maps the ones
+it has knobs for (see Backend.profile) and ignores the rest. "balanced" is
+what every backend did before profiles existed.
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DecodingProfile:
+    beam_size: int  # whisper (CTranslate2) beam width; 1 = greedy
+    temperature_fallback: bool  # whisper: re-decode hotter when a window fails its checks
+    without_timestamps: bool  # whisper: don't predict timestamp tokens
+    condition_on_previous_text: bool  # whisper: prompt each 30 s window with the previous text
+    num_beams: int  # transformers generate() beams (granite, voxtral, cohere)
+    tokens_per_second: float  # generate() token cap per second of audio; 0 = the backend's fixed cap
+
+    def max_new_tokens(self, fixed_cap: int, duration_s: float) -> int:
+        """generate() token cap for `duration_s` of audio, never above the backend's own cap."""
+        if self.tokens_per_second <= 0:
+            return fixed_cap
+        return min(fixed_cap, 32 + math.ceil(self.tokens_per_second * duration_s))
+
+
+# Indexed by the decoding_profile setting
+DECODING_PROFILES = {
+    "fastest": DecodingProfile(
+        beam_size=1,
+        temperature_fallback=False,
+        without_timestamps=True,
+        condition_on_previous_text=False,
+        num_beams=1,
+        tokens_per_second=8.0,
+    ),
+    "balanced": DecodingProfile(
+        beam_size=5,
+        temperature_fallback=True,
+        without_timestamps=False,
+        condition_on_previous_text=False,
+        num_beams=1,
+        tokens_per_second=0.0,
+    ),
+    "accurate": DecodingProfile(
+        beam_size=5,
+        temperature_fallback=True,
+        without_timestamps=False,
+        condition_on_previous_text=True,
+        num_beams=4,
+        tokens_per_second=0.0,
+    ),
+}
+DEFAULT_PROFILE = "balanced"
+
+
+def get_profile(name: str | None) -> DecodingProfile:
+    """The named profile; unknown names fall back to DEFAULT_PROFILE."""
+    if not name:
+        return DECODING_PROFILES[DEFAULT_PROFILE]
+    profile = DECODING_PROFILES.get(name.lower())
+    if profile is None:
+        logger.warning(f"Unknown decoding profile '{name}', using '{DEFAULT_PROFILE}'")
+        return DECODING_PROFILES[DEFAULT_PROFILE]
+    return profile
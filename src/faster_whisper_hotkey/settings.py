@@ -1,7 +1,7 @@
 import json
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +24,52 @@ class Settings:
     llm_endpoint: str = ""
     llm_model_name: str = ""
     llm_api_key: str = ""
+    # Run the model on a few synthetic clips after loading (delays model_ready)
+    warmup: bool = False
+    # Unix socket of a running model daemon; empty = load the model in-process
+    daemon_socket: str = ""
+    # Cache built NeMo/transformers models for fast warm restarts
+    snapshot_cache: bool = False
+    # How CPU weights leave the safetensors mmap: "module", "clone" or "prefetch"
+    weight_materialization: str = "module"
+    # Seconds of audio held in RAM; longer recordings spill to a temp file
+    recording_ram_seconds: float = 600.0
+    # Directory for spilled recordings; empty = system temp dir
+    spill_dir: str = ""
+    # Keep the input stream open between recordings and start each one from
+    # the last preroll_ms of audio, so the first syllable isn't clipped
+    keep_stream_open: bool = False
+    preroll_ms: int = 300
+    # Capture rate (0 = the device's native rate, resampled to 16 kHz in-process),
+    # callback block length and PortAudio latency ("low", "high" or seconds)
+    capture_samplerate: int = 0
+    capture_block_ms: int = 250
+    capture_latency: str | float = "high"
+    # Own the input stream in a separate process writing into shared memory
+    # (implies keep_stream_open), so inference load can't cause dropouts
+    capture_process: bool = False
+    # Trim silence before inference: 0 = off, 1-3 = increasingly aggressive
+    vad_aggressiveness: int = 1
+    # Seconds between background decodes while the key is held (0 = off);
+    # text is committed at pauses so release only decodes the last piece
+    streaming_interval: float = 0.0
+    # Longest stretch without a pause before a streaming window is cut anyway
+    streaming_max_window: float = 20.0
+    # Paste streamed text while still recording, once two decodes agree on it
+    streaming_paste: bool = False
+    # Recordings longer than this many seconds are split at pauses and the
+    # chunks decoded separately (0 = off; not for natively chunking models)
+    longform_threshold: float = 60.0
+    longform_chunk: float = 30.0  # longest chunk, seconds
+    longform_batch_size: int = 8  # chunks per batch for batching backends
+    # Whisper recordings longer than this many seconds are decoded with
+    # faster-whisper's BatchedInferencePipeline (0 = off)
+    whisper_batch_threshold: float = 60.0
+    whisper_batch_size: int = 8  # 30 s windows per batch
+    # Decoding profile: "fastest", "balanced" or "accurate" (see profiles.py)
+    decoding_profile: str = "balanced"
+    # Extra hotkeys recording with another profile, e.g. {"f8": "accurate"}
+    profile_hotkeys: dict[str, str] = field(default_factory=dict)
 
 
 def save_settings(settings: dict, settings_file: str | None = None):
@@ -47,6 +93,31 @@ def load_settings(settings_file: str | None = None) -> Settings | None:
             data.setdefault("llm_endpoint", "")
             data.setdefault("llm_model_name", "")
             data.setdefault("llm_api_key", "")
+            data.setdefault("warmup", False)
+            data.setdefault("daemon_socket", "")
+            data.setdefault("snapshot_cache", False)
+            data.setdefault("weight_materialization", "module")
+            data.setdefault("recording_ram_seconds", 600.0)
+            data.setdefault("spill_dir", "")
+            data.setdefault("keep_stream_open", False)
+            data.setdefault("preroll_ms", 300)
+            data.setdefault("capture_samplerate", 0)
+            data.setdefault("capture_block_ms", 250)
+            data.setdefault("capture_latency", "high")
+            data.setdefault("capture_process", False)
+            data.setdefault("vad_aggressiveness", 1)
+            data.setdefault("streaming_interval", 0.0)
+            data.setdefault("streaming_max_window", 20.0)
+            data.setdefault("streaming_paste", False)
+            data.setdefault("longform_threshold", 60.0)
+            data.setdefault("longform_chunk", 30.0)
+            # Dropped: non-batching backends decode long-form chunks one at a time
+            data.pop("longform_workers", None)
+            data.setdefault("longform_batch_size", 8)
+            data.setdefault("whisper_batch_threshold", 60.0)
+            data.setdefault("whisper_batch_size", 8)
+            data.setdefault("decoding_profile", "balanced")
+            data.setdefault("profile_hotkeys", {})
             return Settings(**data)
     except FileNotFoundError:
         return None
@@ -0,0 +1,164 @@
+"""
+Local cache of ready-to-run model snapshots.
+
+NeMo checkpoints are .nemo tarballs that get extracted and then converted
+to the requested dtype on every launch; transformers checkpoints go through
+from_pretrained and weight materialization. After the first successful load
+we save the fully built module with torch.save, and later launches restore
+it with torch.load(mmap=True) - no extraction, no dtype conversion, and the
+weights are paged in straight from the cache file.
+
+Entries are keyed by everything that changes the built module: model type
+and name, device, compute_type and the versions of the libraries involved.
+A key change is a cache miss, and stale entries for the same model are
+removed when the new snapshot is written. A key whose snapshot couldn't be
+saved or restored keeps only its .json, marked "failed", so later launches
+load normally instead of rebuilding a snapshot that will fail again.
+
+Snapshots are pickles written by this user into their own cache directory;
+loading one executes code with the same trust as the model libraries do.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+from importlib import metadata
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "faster_whisper_hotkey",
+    "snapshots",
+)
+
+# Distributions whose version is part of the cache key
+_KEY_DISTRIBUTIONS = ("faster-whisper-hotkey", "torch", "transformers", "nemo-toolkit", "safetensors")
+
+
+def _dist_version(name: str) -> str | None:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def snapshot_key(settings) -> dict:
+    """Everything that determines the built module, as a JSON-serializable dict."""
+    return {
+        "model_type": settings.model_type.lower(),
+        "model_name": settings.model_name,
+        "device": settings.device,
+        "compute_type": getattr(settings, "compute_type", None),
+        "versions": {name: _dist_version(name) for name in _KEY_DISTRIBUTIONS},
+    }
+
+
+def _key_digest(key: dict) -> str:
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()[:32]
+
+
+class SnapshotCache:
+    """One cache entry: `<digest>.pt` (the module) plus `<digest>.json` (its key)."""
+
+    def __init__(self, settings, cache_dir: str | None = None):
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.key = snapshot_key(settings)
+        digest = _key_digest(self.key)
+        self.path = os.path.join(self.cache_dir, f"{digest}.pt")
+        self.meta_path = os.path.join(self.cache_dir, f"{digest}.json")
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path) and os.path.exists(self.meta_path)
+
+    def load(self, device: str):
+        """Restore the cached module, memory-mapping its tensors where possible."""
+        import torch
+
+        return torch.load(
+            self.path,
+            map_location=device,
+            mmap=device == "cpu",
+            weights_only=False,
+        )
+
+    def save(self, model):
+        """Write the snapshot atomically and drop stale entries for this model."""
+        import torch
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._remove_orphaned_tmp()
+        tmp_path = f"{self.path}.tmp-{os.getpid()}"
+        try:
+            torch.save(model, tmp_path)
+            os.replace(tmp_path, self.path)
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+        with open(self.meta_path, "w", encoding="utf-8") as f:
+            json.dump(self.key, f, indent=2)
+        self.prune_stale()
+
+    def _remove_orphaned_tmp(self):
+        """Drop partial writes left by processes that exited mid-save."""
+        prefix = os.path.basename(self.path) + ".tmp-"
+        for name in os.listdir(self.cache_dir):
+            if not name.startswith(prefix):
+                continue
+            try:
+                os.kill(int(name[len(prefix) :]), 0)
+                continue
+            except (ValueError, ProcessLookupError):
+                pass
+            except PermissionError:
+                continue
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(self.cache_dir, name))
+
+    def failed(self) -> str | None:
+        """Why snapshots don't work for this key, if an earlier launch recorded it."""
+        try:
+            with open(self.meta_path, encoding="utf-8") as f:
+                return json.load(f).get("failed")
+        except (OSError, json.JSONDecodeError, AttributeError):
+            return None
+
+    def mark_failed(self, reason: str):
+        """Drop the snapshot and record that this key can't be cached."""
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self.meta_path, "w", encoding="utf-8") as f:
+                json.dump({**self.key, "failed": reason}, f, indent=2)
+        except OSError as e:
+            logger.warning(f"Could not record snapshot failure: {e}")
+
+    def invalidate(self):
+        for path in (self.path, self.meta_path):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+
+    def prune_stale(self):
+        """Remove entries for the same model/device/precision built with other versions."""
+        identity = {k: v for k, v in self.key.items() if k not in ("versions", "failed")}
+        try:
+            names = os.listdir(self.cache_dir)
+        except FileNotFoundError:
+            return
+        for name in names:
+            meta_path = os.path.join(self.cache_dir, name)
+            if not name.endswith(".json") or meta_path == self.meta_path:
+                continue
+            try:
+                with open(meta_path, encoding="utf-8") as f:
+                    other = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            if {k: v for k, v in other.items() if k not in ("versions", "failed")} == identity:
+                logger.info(f"Removing stale model snapshot {name[:-5]}")
+                for path in (meta_path, meta_path[:-5] + ".pt"):
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(path)
@@ -0,0 +1,144 @@
+"""Phase-by-phase startup profiling (enabled with --profile-startup)."""
+
+import contextlib
+import json
+import logging
+import os
+import resource
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+logger = logging.getLogger(__name__)
+
+# Set by __main__ before any other package import, like FASTER_WHISPER_HOTKEY_DEBUG
+ENABLED = os.environ.get("FASTER_WHISPER_HOTKEY_PROFILE_STARTUP", "0") == "1"
+JSON_PATH = os.environ.get("FASTER_WHISPER_HOTKEY_PROFILE_JSON") or None
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+_T0 = time.perf_counter()
+
+
+@dataclass
+class Phase:
+    name: str
+    thread: str
+    depth: int
+    start_s: float
+    wall_s: float
+    cpu_s: float
+    rss_delta_mb: float
+
+
+_phases: list[Phase] = []
+_lock = threading.Lock()
+_local = threading.local()
+_finished = False
+
+
+def current_rss_bytes() -> int:
+    """Resident set size of this process, in bytes."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        # Peak RSS (KiB on Linux) is the best portable fallback
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size (VmHWM) since start or the last reset_peak_rss()."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def reset_peak_rss() -> bool:
+    """Reset the kernel's peak-RSS watermark (Linux >= 4.0); False if unsupported."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+@contextlib.contextmanager
+def phase(name: str):
+    """Record wall time, CPU time and RSS delta for the enclosed block.
+
+    CPU time is per-thread (the model loads on its own thread), RSS is
+    process-wide. Phases may nest; nested ones are indented in the report.
+    """
+    if not ENABLED:
+        yield
+        return
+
+    depth = getattr(_local, "depth", 0)
+    _local.depth = depth + 1
+    rss0 = current_rss_bytes()
+    cpu0 = time.thread_time()
+    wall0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        wall1 = time.perf_counter()
+        record = Phase(
+            name=name,
+            thread=threading.current_thread().name,
+            depth=depth,
+            start_s=wall0 - _T0,
+            wall_s=wall1 - wall0,
+            cpu_s=time.thread_time() - cpu0,
+            rss_delta_mb=(current_rss_bytes() - rss0) / (1024 * 1024),
+        )
+        _local.depth = depth
+        with _lock:
+            _phases.append(record)
+
+
+def phases() -> list[Phase]:
+    """Recorded phases, ordered by start time."""
+    with _lock:
+        return sorted(_phases, key=lambda p: p.start_s)
+
+
+def format_table(records: list[Phase]) -> str:
+    rows = [f"{'Phase':<44} {'Thread':<14} {'Start s':>8} {'Wall s':>8} {'CPU s':>8} {'RSS Δ MB':>9}"]
+    rows.append("-" * len(rows[0]))
+    for p in records:
+        label = ("  " * p.depth + p.name)[:44]
+        rows.append(
+            f"{label:<44} {p.thread[:14]:<14} {p.start_s:>8.3f} {p.wall_s:>8.3f} "
+            f"{p.cpu_s:>8.3f} {p.rss_delta_mb:>9.1f}"
+        )
+    return "\n".join(rows)
+
+
+def finish():
+    """Log the startup table once and write the JSON report if requested."""
+    global _finished
+    if not ENABLED or _finished:
+        return
+    _finished = True
+
+    records = phases()
+    logger.info("Startup profile:\n" + format_table(records))
+
+    if JSON_PATH:
+        report = {
+            "total_s": time.perf_counter() - _T0,
+            "rss_mb": current_rss_bytes() / (1024 * 1024),
+            "phases": [asdict(p) for p in records],
+        }
+        try:
+            with open(JSON_PATH, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            logger.info(f"Startup profile written to {JSON_PATH}")
+        except OSError as e:
+            logger.error(f"Failed to write startup profile: {e}")
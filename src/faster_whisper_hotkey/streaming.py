@@ -0,0 +1,304 @@
+"""
+Streaming transcription while the hotkey is held.
+
+A StreamingSession decodes the growing window [index, now) of a recording
+every `interval` seconds on a background thread. As soon as the window holds
+a pause - or grows past `max_window`, in which case it is cut at its quietest
+frame - the audio before the cut is decoded on its own, that text is
+committed and the window restarts at the cut. On release only the window
+after the last cut, the unconfirmed tail, is left to decode.
+
+Cutting at pauses rather than at backend timestamps keeps this
+backend-agnostic: any model that can transcribe a clip can stream.
+
+Backends with the "streaming" capability (cache-aware parakeet) use an
+EncoderStreamSession instead: captured audio is fed to the backend's stream
+as it arrives, the encoder keeps its state across chunks and nothing is
+decoded twice.
+
+With an `emit` callback, text is also handed out while recording (for
+incremental pasting). Words become final once two consecutive decodes of
+the open window agree on them (local agreement), or when the piece holding
+them is cut off and decoded; final words are emitted as soon as the
+callback accepts them, and the remainder at release excludes them. Decodes
+of overlapping audio needn't agree on word count (a filler word picked up,
+two words merged), so final words are found in a new decode by content,
+not by position.
+"""
+
+import logging
+import string
+import threading
+from collections.abc import Callable
+
+import numpy as np
+
+from .vad import find_pause, quietest_point
+
+logger = logging.getLogger(__name__)
+
+# Windows shorter than this aren't worth a decode
+MIN_WINDOW_S = 1.0
+# How far past its expected position a run of known words may start in a
+# new decode (words inserted before it)
+ALIGN_SLACK = 2
+
+
+def _common_prefix(a: list[str], b: list[str]) -> list[str]:
+    n = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        n += 1
+    return a[:n]
+
+
+def _normalized(words: list[str]) -> list[str]:
+    return [w.strip(string.punctuation).lower() for w in words]
+
+
+def _covered(known: list[str], hypothesis: list[str]) -> int:
+    """
+    How many leading words of `hypothesis` `known` already accounts for.
+
+    Both start at the same audio. The longest suffix of `known` that occurs
+    in `hypothesis` (case and punctuation aside, starting at most
+    ALIGN_SLACK words later than in `known`) ends there; with no such
+    suffix, e.g. when the last known words were re-decoded differently,
+    this falls back to their count.
+    """
+    known, hypothesis = _normalized(known), _normalized(hypothesis)
+    for k in range(min(len(known), len(hypothesis)), 0, -1):
+        suffix = known[-k:]
+        for start in range(min(len(known) - k + ALIGN_SLACK, len(hypothesis) - k) + 1):
+            if hypothesis[start : start + k] == suffix:
+                return start + k
+    return min(len(known), len(hypothesis))
+
+
+class _Session:
+    """Background stepping and agreement-based emission shared by both session types."""
+
+    def __init__(
+        self,
+        read: Callable[[int, int], np.ndarray],
+        write_index: Callable[[], int],
+        start_index: int,
+        interval: float,
+        emit: Callable[[str], bool] | None,
+    ):
+        self.read = read
+        self.write_index = write_index
+        self.interval = interval
+        self.emit = emit
+        self.index = start_index
+        self.end_index: int | None = None
+        # Final words in order, how many of them were emitted, and those
+        # that belong to the open window
+        self.words: list[str] = []
+        self.emitted = 0
+        self._window_final: list[str] = []
+        self._previous: list[str] | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="streaming-decoder", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.step()
+            except Exception as e:
+                logger.error(f"Streaming decode failed: {e}")
+
+    def step(self):
+        raise NotImplementedError
+
+    def _agree(self, hypothesis: list[str]):
+        """Finalize what this hypothesis of the open window shares with the previous one."""
+        if self.emit is not None and self._previous is not None:
+            self._finalize(_common_prefix(self._previous, hypothesis))
+        self._previous = hypothesis
+
+    def _finalize(self, window_words: list[str]):
+        """Mark the open window's leading `window_words` final."""
+        new = window_words[_covered(self._window_final, window_words) :]
+        self.words.extend(new)
+        self._window_final.extend(new)
+
+    def _flush(self):
+        if self.emit is None or self.emitted == len(self.words):
+            return
+        text = " ".join(self.words[self.emitted :])
+        if self.emit(" " + text if self.emitted else text):
+            logger.debug(f'Emitted: "{text}"')
+            self.emitted = len(self.words)
+
+    def stop(self, end_index: int):
+        """Mark the end of the recording; the decoder thread exits after its current step."""
+        self.end_index = end_index
+        self._stop.set()
+
+    def _join(self) -> int:
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        return self.end_index if self.end_index is not None else self.write_index()
+
+    def remainder(self, tail_text: str) -> str:
+        """Everything not yet emitted, given the decoded tail."""
+        tail = tail_text.split()
+        words = self.words[self.emitted :] + tail[_covered(self._window_final, tail) :]
+        text = " ".join(words)
+        return " " + text if text and self.emitted else text
+
+    def finish_text(self, decode: Callable[[np.ndarray], str | None]) -> str:
+        """Wait for the decoder thread, decode what's left and return the text not yet emitted."""
+        raise NotImplementedError
+
+
+class StreamingSession(_Session):
+    """
+    Piecewise decoding of one recording.
+
+    `read(start, end)` returns mono 16 kHz samples of the recording (a copy
+    the decoder may modify), `write_index()` the current end of capture and
+    `decode(audio)` the text for a clip - or None when it can't decode yet
+    (model still loading), in which case the step is retried next interval.
+    `emit(text)` receives final text while recording; returning False defers
+    it to a later step (or to release).
+    """
+
+    def __init__(
+        self,
+        read: Callable[[int, int], np.ndarray],
+        write_index: Callable[[], int],
+        decode: Callable[[np.ndarray], str | None],
+        start_index: int,
+        sample_rate: int = 16000,
+        interval: float = 2.0,
+        max_window: float = 20.0,
+        aggressiveness: int = 1,
+        emit: Callable[[str], bool] | None = None,
+    ):
+        # `index` is the start of the unconfirmed window, as a ring index
+        super().__init__(read, write_index, start_index, interval, emit)
+        self.decode = decode
+        self.sample_rate = sample_rate
+        self.max_window = max_window
+        self.aggressiveness = max(int(aggressiveness), 1)
+        self.committed: list[str] = []
+        # Latest hypothesis for the unconfirmed window
+        self.partial = ""
+
+    def step(self, end: int | None = None):
+        """Decode the current window once, committing up to a cut if there is one."""
+        end = self.write_index() if end is None else end
+        window = self.read(self.index, end)
+        if window.size < MIN_WINDOW_S * self.sample_rate:
+            return
+        cut = find_pause(window, self.sample_rate, self.aggressiveness)
+        if cut is None and window.size >= self.max_window * self.sample_rate:
+            cut = quietest_point(window, self.sample_rate)
+        if cut is None:
+            partial = self.decode(window)
+            if partial is None:
+                return
+            self.partial = partial.strip()
+            logger.debug(f'Partial: "{self.partial}"')
+            self._agree(self.partial.split())
+            self._flush()
+            return
+
+        text = self.decode(window[:cut])
+        if text is None:
+            return
+        piece = text.split()
+        if piece:
+            self.committed.append(" ".join(piece))
+            logger.debug(f'Committed: "{self.committed[-1]}"')
+        # The piece is closed: all of it is final, and what's left of the
+        # window's final words and last hypothesis is whatever it doesn't cover
+        self._finalize(piece)
+        self._window_final = self._window_final[_covered(piece, self._window_final) :]
+        if self._previous is not None:
+            self._previous = self._previous[_covered(piece, self._previous) :]
+        self.index = end - (window.size - cut)
+        self.partial = ""
+        self._flush()
+
+    def finish(self) -> tuple[list[str], np.ndarray]:
+        """Wait for the decoder thread and return the committed text and the tail audio."""
+        end = self._join()
+        return self.committed, self.read(self.index, max(self.index, end))
+
+    def finish_text(self, decode: Callable[[np.ndarray], str | None]) -> str:
+        committed, tail = self.finish()
+        tail_text = decode(tail) if tail.size else ""
+        logger.debug(
+            f"Streamed recording: {len(committed)} committed piece(s), {self.emitted} word(s) emitted early, "
+            f"{tail.size / self.sample_rate:.2f}s tail"
+        )
+        return self.remainder(tail_text or "")
+
+
+class EncoderStreamSession(_Session):
+    """
+    Feeds one recording to a backend stream (see Backend.open_stream) as it is captured.
+
+    Every `interval` seconds the audio captured since the last step goes to
+    `stream.feed`; its running hypothesis drives local agreement like a
+    StreamingSession's partials. Calls into the stream hold `lock`, which the
+    caller shares with its other uses of the model.
+    """
+
+    def __init__(
+        self,
+        read: Callable[[int, int], np.ndarray],
+        write_index: Callable[[], int],
+        stream,
+        start_index: int,
+        interval: float = 1.0,
+        lock=None,
+        emit: Callable[[str], bool] | None = None,
+    ):
+        # `index` is the first sample not yet fed
+        super().__init__(read, write_index, start_index, interval, emit)
+        self.stream = stream
+        self.start_index = start_index
+        self.lock = lock or threading.Lock()
+        self.failed = False
+
+    def step(self, end: int | None = None):
+        if self.failed:
+            return
+        end = self.write_index() if end is None else end
+        if end <= self.index:
+            return
+        audio = self.read(self.index, end)
+        try:
+            with self.lock:
+                text = self.stream.feed(audio)
+        except Exception as e:
+            logger.warning(f"Streaming backend failed, decoding on release instead: {e}")
+            self.failed = True
+            return
+        self.index = end
+        self._agree(text.split())
+        self._flush()
+
+    def finish_text(self, decode: Callable[[np.ndarray], str | None]) -> str:
+        end = self._join()
+        text = None
+        if not self.failed:
+            try:
+                with self.lock:
+                    text = self.stream.finish(self.read(self.index, max(self.index, end)))
+            except Exception as e:
+                logger.warning(f"Streaming backend failed at release, decoding the whole recording: {e}")
+        if text is None:
+            # Same words as a stream hypothesis would give, for the agreement bookkeeping
+            text = decode(self.read(self.start_index, end)) or ""
+        return self.remainder(text)
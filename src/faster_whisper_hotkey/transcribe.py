@@ -1,8 +1,9 @@
 # src/faster_whisper_hotkey/transcribe.py
-import curses
 import logging
 import warnings
 
+from . import startup_profile
+
 warnings.filterwarnings(
     "ignore",
     message="invalid escape sequence '\\s'",
@@ -17,6 +18,33 @@ warnings.filterwarnings(
 )
 
 
+# Our log handler's own copy of stderr (see _log_stream)
+_log_file = None
+
+
+def _log_stream():
+    """
+    A text stream on a dup() of fd 2.
+
+    suppress_output()/suppress_nemo() point fds 1 and 2 at /dev/null for the
+    whole process while the loader thread imports and loads the model; the
+    handler writing to its own descriptor keeps lines logged from the
+    listener and main threads meanwhile ("Recording...", "Model is still
+    loading") visible.
+    """
+    import os
+    import sys
+
+    global _log_file
+    try:
+        fd = os.dup(sys.stderr.fileno())
+    except (AttributeError, OSError, ValueError):
+        return sys.stderr
+    if _log_file is not None:
+        _log_file.close()
+    _log_file = os.fdopen(fd, "w", buffering=1, encoding="utf-8", errors="backslashreplace")
+    return _log_file
+
 
 def _setup_logging():
     """Configure logging based on DEBUG environment variable."""
@@ -25,9 +53,10 @@ def _setup_logging():
     is_debug = os.environ.get("FASTER_WHISPER_HOTKEY_DEBUG", "0") == "1"
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
+    stream = _log_stream()
 
     if is_debug:
-        handler = logging.StreamHandler()
+        handler = logging.StreamHandler(stream)
         handler.setFormatter(logging.Formatter("%(levelname)s:%(name)s:%(message)s"))
         root_logger.addHandler(handler)
         root_logger.setLevel(logging.DEBUG)
@@ -37,7 +66,7 @@ def _setup_logging():
             def format(self, record):
                 return f"{record.levelname}:{record.getMessage()}"
 
-        handler = logging.StreamHandler()
+        handler = logging.StreamHandler(stream)
         handler.setFormatter(SimpleFormatter())
         root_logger.addHandler(handler)
         root_logger.setLevel(logging.WARNING)
@@ -46,20 +75,56 @@ def _setup_logging():
         logging.getLogger("faster_whisper_hotkey").setLevel(logging.INFO)
 
 
-_setup_logging()
+with startup_profile.phase("_setup_logging"):
+    _setup_logging()
 logger = logging.getLogger(__name__)
 
 
-def main(headless: bool = False, settings_file: str | None = None):
-    """Main entry point - runs config screen or starts headless with saved settings."""
+def __getattr__(name):
+    # curses is only needed by the interactive config UI, so headless runs
+    # never import it; keep `transcribe.curses` resolvable for callers.
+    if name == "curses":
+        import curses
+
+        return curses
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def run_daemon(settings_file: str | None = None, socket_path: str | None = None, socket_mode: int = 0o600):
+    """Serve the configured model over a Unix socket for --client front ends."""
+    from .daemon import serve
+    from .settings import load_settings
+
+    settings = load_settings(settings_file)
+    if settings is None:
+        logger.error(
+            "No saved settings found. Run without --daemon to configure first, "
+            "or use --config to specify a settings file."
+        )
+        return
+    serve(settings, socket_path, socket_mode)
+
+
+def main(
+    headless: bool = False,
+    settings_file: str | None = None,
+    daemon_socket: str | None = None,
+):
+    """Main entry point - runs config screen or starts headless with saved settings.
+
+    `daemon_socket` (from --client) makes the transcriber use a running model
+    daemon; an empty string selects the default socket path.
+    """
     from .settings import Settings, load_settings
-    from .transcriber import MicrophoneTranscriber
-    from .ui import config_screen_main
+
+    with startup_profile.phase("import transcriber"):
+        from .transcriber import MicrophoneTranscriber
 
     settings: Settings | None = None
 
     if headless:
-        settings = load_settings(settings_file)
+        with startup_profile.phase("load_settings"):
+            settings = load_settings(settings_file)
         if settings is None:
             logger.error(
                 "No saved settings found. Run without --headless to configure first, "
@@ -68,6 +133,11 @@ def main(headless: bool = False, settings_file: str | None = None):
             return
         logger.info(f"Headless mode: loaded settings from {settings_file or 'default path'}")
     else:
+        # Interactive-only imports: curses, and ui.py (which pulls in pulsectl)
+        import curses
+
+        from .ui import config_screen_main
+
         while True:
             try:
                 result = curses.wrapper(
@@ -88,6 +158,10 @@ def main(headless: bool = False, settings_file: str | None = None):
 
     # Launch the transcriber with configured settings
     assert settings is not None
+    if daemon_socket is not None:
+        from .daemon import default_socket_path
+
+        settings.daemon_socket = daemon_socket or settings.daemon_socket or default_socket_path()
     transcriber = MicrophoneTranscriber(settings)
     try:
         transcriber.run()
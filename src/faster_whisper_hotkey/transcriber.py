@@ -5,32 +5,116 @@ import threading
 import time
 
 import numpy as np
-import pulsectl
 import sounddevice as sd
 from pynput import keyboard
 
+from . import startup_profile
+from .audio import BufferPool, CaptureStats, PolyphaseResampler, RingBuffer, SpillFile, normalize_peak, to_mono
+from .capture import CaptureProcess, SharedRingBuffer
 from .clipboard import backup_clipboard, restore_clipboard, set_clipboard
+from .daemon import RemoteModel
 from .llm_corrector import LLMCorrector
 from .models import ModelWrapper
 from .paste import paste_to_active_window
+from .profiles import DECODING_PROFILES
 from .settings import Settings
+from .streaming import EncoderStreamSession, StreamingSession
+from .vad import MIN_SPEECH_S, trim_silence
 
 logger = logging.getLogger(__name__)
 
-# Minimum recording duration to prevent short noise transcriptions
+# Minimum recording duration to prevent short noise transcriptions (VAD off)
 MIN_RECORDING_DURATION = 1.0  # seconds
+# Capture-process deaths before capture moves back in-process for the session
+CAPTURE_PROCESS_MAX_DEATHS = 3
 
 
 class MicrophoneTranscriber:
     def __init__(self, settings: Settings):
+        self._startup_time = time.perf_counter()
         self.settings = settings
         self.sample_rate = 16000
-        self.max_buffer_length = 10 * 60 * self.sample_rate
-        self.audio_buffer = np.zeros(self.max_buffer_length, dtype=np.float32)
-        self.buffer_index = 0
-
-        # Load the requested model wrapper
-        self.model_wrapper = ModelWrapper(self.settings)
+        self.max_buffer_length = int(
+            getattr(settings, "recording_ram_seconds", 600.0) * self.sample_rate
+        )
+        # The audio callback only copies into this ring; everything else
+        # reads [recording_start_index, ring.write_index) off the audio thread.
+        self.ring = RingBuffer(self.max_buffer_length, channels=1)
+        self.recording_start_index = 0
+        self.recording_end_index: int | None = None
+        self.stream = None
+        # Optionally the stream stays open and each recording starts from a
+        # pre-roll of audio captured just before the key press.
+        self.keep_stream_open = getattr(settings, "keep_stream_open", False)
+        self.preroll_frames = int(getattr(settings, "preroll_ms", 300) * self.sample_rate / 1000)
+        # Press-to-first-sample latency of the last recording, in seconds
+        # (negative when the recording starts with pre-roll)
+        self.last_press_latency: float | None = None
+        self._press_time = 0.0
+        # Capture time (perf_counter) of the first sample of the stream's
+        # first block and of the end of the latest block, from the callback's
+        # ADC timestamps; None until a block arrives in this process
+        self._first_block_adc: float | None = None
+        self._block_adc_end: float | None = None
+        self._input_latency = 0.0
+        # Capture runs at the device's native rate unless configured. When
+        # that isn't 16 kHz - or when a separate capture process owns the
+        # stream - frames land in capture_ring first and a pump thread keeps
+        # `ring` filled at 16 kHz as blocks arrive.
+        self.capture_rate = self.sample_rate
+        self.blocksize = 4000
+        self.capture_process = getattr(settings, "capture_process", False)
+        if self.capture_process:
+            # The child process keeps its stream open for the whole session
+            self.keep_stream_open = True
+        # The running child, if any; a child that dies is restarted at the
+        # next key press, and after CAPTURE_PROCESS_MAX_DEATHS capture moves
+        # back in-process
+        self._capture_child: CaptureProcess | None = None
+        self._capture_deaths = 0
+        self.capture_ring: RingBuffer | None = None
+        self.resampler: PolyphaseResampler | None = None
+        self._capture_target = self.ring
+        self._pumped_index = 0
+        self._pump_lock = threading.Lock()
+        self._pump_stop = threading.Event()
+        self._pump_thread: threading.Thread | None = None
+        # Audio-path health: overflow/underflow counts, callback time and
+        # jitter histograms. Swapped for the capture process's shared counters
+        # while it owns the stream; dumped on SIGUSR1.
+        self._local_capture_stats = CaptureStats()
+        self.capture_stats = self._local_capture_stats
+        self._block_ns = 0
+        self._stats_at_start = self.capture_stats.snapshot()
+        self.last_recording_stats: dict | None = None
+        # Silence is trimmed on the transcription thread, right before inference
+        self.vad_aggressiveness = int(getattr(settings, "vad_aggressiveness", 1))
+        # Utterances are copied out of the ring into recycled buffers, which
+        # go back to the pool once transcribe_and_send is done with them.
+        self.buffer_pool = BufferPool(granularity=30 * self.sample_rate)
+        # Recordings longer than half the ring are drained to an mmap'd spill
+        # file by a helper thread, so their length is bounded only by disk.
+        self.spill_after = self.max_buffer_length // 2
+        self._spill: SpillFile | None = None
+        self._spilled_index = 0
+        self._spill_thread: threading.Thread | None = None
+        # With streaming on, a StreamingSession decodes the recording in
+        # pause-delimited pieces while the key is held, so release only has
+        # the unconfirmed tail left to decode. Its window is bounded by
+        # streaming_max_window, so recordings never need the spill file.
+        self.streaming_interval = float(getattr(settings, "streaming_interval", 0.0))
+        self.streaming_max_window = float(getattr(settings, "streaming_max_window", 20.0))
+        # Paste words as soon as they are final instead of all at release
+        self.streaming_paste = self.streaming_interval > 0 and getattr(settings, "streaming_paste", False)
+        self._stream_session: StreamingSession | EncoderStreamSession | None = None
+        # Streaming decodes can overlap the previous utterance's transcription
+        self._model_lock = threading.Lock()
+
+        # The model loads on a background thread so the hotkey is live
+        # immediately; recordings made meanwhile wait in transcription_queue.
+        self.model_wrapper: ModelWrapper | RemoteModel | None = None
+        self.model_ready = threading.Event()
+        self.model_load_error: Exception | None = None
 
         # Initialize LLM corrector if enabled
         self.llm_corrector = None
@@ -48,11 +132,65 @@ class MicrophoneTranscriber:
         self.keyboard_controller = keyboard.Controller()
         self.language = self.settings.language
         self.hotkey_key = self._parse_hotkey(self.settings.hotkey)
+        # Hotkey -> decoding profile its recordings use (None = decoding_profile)
+        self.hotkey_profiles = {
+            **self._parse_profile_hotkeys(getattr(settings, "profile_hotkeys", None) or {}),
+            self.hotkey_key: None,
+        }
+        self._recording_profile: str | None = None
+        # Profiles of queued recordings made with another profile's hotkey, by id()
+        self._queued_profiles: dict[int, str] = {}
         self.is_transcribing = False
         self.last_transcription_end_time = 0.0
-        self.transcription_queue: list[np.ndarray] = []
+        self.transcription_queue: list[np.ndarray | StreamingSession | EncoderStreamSession] = []
         self.timer = None
         self.recording_start_time = 0.0
+        self._queue_lock = threading.Lock()
+        # Startup phases close on the loader thread and in run(); the
+        # startup profile is reported once both are done
+        self._startup_parts_pending = 2
+        self._startup_lock = threading.Lock()
+
+        self._model_thread = threading.Thread(
+            target=self._load_model, name="model-loader", daemon=True
+        )
+        self._model_thread.start()
+
+    # ------------------------------------------------------------------
+    # Background model loading
+    # ------------------------------------------------------------------
+    def _startup_part_done(self):
+        with self._startup_lock:
+            self._startup_parts_pending -= 1
+            done = self._startup_parts_pending == 0
+        if done:
+            startup_profile.finish()
+
+    def _load_model(self):
+        daemon_socket = getattr(self.settings, "daemon_socket", "")
+        try:
+            if daemon_socket:
+                with startup_profile.phase("connect to model daemon"):
+                    self.model_wrapper = RemoteModel(daemon_socket)
+                logger.info(f"Using model daemon at {daemon_socket}")
+            else:
+                with startup_profile.phase("ModelWrapper"):
+                    self.model_wrapper = ModelWrapper(self.settings)
+        except Exception as e:
+            self.model_load_error = e
+            logger.error(f"Failed to load model: {e}")
+            self.exit_flag = True
+            self._startup_part_done()
+            return
+        if getattr(self.settings, "warmup", False):
+            with startup_profile.phase("warm-up"):
+                self.model_wrapper.warmup()
+        logger.info(f"Model ready after {time.perf_counter() - self._startup_time:.2f}s")
+        self.model_ready.set()
+        self._startup_part_done()
+        # Flush anything recorded while the model was loading
+        self.process_next_transcription()
+        self.model_wrapper.save_snapshot()
 
     # ------------------------------------------------------------------
     # Hotkey mapping
@@ -66,11 +204,26 @@ class MicrophoneTranscriber:
         }
         return key_mapping.get(hotkey_str, keyboard.Key.pause)
 
+    def _parse_profile_hotkeys(self, profile_hotkeys: dict[str, str]) -> dict:
+        """Map the profile_hotkeys setting ({"f8": "accurate"}) to pynput keys, skipping bad entries."""
+        parsed = {}
+        for name, profile in profile_hotkeys.items():
+            key = getattr(keyboard.Key, name.lower(), None)
+            if key is None or profile.lower() not in DECODING_PROFILES:
+                logger.warning(f"Ignoring profile hotkey {name!r} -> {profile!r}")
+                continue
+            parsed[key] = profile.lower()
+        return parsed
+
     # ------------------------------------------------------------------
     # Set default audio source
     # ------------------------------------------------------------------
     def set_default_audio_source(self):
         try:
+            # Imported here: run() calls this once the hotkey listener is up,
+            # keeping pulsectl off the startup path
+            import pulsectl
+
             with pulsectl.Pulse("set-default-source") as pulse:
                 for source in pulse.source_list():
                     if source.name == self.device_name:
@@ -87,31 +240,199 @@ class MicrophoneTranscriber:
     @staticmethod
     def _normalize_audio(audio_data: np.ndarray) -> np.ndarray:
         """Normalize audio data to [-1, 1] range."""
-        max_val = np.abs(audio_data).max()
-        return audio_data / max_val if not np.isclose(max_val, 0) else audio_data
+        return normalize_peak(audio_data)
 
     @staticmethod
     def _to_mono(audio_data: np.ndarray) -> np.ndarray:
-        """Convert stereo audio to mono by averaging channels."""
-        if audio_data.ndim > 1 and audio_data.shape[1] == 2:
-            return np.mean(audio_data, axis=1).astype(np.float32)
-        return audio_data.flatten().astype(np.float32)
+        """Convert multi-channel audio to mono by averaging channels."""
+        return to_mono(audio_data)
+
+    def _drain_to_spill(self, end: int):
+        """Move [_spilled_index, end) from the ring to the spill file (as mono)."""
+        start = max(self._spilled_index, self.ring.oldest_index(end))
+        if start > self._spilled_index:
+            dropped = (start - self._spilled_index) / self.sample_rate
+            logger.warning(f"Spilling fell behind capture - {dropped:.1f}s dropped")
+        if self._spill is not None and end > start:
+            self._spill.append(self._to_mono(self.ring.read(start, end)))
+        self._spilled_index = end
+
+    def _spill_worker(self):
+        """While recording, spill to disk once the utterance outgrows RAM."""
+        while not self.stop_event.wait(0.5):
+            end = self.recording_end_index or self.ring.write_index
+            if self._spill is None:
+                if end - self.recording_start_index < self.spill_after:
+                    continue
+                try:
+                    self._spill = SpillFile(getattr(self.settings, "spill_dir", ""))
+                except OSError as e:
+                    logger.error(f"Cannot create spill file, long recording will be truncated: {e}")
+                    return
+                logger.info("Long recording - spilling audio to disk")
+            self._drain_to_spill(end)
+
+    def _collect_recording(self, end: int) -> np.ndarray:
+        """Copy the utterance [recording_start_index, end) out of the ring, downmix and normalize it once."""
+        if self._spill is not None:
+            self._drain_to_spill(end)
+            audio_data, self._spill = self._spill.map(), None
+            if self._spilled_index > end:
+                # The spill thread raced past the release point
+                audio_data = audio_data[: audio_data.size - (self._spilled_index - end)]
+            return self._normalize_audio(audio_data)
+
+        start = max(self.recording_start_index, self.ring.oldest_index(end))
+        if start > self.recording_start_index:
+            dropped = (start - self.recording_start_index) / self.sample_rate
+            logger.warning(f"Recording exceeded the capture buffer - first {dropped:.1f}s dropped")
+        n, channels = end - start, self.ring.channels
+        buffer = self.buffer_pool.acquire(n * channels)
+        audio_data = self._to_mono(self.ring.read(start, end, out=buffer.reshape(n, channels)))
+        if not np.shares_memory(audio_data, buffer):
+            # Multi-channel input was downmixed into a new array
+            self.buffer_pool.release(buffer)
+        return self._normalize_audio(audio_data)
+
+    def _trim_silence(self, audio_data: np.ndarray, level: int = logging.INFO) -> np.ndarray | None:
+        """VAD-trim the utterance in place; None if it contains no speech."""
+        if self.vad_aggressiveness <= 0:
+            return audio_data
+        total_s = audio_data.size / self.sample_rate
+        trimmed, speech_s = trim_silence(audio_data, self.sample_rate, self.vad_aggressiveness)
+        if speech_s < MIN_SPEECH_S:
+            return None
+        removed_s = total_s - trimmed.size / self.sample_rate
+        logger.log(level, f"VAD removed {removed_s:.2f}s of {total_s:.2f}s ({speech_s:.2f}s of speech)")
+        return trimmed
 
     # ------------------------------------------------------------------
     # Audio callback
     # ------------------------------------------------------------------
     def audio_callback(self, indata, frames, time_, status):
+        # Runs on the PortAudio thread: copy into preallocated memory and
+        # return. No allocation, no logging; status is counted and reported on stop.
+        start = time.perf_counter_ns()
         if status:
-            logger.warning(f"Status: {status}")
-        audio_data = self._to_mono(indata)
-        audio_data = self._normalize_audio(audio_data)
+            self.capture_stats.record_status(status)
+        self._capture_target.write(indata)
+        block_s = frames / self.capture_rate
+        try:
+            # How long ago the block's first sample hit the ADC
+            delay = time_.currentTime - time_.inputBufferAdcTime
+        except AttributeError:
+            delay = 0.0
+        if not 0.0 < delay < 1.0 + block_s:
+            # Host API without timestamps: the block is as old as itself plus the input latency
+            delay = block_s + self._input_latency
+        adc_start = start / 1e9 - delay
+        if self._first_block_adc is None:
+            self._first_block_adc = adc_start
+        self._block_adc_end = adc_start + block_s
+        self.capture_stats.record_callback(start, time.perf_counter_ns(), self._block_ns)
 
-        new_index = self.buffer_index + len(audio_data)
-        if new_index > self.max_buffer_length:
-            audio_data = audio_data[: self.max_buffer_length - self.buffer_index]
-            new_index = self.max_buffer_length
-        self.audio_buffer[self.buffer_index : new_index] = audio_data
-        self.buffer_index = new_index
+    # ------------------------------------------------------------------
+    # Audio-path telemetry
+    # ------------------------------------------------------------------
+    def _report_recording_stats(self):
+        summary = self.capture_stats.summary(since=self._stats_at_start)
+        self.last_recording_stats = summary
+        if summary["overflows"] or summary["underflows"]:
+            logger.warning(
+                f"Input overflow in {summary['overflows']} and underflow in {summary['underflows']} "
+                "callback(s) during this recording - audio may be missing"
+            )
+        logger.debug(
+            f"Capture: {summary['callbacks']} callbacks, max callback {summary['max_callback_us']} µs, "
+            f"max jitter {summary['max_jitter_us']} µs"
+        )
+
+    def dump_audio_stats(self, level: int = logging.INFO):
+        """Log the session's audio-path counters and histograms (also on SIGUSR1)."""
+        message = "Audio path stats (session):\n" + CaptureStats.format(self.capture_stats.summary())
+        if self.last_recording_stats is not None:
+            message += "\nLast recording:\n" + CaptureStats.format(self.last_recording_stats)
+        logger.log(level, message)
+
+    # ------------------------------------------------------------------
+    # Native-rate capture and resampling
+    # ------------------------------------------------------------------
+    def _native_samplerate(self) -> int:
+        configured = int(getattr(self.settings, "capture_samplerate", 0) or 0)
+        if configured:
+            return configured
+        try:
+            rate = int(sd.query_devices("default", "input")["default_samplerate"])
+        except Exception as e:
+            logger.debug(f"Could not query the input device's native rate: {e}")
+            return self.sample_rate
+        return rate if rate >= 8000 else self.sample_rate
+
+    def _stream_latency(self):
+        latency = getattr(self.settings, "capture_latency", "high")
+        try:
+            return float(latency)
+        except (TypeError, ValueError):
+            return latency
+
+    def _configure_capture(self):
+        """Pick the capture rate, block size and (if needed) resampler."""
+        self.capture_rate = self._native_samplerate()
+        block_ms = getattr(self.settings, "capture_block_ms", 250)
+        self.blocksize = max(1, int(self.capture_rate * block_ms / 1000))
+        if self.capture_rate == self.sample_rate:
+            self.resampler = None
+        elif self.resampler is None or self.resampler.in_rate != self.capture_rate:
+            self.resampler = PolyphaseResampler(self.capture_rate, self.sample_rate)
+            logger.info(f"Capturing at {self.capture_rate} Hz, resampling to {self.sample_rate} Hz")
+        else:
+            self.resampler.reset()
+
+    def _use_capture_ring(self, capture_ring: RingBuffer | None):
+        """Route captured frames via `capture_ring`, or straight into `ring` if None."""
+        self.capture_ring = capture_ring
+        self._capture_target = capture_ring if capture_ring is not None else self.ring
+        self._pumped_index = capture_ring.write_index if capture_ring is not None else 0
+
+    def _pump_capture(self):
+        """Move everything captured since the last call into `ring`, resampling if needed."""
+        capture_ring = self.capture_ring
+        if capture_ring is None:
+            return
+        with self._pump_lock:
+            end = capture_ring.write_index
+            start = max(self._pumped_index, capture_ring.oldest_index(end))
+            if end > start:
+                block = self._to_mono(capture_ring.read(start, end))
+                self.ring.write(self.resampler.process(block) if self.resampler is not None else block)
+            self._pumped_index = end
+
+    def _pump_worker(self):
+        while not self._pump_stop.wait(0.02):
+            self._pump_capture()
+            child = self._capture_child
+            if child is not None and not child.is_alive():
+                # Nothing will move the write index again; don't poll it forever
+                logger.warning(
+                    f"Capture process exited unexpectedly (exit code {child.exitcode}) - "
+                    "no audio until it is restarted at the next key press"
+                )
+                return
+
+    def _restart_dead_capture_process(self):
+        """Replace a capture child that died since the last recording."""
+        child = self._capture_child
+        if child is None or child.is_alive():
+            return
+        self._capture_deaths += 1
+        self._close_stream()
+        if self._capture_deaths >= CAPTURE_PROCESS_MAX_DEATHS:
+            logger.warning(
+                f"Capture process died {self._capture_deaths} times, capturing in-process from now on"
+            )
+            self.capture_process = False
+        else:
+            logger.warning(f"Restarting the capture process (exit code {child.exitcode})")
 
     # ------------------------------------------------------------------
     # Clipboard handling
@@ -136,18 +457,99 @@ class MicrophoneTranscriber:
             self.keyboard_controller.release(char)
             time.sleep(0.001)
 
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+    def _read_recording(self, start: int, end: int) -> np.ndarray:
+        return self._to_mono(self.ring.read(start, end))
+
+    def _decode_piece(self, audio_data: np.ndarray, profile: str | None = None) -> str | None:
+        """Transcribe one streaming piece; None while the model is loading."""
+        if not self.model_ready.is_set() or self.model_wrapper is None:
+            return None
+        speech = self._trim_silence(self._normalize_audio(audio_data), level=logging.DEBUG)
+        if speech is None:
+            return ""
+        return self._transcribe(speech, profile)
+
+    def _open_backend_stream(self):
+        """A cache-aware stream from the backend, if it has one."""
+        if not self.model_ready.is_set() or self.model_wrapper is None:
+            return None
+        if "streaming" not in getattr(self.model_wrapper, "capabilities", frozenset()):
+            return None
+        return self.model_wrapper.open_stream(self.sample_rate, self.settings.language)
+
+    def _start_streaming(self):
+        emit = self._paste_final_words if self.streaming_paste else None
+        profile = self._recording_profile
+        stream = self._open_backend_stream()
+        if stream is not None:
+            self._stream_session = EncoderStreamSession(
+                read=self._read_recording,
+                write_index=lambda: self.ring.write_index,
+                stream=stream,
+                start_index=self.recording_start_index,
+                interval=self.streaming_interval,
+                lock=self._model_lock,
+                emit=emit,
+            )
+        else:
+            self._stream_session = StreamingSession(
+                read=self._read_recording,
+                write_index=lambda: self.ring.write_index,
+                decode=lambda audio_data: self._decode_piece(audio_data, profile),
+                start_index=self.recording_start_index,
+                sample_rate=self.sample_rate,
+                interval=self.streaming_interval,
+                max_window=self.streaming_max_window,
+                aggressiveness=self.vad_aggressiveness,
+                emit=emit,
+            )
+        self._stream_session.start()
+
+    def _paste_final_words(self, text: str) -> bool:
+        """Paste words the streaming session settled on; False defers them."""
+        if self.is_transcribing or self.transcription_queue:
+            # An earlier utterance hasn't been pasted yet
+            return False
+        if not self._send_via_clipboard(text):
+            self._type_text(text)
+        return True
+
+    def _finish_streaming(
+        self, session: StreamingSession | EncoderStreamSession, profile: str | None = None
+    ) -> str:
+        """Text of a streamed recording that hasn't been pasted yet."""
+        return session.finish_text(lambda audio_data: self._decode_piece(audio_data, profile))
+
     # ------------------------------------------------------------------
     # Transcription and sending
     # ------------------------------------------------------------------
-    def transcribe_and_send(self, audio_data):
-        try:
-            self.is_transcribing = True
-            transcribed_text = self.model_wrapper.transcribe(
-                audio_data,
+    def _transcribe(self, speech: np.ndarray, profile: str | None = None) -> str:
+        with self._model_lock:
+            return self.model_wrapper.transcribe(
+                speech,
                 sample_rate=self.sample_rate,
                 language=self.settings.language,
+                profile=profile,
             )
 
+    def transcribe_and_send(self, audio_data, profile: str | None = None):
+        assert self.model_wrapper is not None
+        try:
+            self.is_transcribing = True
+            # Text pasted while recording can't be corrected afterwards
+            correct = self.llm_corrector is not None and not self.streaming_paste
+            if isinstance(audio_data, (StreamingSession, EncoderStreamSession)):
+                transcribed_text = self._finish_streaming(audio_data, profile)
+            else:
+                speech = self._trim_silence(audio_data)
+                if speech is None:
+                    logger.info("No speech detected - skipping transcription")
+                    return
+                transcribed_text = self._transcribe(speech, profile)
+
             # Log the raw transcription
             if transcribed_text.strip():
                 logger.info(f'Transcribed text: "{transcribed_text}"')
@@ -155,7 +557,7 @@ class MicrophoneTranscriber:
                 logger.info("No speech detected")
 
             # Apply LLM correction if enabled
-            if self.llm_corrector and transcribed_text.strip():
+            if correct and transcribed_text.strip():
                 transcribed_text = self.llm_corrector.correct(transcribed_text)
 
             # Send the text via clipboard or fallback to typing
@@ -168,70 +570,227 @@ class MicrophoneTranscriber:
         except Exception as e:
             logger.error(f"Transcription error: {e}")
         finally:
+            self.buffer_pool.release(audio_data)
             self.is_transcribing = False
             self.last_transcription_end_time = time.time()
             self.process_next_transcription()
 
     def process_next_transcription(self):
-        if self.transcription_queue and not self.is_transcribing:
+        if not self.model_ready.is_set():
+            if self.transcription_queue:
+                logger.info(
+                    f"Model still loading - {len(self.transcription_queue)} recording(s) queued"
+                )
+            return
+        with self._queue_lock:
+            if not self.transcription_queue or self.is_transcribing:
+                return
             audio_data = self.transcription_queue.pop(0)
+            profile = self._queued_profiles.pop(id(audio_data), None)
             self.is_transcribing = True
             threading.Thread(
-                target=self.transcribe_and_send, args=(audio_data,), daemon=True
+                target=self.transcribe_and_send, args=(audio_data, profile), daemon=True
             ).start()
 
     # ------------------------------------------------------------------
     # Recording control
     # ------------------------------------------------------------------
-    def start_recording(self):
-        if not self.is_recording:
-            logger.info("Recording...")
-            self.stop_event.clear()
-            self.is_recording = True
-            self.recording_start_time = time.time()
+    def _start_capture_process(self) -> bool:
+        try:
+            process = CaptureProcess(
+                samplerate=self.capture_rate,
+                channels=1,
+                blocksize=self.blocksize,
+                latency=self._stream_latency(),
+                device="default",
+            )
+            process.start()
+        except Exception as e:
+            logger.warning(f"Capture process unavailable, capturing in-process: {e}")
+            self.capture_process = False
+            return False
+        self.stream = self._capture_child = process
+        self.capture_stats = process.stats
+        self._use_capture_ring(process.ring)
+        logger.info("Capturing audio in a separate process")
+        return True
+
+    def _open_stream(self):
+        self._first_block_adc = None
+        self._block_adc_end = None
+        self._input_latency = 0.0
+        self._configure_capture()
+        if not (self.capture_process and self._start_capture_process()):
+            if self.resampler is None:
+                self._use_capture_ring(None)
+            else:
+                # A few seconds is plenty: the pump drains it every 20 ms
+                capacity = 10 * self.capture_rate
+                if self.capture_ring is None or self.capture_ring.capacity != capacity:
+                    self._use_capture_ring(RingBuffer(capacity, channels=1))
+                else:
+                    self._use_capture_ring(self.capture_ring)
+            self.capture_stats = self._local_capture_stats
+            self.capture_stats.reset_timing()
+            self._block_ns = int(self.blocksize * 1e9 / self.capture_rate)
             self.stream = sd.InputStream(
                 callback=self.audio_callback,
                 channels=1,
-                samplerate=self.sample_rate,
-                blocksize=4000,
+                samplerate=self.capture_rate,
+                blocksize=self.blocksize,
+                latency=self._stream_latency(),
                 device="default",
             )
             self.stream.start()
+            with contextlib.suppress(TypeError, ValueError):
+                self.capture_stats.latency = self._input_latency = float(self.stream.latency)
+        if self.capture_ring is not None:
+            self._pump_stop.clear()
+            self._pump_thread = threading.Thread(target=self._pump_worker, name="capture-pump", daemon=True)
+            self._pump_thread.start()
+
+    def _close_stream(self):
+        if self.stream is None:
+            return
+        try:
+            self.stream.stop()
+        except Exception:
+            pass
+        if self._pump_thread is not None:
+            self._pump_stop.set()
+            self._pump_thread.join()
+            self._pump_thread = None
+        # Whatever the last callbacks delivered
+        self._pump_capture()
+        try:
+            self.stream.close()
+        except Exception:
+            pass
+        self.stream = self._capture_child = None
+        if isinstance(self.capture_ring, SharedRingBuffer):
+            self._use_capture_ring(None)
+
+    def _measure_press_latency(self, block_adc_end: float | None = None):
+        """
+        Time from key press to the capture of the recording's first sample.
+
+        With the stream kept open, `block_adc_end` is the capture time of
+        the newest sample in the ring at the press; the ring lags real time
+        by up to a block plus the input latency, so the recording reaches
+        back further than preroll_ms alone.
+        """
+        if self.keep_stream_open:
+            if block_adc_end is None:
+                return  # no callback in this process (capture process) or no block yet
+            first_sample = block_adc_end - (self.ring.write_index - self.recording_start_index) / self.sample_rate
+            self.last_press_latency = first_sample - self._press_time
+        elif self._first_block_adc is not None:
+            self.last_press_latency = self._first_block_adc - self._press_time
+        else:
+            return
+        logger.debug(f"Press-to-first-sample latency: {self.last_press_latency * 1000:.0f} ms")
+
+    def _wait_for_release_block(self, release_time: float):
+        """
+        With the stream kept open, wait until the block covering the release
+        instant is in the ring, so trailing speech isn't cut off.
+
+        Bounded by a block plus the input latency; without callback
+        timestamps in this process (capture process), waits for the next
+        block to arrive instead.
+        """
+        self._pump_capture()
+        release_index = self.ring.write_index
+        deadline = release_time + self.blocksize / self.capture_rate + self._input_latency + 0.05
+        while True:
+            block_adc_end = self._block_adc_end
+            self._pump_capture()
+            if block_adc_end is not None:
+                if block_adc_end >= release_time:
+                    return
+            elif self.ring.write_index > release_index:
+                return
+            if time.perf_counter() >= deadline:
+                return
+            time.sleep(0.005)
+
+    def start_recording(self, profile: str | None = None):
+        """Start recording; `profile` names a decoding profile for this recording."""
+        if not self.is_recording:
+            logger.info(f"Recording ({profile} profile)..." if profile else "Recording...")
+            self._recording_profile = profile
+            self._press_time = time.perf_counter()
+            self.stop_event.clear()
+            self.is_recording = True
+            self.recording_start_time = time.time()
+            self.recording_end_index = None
+            if self.keep_stream_open:
+                self._restart_dead_capture_process()
+                if self.stream is None:
+                    self._open_stream()
+                # Read before pumping: the ring then holds at least that block
+                block_adc_end = self._block_adc_end
+                self._pump_capture()
+                self._stats_at_start = self.capture_stats.snapshot()
+                # Start from the pre-roll already in the ring
+                write_index = self.ring.write_index
+                self.recording_start_index = max(
+                    write_index - self.preroll_frames, self.ring.oldest_index(write_index)
+                )
+                self._measure_press_latency(block_adc_end)
+            else:
+                self.recording_start_index = self.ring.write_index
+                self._stats_at_start = self._local_capture_stats.snapshot()
+            self._spilled_index = self.recording_start_index
+            if self.streaming_interval > 0:
+                self._start_streaming()
+            else:
+                self._spill_thread = threading.Thread(
+                    target=self._spill_worker, name="recording-spill", daemon=True
+                )
+                self._spill_thread.start()
+            if not self.keep_stream_open:
+                self._open_stream()
 
     def stop_recording_and_transcribe(self):
         if hasattr(self, "timer") and self.timer:
             self.timer.cancel()
         if self.is_recording:
+            release_time = time.perf_counter()
+            if not self.keep_stream_open:
+                self._measure_press_latency()
+                # Stopping the stream flushes the last block into the ring
+                self._close_stream()
+            else:
+                self._wait_for_release_block(release_time)
+            self.recording_end_index = end = self.ring.write_index
             self.stop_event.set()
             self.is_recording = False
-            try:
-                self.stream.stop()
-                self.stream.close()
-            except Exception:
-                pass
-            if self.buffer_index > 0:
-                audio_data = self.audio_buffer[: self.buffer_index]
+            if self._spill_thread is not None:
+                self._spill_thread.join()
+                self._spill_thread = None
+            self._report_recording_stats()
+            session, self._stream_session = self._stream_session, None
+            if session is not None:
+                session.stop(end)
+            if end > self.recording_start_index:
                 recording_duration = time.time() - self.recording_start_time
 
-                if recording_duration >= MIN_RECORDING_DURATION:
-                    self.audio_buffer = np.zeros(
-                        self.max_buffer_length, dtype=np.float32
-                    )
-                    self.buffer_index = 0
-                    self.transcription_queue.append(audio_data)
+                # With the VAD on, the transcription thread decides whether
+                # anything was said; otherwise fall back to a length check
+                if self.vad_aggressiveness > 0 or recording_duration >= MIN_RECORDING_DURATION:
+                    recording = session if session is not None else self._collect_recording(end)
+                    if self._recording_profile is not None:
+                        self._queued_profiles[id(recording)] = self._recording_profile
+                    self.transcription_queue.append(recording)
                     self.process_next_transcription()
                     logger.info(f"Recording duration: {recording_duration:.2f}s")
                     logger.info("Processing transcription...")
                 else:
-                    self.audio_buffer = np.zeros(
-                        self.max_buffer_length, dtype=np.float32
-                    )
-                    self.buffer_index = 0
                     logger.info(
                         f"Recording duration: {recording_duration:.2f}s - too short, skipping transcription"
                     )
             else:
-                self.buffer_index = 0
                 self.is_transcribing = False
                 self.last_transcription_end_time = time.time()
                 self.process_next_transcription()
@@ -246,8 +805,8 @@ class MicrophoneTranscriber:
                 current_time - self.last_transcription_end_time < 0.1
             ):
                 return True
-            if key == self.hotkey_key and not self.is_recording:
-                self.start_recording()
+            if key in self.hotkey_profiles and not self.is_recording:
+                self.start_recording(self.hotkey_profiles[key])
                 return True
         except AttributeError:
             pass
@@ -260,7 +819,7 @@ class MicrophoneTranscriber:
         transcription finishes.
         """
         try:
-            if key == self.hotkey_key and self.is_recording:
+            if key in self.hotkey_profiles and self.is_recording:
                 self.stop_recording_and_transcribe()
                 return True
         except AttributeError:
@@ -271,9 +830,6 @@ class MicrophoneTranscriber:
     # Main loop
     # ------------------------------------------------------------------
     def run(self):
-        with contextlib.suppress(Exception):
-            self.set_default_audio_source()
-
         # Define wrapper functions to satisfy type checker
         def _on_press(key):
             self.on_press(key)
@@ -286,14 +842,35 @@ class MicrophoneTranscriber:
         listener = keyboard.Listener(on_press=_on_press, on_release=_on_release)
         listener.start()
 
+        # The source is made the sound server's default before any stream
+        # opens; streams open on device="default"
+        with contextlib.suppress(Exception), startup_profile.phase("pulsectl default source"):
+            self.set_default_audio_source()
+
+        if self.keep_stream_open and self.stream is None:
+            try:
+                self._open_stream()
+                logger.info(f"Input stream kept open ({self.preroll_frames * 1000 // self.sample_rate} ms pre-roll)")
+            except Exception as e:
+                logger.warning(f"Could not open input stream, it will open on first press: {e}")
+                self.stream = None
+        self._startup_part_done()
+
         logger.info(
             f"Press {self.settings.hotkey.capitalize()} to start/stop recording. Press Ctrl+C to exit."
         )
+        for key, profile in self.hotkey_profiles.items():
+            if profile is not None:
+                logger.info(f"Hold {getattr(key, 'name', key)} to record with the {profile} decoding profile")
+        logger.info(f"Hotkey ready after {time.perf_counter() - self._startup_time:.2f}s")
+        if not self.model_ready.is_set():
+            logger.info("Model is still loading - recordings will be transcribed once it is ready")
 
         def sigint_handler(signum, frame):
             self.exit_flag = True
 
         signal.signal(signal.SIGINT, sigint_handler)
+        signal.signal(signal.SIGUSR1, lambda signum, frame: self.dump_audio_stats())
 
         while not self.exit_flag:
             if not listener.is_alive():
@@ -304,5 +881,7 @@ class MicrophoneTranscriber:
 
         if self.is_recording:
             self.stop_recording_and_transcribe()
+        self._close_stream()
+        self.dump_audio_stats(logging.DEBUG)
 
         logger.info("Program terminated by user")
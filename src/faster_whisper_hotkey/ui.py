@@ -5,6 +5,7 @@ from typing import Any
 
 from pulsectl import Pulse
 
+from .profiles import DECODING_PROFILES, DEFAULT_PROFILE
 from .settings import Settings, load_settings, save_settings
 
 
@@ -37,6 +38,7 @@ class ConfigStep(Enum):
     GRANITE_DEVICE = auto()
     GRANITE_PRECISION = auto()
     HOTKEY = auto()
+    DECODING_PROFILE = auto()
     LLM_ENABLE = auto()
     LLM_ENDPOINT = auto()
     LLM_MODEL = auto()
@@ -55,6 +57,7 @@ class ConfigData:
     language: str = ""
     language_src_target: str = ""
     hotkey: str = ""
+    decoding_profile: str = DEFAULT_PROFILE
     llm_correction_enabled: bool = False
     llm_endpoint: str = ""
     llm_model_name: str = ""
@@ -295,6 +298,7 @@ def config_screen_main(stdscr, settings_file: str | None = None):
         config.compute_type = last_settings.compute_type
         config.device = last_settings.device
         config.hotkey = last_settings.hotkey
+        config.decoding_profile = last_settings.decoding_profile
         config.llm_correction_enabled = last_settings.llm_correction_enabled
         config.llm_endpoint = last_settings.llm_endpoint
         config.llm_model_name = last_settings.llm_model_name
@@ -402,6 +406,8 @@ def _handle_key_transition(stdscr, current_step: ConfigStep, config: ConfigData)
     # Common final steps
     elif current_step == ConfigStep.HOTKEY:
         return _screen_hotkey(stdscr, config)
+    elif current_step == ConfigStep.DECODING_PROFILE:
+        return _screen_decoding_profile(stdscr, config)
 
     elif current_step == ConfigStep.LLM_ENABLE:
         return _screen_llm_enable(stdscr, config)
@@ -1143,6 +1149,32 @@ def _screen_hotkey(stdscr, config: ConfigData):
         return _back_to_initial(config)
 
     config.hotkey = selected.lower()
+    return (ConfigStep.DECODING_PROFILE, config)
+
+
+def _screen_decoding_profile(stdscr, config: ConfigData):
+    """Select the decoding profile (latency vs accuracy)."""
+    profile_options = [name.capitalize() for name in DECODING_PROFILES]
+
+    initial_idx = 0
+    if config.decoding_profile and config.decoding_profile.capitalize() in profile_options:
+        initial_idx = profile_options.index(config.decoding_profile.capitalize())
+
+    selected = curses_menu(
+        stdscr,
+        "Decoding Profile",
+        profile_options,
+        message=(
+            "Fastest: greedy, short token caps\nAccurate: beam search, more context\n"
+            "Per-hotkey profiles: profile_hotkeys in the settings file"
+        ),
+        initial_idx=initial_idx,
+    )
+
+    if selected is None:
+        return _back_to_initial(config)
+
+    config.decoding_profile = selected.lower()
     return (ConfigStep.LLM_ENABLE, config)
 
 
@@ -1232,8 +1264,13 @@ def _create_settings_from_config(
     config: ConfigData,
     last_settings: Settings | None,
 ) -> Settings:
-    """Create a Settings object from ConfigData."""
-    settings_dict: dict[str, Any] = {
+    """Create a Settings object from ConfigData.
+
+    Fields the UI doesn't edit (advanced/performance options set in the JSON
+    file) are carried over from `last_settings`.
+    """
+    settings_dict: dict[str, Any] = dict(last_settings.__dict__) if last_settings else {}
+    settings_dict |= {
         "device_name": config.device_name or "",
         "model_type": config.model_type or "",
         "model_name": config.model_name,
@@ -1241,6 +1278,7 @@ def _create_settings_from_config(
         "device": config.device,
         "language": config.language,
         "hotkey": config.hotkey,
+        "decoding_profile": config.decoding_profile,
         "llm_correction_enabled": config.llm_correction_enabled,
         "llm_endpoint": config.llm_endpoint,
         "llm_model_name": config.llm_model_name,
@@ -0,0 +1,148 @@
+"""
+Energy/spectral voice activity detection, used to trim silence before inference.
+
+Frames (30 ms) count as speech when their energy clears an adaptive
+threshold - the recording's own noise floor plus a margin, capped relative
+to its peak - and their spectrum isn't noise-flat. Speech runs are padded,
+pauses longer than the preset's limit are cut out, and the kept ranges are
+compacted in place so no new buffer is allocated.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+FRAME_S = 0.03
+# Less speech than this (after dropping clicks) means "nothing was said"
+MIN_SPEECH_S = 0.2
+# Speech runs shorter than this many frames are treated as clicks
+_MIN_RUN_FRAMES = 3
+# Frames below this level are never speech
+_ABSOLUTE_FLOOR_DB = -60.0
+
+
+@dataclass(frozen=True)
+class VadPreset:
+    margin_db: float  # required level above the noise floor
+    max_flatness: float  # spectral flatness above this is noise
+    pad_s: float  # audio kept around each speech run
+    max_pause_s: float  # longer pauses between runs are removed
+
+
+# Indexed by the vad_aggressiveness setting; 0 disables the VAD
+VAD_PRESETS = {
+    1: VadPreset(margin_db=6.0, max_flatness=0.45, pad_s=0.3, max_pause_s=1.0),
+    2: VadPreset(margin_db=9.0, max_flatness=0.4, pad_s=0.2, max_pause_s=0.6),
+    3: VadPreset(margin_db=12.0, max_flatness=0.35, pad_s=0.15, max_pause_s=0.4),
+}
+
+
+def _preset(aggressiveness: int) -> VadPreset:
+    return VAD_PRESETS[min(max(int(aggressiveness), 1), max(VAD_PRESETS))]
+
+
+def speech_frames(audio: np.ndarray, sample_rate: int, aggressiveness: int = 1) -> np.ndarray:
+    """Boolean speech decision per FRAME_S frame."""
+    preset = _preset(aggressiveness)
+    frame = int(sample_rate * FRAME_S)
+    n_frames = audio.size // frame
+    if n_frames == 0:
+        return np.zeros(0, dtype=bool)
+    frames = audio[: n_frames * frame].reshape(n_frames, frame)
+
+    energy_db = 10 * np.log10(np.mean(np.square(frames, dtype=np.float64), axis=1) + 1e-12)
+    noise_floor = np.percentile(energy_db, 10)
+    # Capped for recordings that are speech throughout (the "floor" is then
+    # quiet speech), but always above the floor's own spread
+    threshold = max(min(noise_floor + preset.margin_db, energy_db.max() - 20.0), noise_floor + 3.0)
+    loud = (energy_db > threshold) & (energy_db > _ABSOLUTE_FLOOR_DB)
+
+    spectrum = np.abs(np.fft.rfft(frames * np.hanning(frame), axis=1)) ** 2 + 1e-12
+    flatness = np.exp(np.mean(np.log(spectrum), axis=1)) / np.mean(spectrum, axis=1)
+    speech = loud & (flatness < preset.max_flatness)
+
+    # Drop isolated clicks: runs shorter than _MIN_RUN_FRAMES
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], speech.astype(np.int8), [0]))))
+    for start, end in zip(edges[::2], edges[1::2]):
+        if end - start < _MIN_RUN_FRAMES:
+            speech[start:end] = False
+    return speech
+
+
+def speech_segments(
+    audio: np.ndarray, sample_rate: int, aggressiveness: int = 1
+) -> tuple[list[tuple[int, int]], float]:
+    """Padded, pause-merged sample ranges to keep, and the seconds of actual speech."""
+    preset = _preset(aggressiveness)
+    frame = int(sample_rate * FRAME_S)
+    speech = speech_frames(audio, sample_rate, aggressiveness)
+    speech_s = float(speech.sum()) * FRAME_S
+
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], speech.astype(np.int8), [0]))))
+    pad = int(preset.pad_s * sample_rate)
+    max_pause = int(preset.max_pause_s * sample_rate)
+    segments: list[tuple[int, int]] = []
+    for start, end in zip(edges[::2] * frame, edges[1::2] * frame):
+        start, end = max(0, int(start) - pad), min(audio.size, int(end) + pad)
+        if segments and start - segments[-1][1] <= max_pause:
+            segments[-1] = (segments[-1][0], end)
+        else:
+            segments.append((start, end))
+    return segments, speech_s
+
+
+def trim_silence(
+    audio: np.ndarray, sample_rate: int, aggressiveness: int = 1
+) -> tuple[np.ndarray, float]:
+    """
+    Cut leading/trailing silence and long pauses, compacting `audio` in place.
+
+    Returns a view of `audio` holding the kept samples and the seconds of
+    detected speech (below MIN_SPEECH_S the recording has nothing to say).
+    """
+    segments, speech_s = speech_segments(audio, sample_rate, aggressiveness)
+    out = 0
+    for start, end in segments:
+        # Kept ranges only ever move left, so the overlapping copy is safe
+        audio[out : out + end - start] = audio[start:end]
+        out += end - start
+    return audio[:out], speech_s
+
+
+def find_pause(
+    audio: np.ndarray,
+    sample_rate: int,
+    aggressiveness: int = 1,
+    min_pause_s: float = 0.3,
+    min_offset_s: float = 1.0,
+    guard_s: float = 0.3,
+) -> int | None:
+    """
+    Sample index in the middle of the last pause worth cutting at, or None.
+
+    The pause must be at least `min_pause_s` of non-speech, start after
+    `min_offset_s` of audio and end `guard_s` before the end (speech may be
+    resuming right at the edge).
+    """
+    speech = speech_frames(audio, sample_rate, aggressiveness)
+    if not speech.any():
+        return None
+    frame = int(sample_rate * FRAME_S)
+    edges = np.flatnonzero(np.diff(np.concatenate(([1], speech.astype(np.int8), [1]))))
+    min_frames = round(min_pause_s / FRAME_S)
+    limit = len(speech) - round(guard_s / FRAME_S)
+    for start, end in zip(edges[::2][::-1], edges[1::2][::-1]):
+        if end - start >= min_frames and end <= limit and start * FRAME_S >= min_offset_s:
+            return int((start + end) // 2 * frame)
+    return None
+
+
+def quietest_point(audio: np.ndarray, sample_rate: int, from_fraction: float = 0.5) -> int:
+    """Sample index of the lowest-energy frame in the last part of `audio`."""
+    frame = int(sample_rate * FRAME_S)
+    first = int(audio.size * from_fraction) // frame
+    n_frames = audio.size // frame
+    if n_frames <= first:
+        return audio.size
+    frames = audio[first * frame : n_frames * frame].reshape(-1, frame)
+    return int((first + np.argmin(np.mean(np.square(frames, dtype=np.float64), axis=1))) * frame)
@@ -0,0 +1,292 @@
+"""Tests for audio.py (capture buffers and per-utterance processing)."""
+
+import mmap
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from faster_whisper_hotkey.audio import (
+    BufferPool,
+    CaptureStats,
+    PolyphaseResampler,
+    RingBuffer,
+    SpillFile,
+    normalize_peak,
+    to_mono,
+)
+
+
+class TestRingBuffer:
+    """Test the single-producer capture ring."""
+
+    def test_write_then_read_roundtrip(self):
+        """Frames come back in order with the write index advanced."""
+        ring = RingBuffer(100)
+        ring.write(np.arange(30, dtype=np.float32).reshape(-1, 1))
+
+        assert ring.write_index == 30
+        np.testing.assert_array_equal(ring.read(0)[:, 0], np.arange(30))
+
+    def test_read_across_wraparound(self):
+        """A range spanning the end of storage is returned contiguously."""
+        ring = RingBuffer(10)
+        for start in range(0, 16, 4):
+            ring.write(np.arange(start, start + 4, dtype=np.float32).reshape(-1, 1))
+
+        out = ring.read(8, 16)
+
+        assert out.flags["C_CONTIGUOUS"]
+        np.testing.assert_array_equal(out[:, 0], np.arange(8, 16))
+
+    def test_overwritten_frames_are_skipped(self):
+        """Reading further back than capacity returns only what is still held."""
+        ring = RingBuffer(8)
+        ring.write(np.arange(20, dtype=np.float32).reshape(-1, 1))
+
+        assert ring.oldest_index() == 12
+        np.testing.assert_array_equal(ring.read(0)[:, 0], np.arange(12, 20))
+
+    def test_read_into_preallocated_out(self):
+        """read(out=...) fills and returns a view of the caller's array."""
+        ring = RingBuffer(16)
+        ring.write(np.ones((5, 1), dtype=np.float32))
+        out = np.zeros((16, 1), dtype=np.float32)
+
+        result = ring.read(0, out=out)
+
+        assert result.shape == (5, 1)
+        assert np.shares_memory(result, out)
+
+    def test_accepts_one_dimensional_blocks(self):
+        """Mono blocks without a channel axis are accepted."""
+        ring = RingBuffer(8)
+        ring.write(np.full(3, 0.5, dtype=np.float32))
+
+        np.testing.assert_array_equal(ring.read(0)[:, 0], [0.5, 0.5, 0.5])
+
+    def test_multichannel_frames(self):
+        """Channel layout is preserved."""
+        ring = RingBuffer(8, channels=2)
+        ring.write(np.array([[1, 2], [3, 4]], dtype=np.float32))
+
+        np.testing.assert_array_equal(ring.read(0), [[1, 2], [3, 4]])
+
+
+class TestUtteranceProcessing:
+    """Test downmixing and whole-utterance normalization."""
+
+    def test_to_mono_averages_channels(self):
+        stereo = np.array([[1.0, 0.0], [0.5, 0.5]], dtype=np.float32)
+        np.testing.assert_allclose(to_mono(stereo), [0.5, 0.5])
+
+    def test_to_mono_single_channel_is_flattened(self):
+        mono = to_mono(np.ones((4, 1), dtype=np.float32))
+        assert mono.shape == (4,)
+        assert mono.dtype == np.float32
+
+    def test_normalize_peak_uses_one_gain_for_the_utterance(self):
+        """Quiet and loud parts keep their relative level."""
+        audio = np.array([0.1, -0.2, 0.5], dtype=np.float32)
+        np.testing.assert_allclose(normalize_peak(audio), [0.2, -0.4, 1.0])
+
+    def test_normalize_peak_leaves_silence_alone(self):
+        audio = np.zeros(4, dtype=np.float32)
+        np.testing.assert_array_equal(normalize_peak(audio), audio)
+
+    def test_normalize_peak_empty(self):
+        assert normalize_peak(np.zeros(0, dtype=np.float32)).size == 0
+
+
+class TestBufferPool:
+    """Test utterance buffer recycling."""
+
+    def test_acquire_returns_right_sized_view(self):
+        pool = BufferPool(granularity=1000)
+        buffer = pool.acquire(1500)
+
+        assert buffer.shape == (1500,)
+        assert buffer.base.size == 2000
+
+    def test_released_block_is_reused(self):
+        """Steady-state acquire/release cycles hand out the same memory."""
+        pool = BufferPool(granularity=1000)
+        first = pool.acquire(800)
+        block = first.base
+        pool.release(first)
+
+        second = pool.acquire(900)
+
+        assert second.base is block
+
+    def test_release_accepts_derived_views(self):
+        """Views taken from the acquired buffer release the same block."""
+        pool = BufferPool(granularity=1000)
+        buffer = pool.acquire(600)
+
+        assert pool.release(buffer.reshape(600, 1)[:, 0]) is True
+        assert pool.release(buffer) is False  # already returned
+
+    def test_foreign_arrays_are_ignored(self):
+        pool = BufferPool()
+        assert pool.release(np.zeros(10, dtype=np.float32)) is False
+        assert pool.release([0.0, 1.0]) is False
+
+    def test_free_list_is_bounded(self):
+        """At most max_free blocks are retained, keeping the largest."""
+        pool = BufferPool(granularity=100, max_free=2)
+        buffers = [pool.acquire(n) for n in (100, 300, 200)]
+        for buffer in buffers:
+            pool.release(buffer)
+
+        assert pool.pooled_bytes == (300 + 200) * 4
+
+    def test_pooled_memory_stays_flat(self):
+        """Repeated utterances of varying length don't grow the pool."""
+        pool = BufferPool(granularity=16000)
+        for n in [16000, 40000, 8000, 30000] * 25:
+            pool.release(pool.acquire(n))
+
+        assert pool.pooled_bytes <= 2 * 48000 * 4
+
+
+class TestSpillFile:
+    """Test the on-disk spill for long recordings."""
+
+    def test_appended_samples_map_back(self, tmp_path):
+        spill = SpillFile(str(tmp_path))
+        spill.append(np.arange(5, dtype=np.float32))
+        spill.append(np.arange(5, 8, dtype=np.float32))
+
+        audio = spill.map()
+
+        np.testing.assert_array_equal(audio, np.arange(8))
+        assert isinstance(memoryview(audio.base).obj, mmap.mmap)
+
+    def test_mapping_is_writable_in_place(self, tmp_path):
+        """Whole-utterance normalization can run on the mapping."""
+        spill = SpillFile(str(tmp_path))
+        spill.append(np.array([0.25, -0.5], dtype=np.float32))
+
+        audio = normalize_peak(spill.map())
+
+        np.testing.assert_allclose(audio, [0.5, -1.0])
+
+    def test_file_is_anonymous(self, tmp_path):
+        """Nothing is left behind in the spill directory."""
+        spill = SpillFile(str(tmp_path))
+        spill.append(np.ones(10, dtype=np.float32))
+        spill.map()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_empty_spill(self, tmp_path):
+        assert SpillFile(str(tmp_path)).map().size == 0
+
+
+class TestPolyphaseResampler:
+    """Test the streaming resampler."""
+
+    @staticmethod
+    def _tone(freq, rate, seconds=1.0):
+        t = np.arange(int(rate * seconds)) / rate
+        return np.sin(2 * np.pi * freq * t).astype(np.float32)
+
+    def test_ratio_reduction(self):
+        resampler = PolyphaseResampler(44100, 16000)
+        assert (resampler.up, resampler.down) == (160, 441)
+
+    def test_tone_is_preserved(self):
+        """A 1 kHz tone comes out as the same tone, delayed by the filter."""
+        for rate in (48000, 44100, 8000):
+            resampler = PolyphaseResampler(rate, 16000)
+            out = resampler.process(self._tone(1000, rate))
+            delay = (resampler.taps * resampler.up - 1) / 2 / (rate * resampler.up)
+            expected = np.sin(2 * np.pi * 1000 * (np.arange(out.size) / 16000 - delay))
+
+            assert out.size == 16000
+            # Skip the filter's start-up and tail transients
+            settle = 2 * resampler.taps * resampler.out_rate // rate
+            np.testing.assert_allclose(out[settle:-settle], expected[settle:-settle], atol=1e-3)
+
+    def test_content_above_nyquist_is_rejected(self):
+        """A 12 kHz tone at 48 kHz doesn't alias into the 16 kHz output."""
+        out = PolyphaseResampler(48000, 16000).process(self._tone(12000, 48000))
+        assert np.abs(out[200:]).max() < 1e-3
+
+    @pytest.mark.parametrize("rate", [48000, 44100])
+    def test_stopband_rejection(self, rate):
+        """Tones from just above the output Nyquist up are attenuated by at least 60 dB."""
+        for freq in (8250, 8500, 9000, 10000, 12000, 15000, 20000):
+            resampler = PolyphaseResampler(rate, 16000)
+            out = resampler.process(self._tone(freq, rate))
+            settle = 2 * resampler.taps * resampler.out_rate // rate
+            level_db = 20 * np.log10(np.abs(out[settle:-settle]).max())
+
+            assert level_db < -60, f"{freq} Hz at {rate} Hz only {-level_db:.1f} dB down"
+
+    def test_blockwise_matches_one_shot(self):
+        """Feeding odd-sized blocks gives exactly the one-shot result."""
+        signal = np.random.default_rng(0).standard_normal(44100).astype(np.float32)
+        one_shot = PolyphaseResampler(44100, 16000).process(signal)
+
+        resampler = PolyphaseResampler(44100, 16000)
+        blocks = [resampler.process(signal[i : i + 1234]) for i in range(0, signal.size, 1234)]
+
+        np.testing.assert_allclose(np.concatenate(blocks), one_shot, atol=1e-6)
+
+    def test_reset_restarts_the_stream(self):
+        resampler = PolyphaseResampler(48000, 16000)
+        first = resampler.process(self._tone(440, 48000, 0.1))
+        resampler.reset()
+
+        np.testing.assert_array_equal(resampler.process(self._tone(440, 48000, 0.1)), first)
+
+
+class TestCaptureStats:
+    """Test the audio-path health counters."""
+
+    def test_status_flags_counted(self):
+        stats = CaptureStats()
+        stats.record_status(MagicMock(input_overflow=True, input_underflow=False))
+        stats.record_status(MagicMock(input_overflow=True, input_underflow=True))
+
+        summary = stats.summary()
+        assert (summary["overflows"], summary["underflows"]) == (2, 1)
+
+    def test_histogram_buckets(self):
+        stats = CaptureStats()
+        block_ns = 10_000_000
+        t = 1_000_000
+        for duration_us, late_us in [(40, 0), (300, 200), (3000, 60_000)]:
+            t += block_ns + late_us * 1000
+            stats.record_callback(t, t + duration_us * 1000, block_ns)
+
+        summary = stats.summary()
+        assert summary["callback_us"]["<=50"] == 1
+        assert summary["callback_us"]["<=500"] == 1
+        assert summary["callback_us"]["<=5000"] == 1
+        assert summary["jitter_us"]["<=250"] == 1
+        assert summary["jitter_us"]["<=100000"] == 1
+        assert (summary["max_callback_us"], summary["max_jitter_us"]) == (3000, 60_000)
+
+    def test_summary_since_snapshot(self):
+        stats = CaptureStats()
+        stats.record_callback(0, 1000, 0)
+        before = stats.snapshot()
+        stats.record_callback(10_000, 11_000, 0)
+
+        assert stats.summary(since=before)["callbacks"] == 1
+        assert stats.summary()["callbacks"] == 2
+
+    def test_reset_timing_skips_jitter_for_first_block(self):
+        stats = CaptureStats()
+        stats.record_callback(0, 1000, 10_000_000)
+        stats.reset_timing()
+        stats.record_callback(5_000_000_000, 5_000_001_000, 10_000_000)
+
+        assert sum(stats.summary()["jitter_us"].values()) == 0
+
+    def test_format_has_a_row_per_bucket(self):
+        text = CaptureStats.format(CaptureStats().summary())
+        assert len(text.splitlines()) == 2 + CaptureStats.N_BUCKETS + 1
@@ -0,0 +1,84 @@
+"""Tests for capture.py (shared-memory ring and capture process)."""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from faster_whisper_hotkey.audio import CaptureStats
+from faster_whisper_hotkey.capture import CaptureProcess, SharedRingBuffer
+
+
+def _fake_capture_main(ring_name, capacity, channels, stream_kwargs, stop_event, ready_event, latency):
+    """Stands in for the real child: writes a ramp instead of opening a device."""
+    ring = SharedRingBuffer(capacity, channels, name=ring_name, extra=CaptureStats.SIZE)
+    stats = CaptureStats(ring.extra)
+    ring.write(np.arange(stream_kwargs["samplerate"], dtype=np.float32).reshape(-1, 1))
+    stats.record_status(MagicMock(input_overflow=True, input_underflow=False))
+    latency.value = 0.02
+    ready_event.set()
+    stop_event.wait()
+    stats.counters = None
+    ring.close()
+
+
+class TestSharedRingBuffer:
+    """Test the shared-memory ring buffer."""
+
+    def test_attached_writer_visible_to_owner(self):
+        owner = SharedRingBuffer(64)
+        writer = SharedRingBuffer(64, name=owner.name)
+
+        writer.write(np.arange(10, dtype=np.float32))
+
+        assert owner.write_index == 10
+        np.testing.assert_array_equal(owner.read(0)[:, 0], np.arange(10))
+        writer.close()
+        owner.close()
+
+    def test_owner_close_unlinks_segment(self):
+        ring = SharedRingBuffer(64)
+        name = ring.name
+        ring.close()
+
+        assert not os.path.exists(os.path.join("/dev/shm", name))
+
+    def test_extra_slots_are_shared(self):
+        owner = SharedRingBuffer(16, extra=4)
+        other = SharedRingBuffer(16, name=owner.name, extra=4)
+
+        other.extra[2] = 7
+
+        assert owner.extra[2] == 7
+        other.close()
+        owner.close()
+
+    def test_wraparound_matches_ring_buffer(self):
+        ring = SharedRingBuffer(10)
+        for start in range(0, 16, 4):
+            ring.write(np.arange(start, start + 4, dtype=np.float32).reshape(-1, 1))
+
+        np.testing.assert_array_equal(ring.read(8, 16)[:, 0], np.arange(8, 16))
+        ring.close()
+
+
+class TestCaptureProcess:
+    """Test the capture child process lifecycle."""
+
+    def test_child_writes_into_shared_ring(self):
+        """Frames written by the child are readable in the parent without a pipe."""
+        with patch("faster_whisper_hotkey.capture._capture_main", _fake_capture_main):
+            process = CaptureProcess(samplerate=8000, blocksize=800, buffer_seconds=2.0)
+            process.start(timeout=30)
+
+        ring = process.ring
+        assert ring.write_index == 8000
+        assert process.latency == 0.02
+        np.testing.assert_array_equal(ring.read(0, 5)[:, 0], np.arange(5))
+
+        process.stop()
+        process.close()
+        assert not process._process.is_alive()
+        # Counters written by the child survive the segment
+        assert process.stats.summary()["overflows"] == 1
+        assert process.stats.summary()["latency_ms"] == 20.0
@@ -0,0 +1,160 @@
+"""Tests for daemon.py (model daemon + thin client)."""
+
+import socket
+import threading
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from faster_whisper_hotkey.daemon import ModelDaemon, RemoteModel, serve
+
+
+@pytest.fixture
+def running_daemon(tmp_path):
+    """Serve a mocked ModelWrapper on a temporary socket."""
+    model_wrapper = MagicMock()
+    model_wrapper.transcribe.return_value = "hello world"
+    socket_path = str(tmp_path / "fwh.sock")
+
+    server = ModelDaemon(model_wrapper, socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield model_wrapper, socket_path
+
+    server.shutdown()
+    server.server_close()
+
+
+class TestRemoteModel:
+    """Test the client/server round trip."""
+
+    def test_float32_round_trip(self, running_daemon):
+        """float32 PCM reaches the model unchanged, with language and rate."""
+        model_wrapper, socket_path = running_daemon
+        audio = np.linspace(-1, 1, 16000, dtype=np.float32)
+
+        client = RemoteModel(socket_path)
+        text = client.transcribe(audio, sample_rate=16000, language="fr")
+        client.close()
+
+        assert text == "hello world"
+        received = model_wrapper.transcribe.call_args[0][0]
+        np.testing.assert_array_equal(received, audio)
+        assert model_wrapper.transcribe.call_args[1] == {"sample_rate": 16000, "language": "fr", "profile": None}
+
+    def test_int16_is_scaled_to_float32(self, running_daemon):
+        """int16 PCM is sent raw and scaled to [-1, 1) by the daemon."""
+        model_wrapper, socket_path = running_daemon
+        audio = np.array([0, 16384, -32768], dtype=np.int16)
+
+        client = RemoteModel(socket_path)
+        client.transcribe(audio, sample_rate=16000, language=None)
+        client.close()
+
+        received = model_wrapper.transcribe.call_args[0][0]
+        assert received.dtype == np.float32
+        np.testing.assert_allclose(received, [0.0, 0.5, -1.0])
+        assert model_wrapper.transcribe.call_args[1]["language"] is None
+
+    def test_connection_is_reused(self, running_daemon):
+        """Several requests can share one connection."""
+        model_wrapper, socket_path = running_daemon
+
+        client = RemoteModel(socket_path)
+        for _ in range(3):
+            assert client.transcribe(np.zeros(800, dtype=np.float32)) == "hello world"
+        client.close()
+
+        assert model_wrapper.transcribe.call_count == 3
+
+    def test_profile_reaches_the_model(self, running_daemon):
+        """A profile hotkey's profile is sent along; unknown names use the daemon's own."""
+        model_wrapper, socket_path = running_daemon
+
+        client = RemoteModel(socket_path)
+        client.transcribe(np.zeros(800, dtype=np.float32), profile="Accurate")
+        assert model_wrapper.transcribe.call_args[1]["profile"] == "accurate"
+        client.transcribe(np.zeros(800, dtype=np.float32), profile="bogus")
+        assert model_wrapper.transcribe.call_args[1]["profile"] is None
+        client.close()
+
+    def test_reconnects_after_daemon_restart(self, tmp_path):
+        """A restarted daemon is picked up again without restarting the client."""
+        socket_path = str(tmp_path / "fwh.sock")
+
+        def start(text):
+            model_wrapper = MagicMock()
+            model_wrapper.transcribe.return_value = text
+            server = ModelDaemon(model_wrapper, socket_path)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            return server
+
+        server = start("first")
+        client = RemoteModel(socket_path)
+        assert client.transcribe(np.zeros(800, dtype=np.float32)) == "first"
+        server.shutdown()
+        server.server_close()
+        # Drop the handler's end of the old connection as a dying daemon would
+        client._sock.shutdown(socket.SHUT_RD)
+
+        server = start("second")
+        try:
+            assert client.transcribe(np.zeros(800, dtype=np.float32)) == "second"
+        finally:
+            client.close()
+            server.shutdown()
+            server.server_close()
+
+    def test_gives_up_after_one_reconnect(self, running_daemon, tmp_path):
+        """With no daemon to reconnect to, the utterance yields an empty string."""
+        _, socket_path = running_daemon
+        client = RemoteModel(socket_path)
+        client._sock.close()
+        client.socket_path = str(tmp_path / "gone.sock")
+
+        assert client.transcribe(np.zeros(800, dtype=np.float32)) == ""
+
+    def test_model_error_returns_empty_string(self, running_daemon):
+        """Errors raised by the model surface as an empty transcription."""
+        model_wrapper, socket_path = running_daemon
+        model_wrapper.transcribe.side_effect = RuntimeError("out of memory")
+
+        client = RemoteModel(socket_path)
+        assert client.transcribe(np.zeros(800, dtype=np.float32)) == ""
+        client.close()
+
+    def test_missing_daemon_raises_on_connect(self, tmp_path):
+        """Connecting without a daemon fails loudly so the transcriber can report it."""
+        with pytest.raises(OSError):
+            RemoteModel(str(tmp_path / "missing.sock"))
+
+
+class TestServe:
+    """Test daemon start-up."""
+
+    def test_startup_profile_reported_once_model_is_loaded(self, tmp_path):
+        """--daemon --profile-startup prints the table before serving, not at exit."""
+        events = []
+        with (
+            patch("faster_whisper_hotkey.models.ModelWrapper"),
+            patch("faster_whisper_hotkey.daemon.ModelDaemon") as daemon_cls,
+            patch("faster_whisper_hotkey.daemon.startup_profile.finish", side_effect=lambda: events.append("finish")),
+        ):
+            server = daemon_cls.return_value.__enter__.return_value
+            server.serve_forever.side_effect = lambda: events.append("serve")
+            serve(MagicMock(warmup=False), str(tmp_path / "fwh.sock"))
+
+        assert events == ["finish", "serve"]
+
+    def test_startup_profile_reported_when_load_fails(self, tmp_path):
+        """A model that fails to load still gets its startup breakdown."""
+        with (
+            patch("faster_whisper_hotkey.models.ModelWrapper", side_effect=RuntimeError("no weights")),
+            patch("faster_whisper_hotkey.daemon.startup_profile.finish") as finish,
+            pytest.raises(RuntimeError),
+        ):
+            serve(MagicMock(), str(tmp_path / "fwh.sock"))
+
+        finish.assert_called_once()
@@ -260,3 +260,82 @@ class TestCLIParsing:
             )
 
         os.environ.pop("FASTER_WHISPER_HOTKEY_DEBUG", None)
+
+    def test_client_flag_passes_daemon_socket(self):
+        """--client --socket forwards the socket path to transcribe.main."""
+        from faster_whisper_hotkey.__main__ import main as cli_main
+
+        with patch(
+            "sys.argv", ["faster-whisper-hotkey", "--headless", "--client", "--socket", "/run/fwh.sock"]
+        ), patch("faster_whisper_hotkey.transcribe.main") as mock_transcribe_main:
+            cli_main()
+
+            mock_transcribe_main.assert_called_once_with(
+                headless=True, settings_file=None, daemon_socket="/run/fwh.sock"
+            )
+
+    def test_daemon_flag_runs_daemon(self):
+        """--daemon serves the model instead of starting the hotkey front end."""
+        from faster_whisper_hotkey.__main__ import main as cli_main
+
+        with patch("sys.argv", ["faster-whisper-hotkey", "--daemon", "--socket-mode", "660"]), patch(
+            "faster_whisper_hotkey.transcribe.run_daemon"
+        ) as mock_run_daemon, patch("faster_whisper_hotkey.transcribe.main") as mock_transcribe_main:
+            cli_main()
+
+            mock_run_daemon.assert_called_once_with(settings_file=None, socket_path=None, socket_mode=0o660)
+            mock_transcribe_main.assert_not_called()
+
+
+class TestHeadlessImports:
+    """Headless startup imports only what capture, inference and output need."""
+
+    # Seconds allowed for importing the headless startup chain in a fresh interpreter
+    IMPORT_BUDGET_S = 3.0
+    FORBIDDEN = ("curses", "_curses", "pulsectl", "faster_whisper_hotkey.ui", "torch", "nemo", "transformers")
+
+    def test_headless_import_chain_within_budget(self):
+        """The headless chain never imports curses, ui.py, pulsectl or a model library."""
+        import subprocess
+        import sys
+
+        script = (
+            "import sys, time\n"
+            "t0 = time.perf_counter()\n"
+            "import faster_whisper_hotkey.__main__\n"
+            "import faster_whisper_hotkey.transcribe\n"
+            "import faster_whisper_hotkey.transcriber\n"
+            "print(time.perf_counter() - t0)\n"
+            f"print(','.join(m for m in {self.FORBIDDEN!r} if m in sys.modules))\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True
+        )
+        *_, elapsed, leaked = result.stdout.splitlines()
+
+        assert leaked == ""
+        assert float(elapsed) < self.IMPORT_BUDGET_S
+
+    @patch("faster_whisper_hotkey.transcriber.MicrophoneTranscriber")
+    @patch("faster_whisper_hotkey.settings.load_settings")
+    def test_headless_main_does_not_import_ui(self, mock_load, mock_transcriber_cls):
+        """main(headless=True) never imports ui.py."""
+        import sys
+
+        from faster_whisper_hotkey.settings import Settings
+        from faster_whisper_hotkey.transcribe import main
+
+        mock_load.return_value = Settings(
+            device_name="test_dev",
+            model_type="whisper",
+            model_name="small",
+            compute_type="int8",
+            device="cpu",
+            language="en",
+        )
+        with patch.dict(sys.modules):
+            sys.modules.pop("faster_whisper_hotkey.ui", None)
+            main(headless=True)
+
+            assert "faster_whisper_hotkey.ui" not in sys.modules
@@ -0,0 +1,163 @@
+"""Tests for longform.py (pause-split long-recording decoding)."""
+
+import threading
+import time
+from itertools import pairwise
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+
+from faster_whisper_hotkey.longform import split_at_pauses, transcribe_long
+
+SR = 16000
+
+
+def _voiced(seconds):
+    t = np.arange(int(SR * seconds)) / SR
+    tone = sum(np.sin(2 * np.pi * 140 * k * t) / k for k in range(1, 15))
+    return (0.3 * tone * (0.6 + 0.4 * np.sin(2 * np.pi * 4 * t))).astype(np.float32)
+
+
+def _noise(seconds, seed=0):
+    return (np.random.default_rng(seed).standard_normal(int(SR * seconds)) * 0.003).astype(np.float32)
+
+
+def _speech_with_pauses(segments):
+    """Speech of the given lengths separated by 0.5 s pauses; returns audio and pause middles."""
+    parts, middles, offset = [], [], 0
+    for i, seconds in enumerate(segments):
+        parts.append(_voiced(seconds))
+        offset += int(seconds * SR)
+        if i < len(segments) - 1:
+            parts.append(_noise(0.5, seed=i))
+            middles.append(offset + SR // 4)
+            offset += SR // 2
+    return np.concatenate(parts), middles
+
+
+class _Backend:
+    """Backend stand-in whose text is the chunk's length in tenths of a second."""
+
+    def __init__(self, capabilities=frozenset(), delay=0.0):
+        self.capabilities = capabilities
+        self.delay = delay
+        self.calls = []
+        self.threads = set()
+
+    def transcribe(self, audio_data, sample_rate, language):
+        self.threads.add(threading.current_thread().name)
+        self.calls.append(audio_data.size)
+        time.sleep(self.delay)
+        return f"{round(audio_data.size / SR * 10)}"
+
+    def transcribe_batch(self, batch, sample_rate, language):
+        self.calls.append([a.size for a in batch])
+        return [f"{round(a.size / SR * 10)}" for a in batch]
+
+
+class TestSplitAtPauses:
+    """Test where long recordings are cut."""
+
+    def test_short_audio_is_one_chunk(self):
+        assert split_at_pauses(_voiced(5), SR, chunk_s=30) == [(0, 5 * SR)]
+
+    def test_cuts_land_in_pauses_and_chunks_are_bounded(self):
+        audio, middles = _speech_with_pauses([8, 9, 7, 8, 9, 6])
+
+        ranges = split_at_pauses(audio, SR, chunk_s=20, min_chunk_s=5)
+
+        assert ranges[0][0] == 0 and ranges[-1][1] == audio.size
+        assert all(a[1] == b[0] for a, b in pairwise(ranges))
+        assert all(end - start <= 20 * SR for start, end in ranges)
+        for _, cut in ranges[:-1]:
+            assert min(abs(cut - m) for m in middles) < 0.2 * SR
+
+    def test_longest_pause_preferred(self):
+        audio = np.concatenate([_voiced(6), _noise(0.3), _voiced(3), _noise(1.0, seed=1), _voiced(6)])
+
+        (_, cut), _ = split_at_pauses(audio, SR, chunk_s=12, min_chunk_s=4)
+
+        assert 9.3 * SR < cut < 10.3 * SR
+
+    def test_no_pause_cuts_at_quietest_point(self):
+        audio = _voiced(25)
+        audio[int(14 * SR) : int(14.2 * SR)] *= 0.01
+
+        (_, cut), _ = split_at_pauses(audio, SR, chunk_s=20, min_chunk_s=5)
+
+        assert 14 * SR <= cut <= 14.2 * SR
+
+
+class TestTranscribeLong:
+    """Test chunk decoding and in-order stitching."""
+
+    def test_batching_backend_gets_batches(self):
+        audio, _ = _speech_with_pauses([8, 9, 7, 8, 9, 6])
+        backend = _Backend(capabilities=frozenset({"batch"}))
+
+        text = transcribe_long(backend, audio, SR, None, chunk_s=20, batch_size=2)
+
+        assert all(isinstance(call, list) and len(call) <= 2 for call in backend.calls)
+        chunk_sizes = [size for call in backend.calls for size in call]
+        assert sum(chunk_sizes) == audio.size
+        assert text == " ".join(str(round(size / SR * 10)) for size in chunk_sizes)
+
+    def test_non_batching_backend_decodes_in_order_on_one_thread(self):
+        """A backend without batching is never called from several threads at once."""
+        audio, _ = _speech_with_pauses([8, 9, 7, 8, 9, 6])
+        backend = _Backend(delay=0.01)
+
+        text = transcribe_long(backend, audio, SR, None, chunk_s=12)
+
+        ranges = split_at_pauses(audio, SR, 12, 4)
+        assert text == " ".join(str(round((end - start) / SR * 10)) for start, end in ranges)
+        assert backend.threads == {threading.current_thread().name}
+
+    def test_single_chunk_is_one_plain_call(self):
+        backend = _Backend(capabilities=frozenset({"batch"}))
+
+        transcribe_long(backend, _voiced(10), SR, None, chunk_s=30)
+
+        assert backend.calls == [10 * SR]
+
+
+class TestModelWrapperLongForm:
+    """Test when ModelWrapper routes through the long-form stage."""
+
+    def _wrapper(self, backend_class, **settings):
+        from faster_whisper_hotkey import models
+
+        config = SimpleNamespace(model_type="fake", model_name="x", device="cpu", compute_type=None, **settings)
+        with patch.dict(models._backend_registry, {"fake": backend_class}):
+            return models.ModelWrapper(config)
+
+    def _backend_class(self, capabilities):
+        from faster_whisper_hotkey import models
+
+        class FakeBackend(models.Backend):
+            def load(self):
+                pass
+
+            def transcribe(self, audio_data, sample_rate, language):
+                return "x"
+
+        FakeBackend.capabilities = capabilities
+        return FakeBackend
+
+    def test_long_recording_uses_long_form(self):
+        wrapper = self._wrapper(self._backend_class(frozenset()), longform_threshold=10.0)
+
+        with patch("faster_whisper_hotkey.models.longform.transcribe_long", return_value="long") as long:
+            assert wrapper.transcribe(np.zeros(11 * SR, dtype=np.float32)) == "long"
+            assert wrapper.transcribe(np.zeros(9 * SR, dtype=np.float32)) == "x"
+
+        long.assert_called_once()
+
+    def test_native_chunking_backends_are_left_alone(self):
+        wrapper = self._wrapper(self._backend_class(frozenset({"native_chunking"})), longform_threshold=10.0)
+
+        with patch("faster_whisper_hotkey.models.longform.transcribe_long") as long:
+            wrapper.transcribe(np.zeros(60 * SR, dtype=np.float32))
+
+        long.assert_not_called()
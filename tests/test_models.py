@@ -329,6 +329,149 @@ class TestModelWrapperTranscribe:
         assert call_kwargs["source_lang"] == "en"
         assert call_kwargs["target_lang"] == "de"
 
+    @patch("faster_whisper_hotkey.models.ASRModel")
+    def test_transcribe_batch_parakeet(self, mock_asr):
+        """Parakeet decodes a batch in one NeMo call."""
+        from faster_whisper_hotkey.models import ModelWrapper
+
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = [MagicMock(text="one"), MagicMock(text="two")]
+        mock_asr.from_pretrained.return_value = mock_model.eval.return_value = mock_model
+        wrapper = ModelWrapper(
+            MockSettings(model_type="parakeet", model_name="nvidia/parakeet-tdt-0.6b-v3", device="cpu")
+        )
+
+        result = wrapper.transcribe_batch([self.sample_audio, self.sample_audio], 16000)
+
+        assert result == ["one", "two"]
+        assert mock_model.transcribe.call_args.kwargs["batch_size"] == 2
+
+    @patch("faster_whisper_hotkey.models.ASRModel")
+    def test_transcribe_batch_parakeet_old_rnnt_api(self, mock_asr):
+        """(best, all) hypothesis tuples from older NeMo are unpacked."""
+        from faster_whisper_hotkey.models import ModelWrapper
+
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = ([MagicMock(text="one"), MagicMock(text="two")], None)
+        mock_asr.from_pretrained.return_value = mock_model.eval.return_value = mock_model
+        wrapper = ModelWrapper(
+            MockSettings(model_type="parakeet", model_name="nvidia/parakeet-tdt-0.6b-v3", device="cpu")
+        )
+
+        assert wrapper.transcribe_batch([self.sample_audio] * 2, 16000) == ["one", "two"]
+
+    @patch("faster_whisper_hotkey.models.EncDecMultiTaskModel")
+    def test_transcribe_batch_canary(self, mock_encdec):
+        """Canary decodes a batch in one NeMo call."""
+        from faster_whisper_hotkey.models import ModelWrapper
+
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = [MagicMock(text=" one "), MagicMock(text="two")]
+        mock_encdec.from_pretrained.return_value = mock_model.eval.return_value = mock_model
+        wrapper = ModelWrapper(MockSettings(model_type="canary", model_name="nvidia/canary-1b-v2", device="cuda"))
+
+        result = wrapper.transcribe_batch([self.sample_audio] * 3, 16000, language="en-en")
+
+        assert result == ["one", "two", ""]
+        assert mock_model.transcribe.call_count == 1
+        assert len(mock_model.transcribe.call_args.kwargs["audio"]) == 3
+
+    @patch("faster_whisper_hotkey.models.EncDecMultiTaskModel")
+    def test_canary_gets_arrays(self, mock_encdec):
+        """Clips are handed to NeMo as arrays, without a WAV round trip."""
+        from faster_whisper_hotkey.models import ModelWrapper
+
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = [MagicMock(text="text")]
+        mock_encdec.from_pretrained.return_value = mock_model.eval.return_value = mock_model
+        wrapper = ModelWrapper(MockSettings(model_type="canary", model_name="nvidia/canary-1b-v2", device="cuda"))
+
+        wrapper.transcribe(self.sample_audio, 16000, language="en-en")
+
+        (audio,) = mock_model.transcribe.call_args.kwargs["audio"]
+        assert audio is self.sample_audio
+
+    @patch("faster_whisper_hotkey.models.EncDecMultiTaskModel")
+    def test_canary_falls_back_to_memfd_paths(self, mock_encdec):
+        """NeMo versions that reject arrays get in-memory WAV paths, from then on."""
+        import soundfile as sf
+
+        from faster_whisper_hotkey.models import ModelWrapper
+
+        received = []
+
+        def _transcribe(audio, **kwargs):
+            if not isinstance(audio[0], str):
+                raise TypeError("unsupported input")
+            received.append(sf.read(audio[0], dtype="float32")[0])
+            return [MagicMock(text="text")]
+
+        mock_model = MagicMock()
+        mock_model.transcribe.side_effect = _transcribe
+        mock_encdec.from_pretrained.return_value = mock_model.eval.return_value = mock_model
+        wrapper = ModelWrapper(MockSettings(model_type="canary", model_name="nvidia/canary-1b-v2", device="cuda"))
+
+        assert wrapper.transcribe(self.sample_audio, 16000, language="en-en") == "text"
+        assert wrapper.transcribe(self.sample_audio, 16000, language="en-en") == "text"
+
+        assert mock_model.transcribe.call_count == 3
+        np.testing.assert_array_equal(received[0], self.sample_audio)
+
+    @patch("faster_whisper_hotkey.models.EncDecMultiTaskModel")
+    def test_canary_validation_error_keeps_array_input(self, mock_encdec):
+        """A ValueError that WAV input hits too (bad language pair) doesn't switch to WAV for good."""
+        from faster_whisper_hotkey.models import ModelWrapper
+
+        def _transcribe(audio, source_lang, target_lang, **kwargs):
+            if target_lang == "xx":
+                raise ValueError("unsupported target language 'xx'")
+            return [MagicMock(text="text")]
+
+        mock_model = MagicMock()
+        mock_model.transcribe.side_effect = _transcribe
+        mock_encdec.from_pretrained.return_value = mock_model.eval.return_value = mock_model
+        wrapper = ModelWrapper(MockSettings(model_type="canary", model_name="nvidia/canary-1b-v2", device="cuda"))
+
+        assert wrapper.transcribe(self.sample_audio, 16000, language="en-xx") == ""
+        assert wrapper.transcribe(self.sample_audio, 16000, language="en-de") == "text"
+
+        (audio,) = mock_model.transcribe.call_args.kwargs["audio"]
+        assert audio is self.sample_audio
+
+    def test_memfd_wavs_leave_no_files(self, tmp_path, monkeypatch):
+        import soundfile as sf
+
+        from faster_whisper_hotkey.models import _memfd_wavs
+
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        audio = np.linspace(-1, 1, 1600, dtype=np.float32)
+        with _memfd_wavs([audio], 16000) as (path,):
+            data, rate = sf.read(path, dtype="float32")
+
+        assert rate == 16000
+        np.testing.assert_array_equal(data, audio)
+        assert list(tmp_path.iterdir()) == []
+
+    @patch("faster_whisper_hotkey.models.AutoProcessor")
+    @patch("faster_whisper_hotkey.models.VoxtralForConditionalGeneration")
+    def test_voxtral_gets_the_array(self, mock_voxtral, mock_processor):
+        """The transcription request is built from the samples, not a temp file."""
+        from faster_whisper_hotkey.models import ModelWrapper
+
+        mock_model = MagicMock()
+        mock_voxtral.from_pretrained.return_value = mock_model.eval.return_value = mock_model
+        processor = mock_processor.from_pretrained.return_value
+        processor.batch_decode.return_value = ["voxtral output"]
+        wrapper = ModelWrapper(
+            MockSettings(model_type="voxtral", model_name="mistralai/Voxtral-Mini-3B-2507", device="cuda")
+        )
+
+        assert wrapper.transcribe(self.sample_audio, 16000) == "voxtral output"
+
+        kwargs = processor.apply_transcription_request.call_args.kwargs
+        assert kwargs["audio"] is self.sample_audio
+        assert kwargs["sampling_rate"] == 16000
+
     @patch("faster_whisper_hotkey.models.EncDecMultiTaskModel")
     def test_transcribe_canary_invalid_language(self, mock_encdec):
         """Test canary transcription with invalid language format defaults to en-en."""
@@ -378,13 +521,13 @@ class TestModelWrapperTranscribe:
         wrapper = ModelWrapper(settings)
 
         with patch.object(
-            wrapper, "_transcribe_voxtral", return_value="voxtral output"
+            wrapper.backend, "transcribe", return_value="voxtral output"
         ):
             short_audio = np.random.randn(48000).astype(np.float32)  # 3 seconds
             result = wrapper.transcribe(short_audio, 16000)
 
             assert result == "voxtral output"
-            wrapper._transcribe_voxtral.assert_called_once()
+            wrapper.backend.transcribe.assert_called_once()
 
     @patch("faster_whisper_hotkey.models.AutoProcessor")
     @patch("faster_whisper_hotkey.models.VoxtralForConditionalGeneration")
@@ -409,8 +552,8 @@ class TestModelWrapperTranscribe:
         wrapper = ModelWrapper(settings)
 
         with patch.object(
-            wrapper,
-            "_transcribe_voxtral",
+            wrapper.backend,
+            "transcribe",
             return_value="long audio transcription result",
         ):
             long_audio = np.random.randn(1000000).astype(np.float32)  # ~62 seconds
@@ -419,7 +562,7 @@ class TestModelWrapperTranscribe:
 
             assert result == "long audio transcription result"
             # Single call - native chunking handles long audio internally
-            wrapper._transcribe_voxtral.assert_called_once()
+            wrapper.backend.transcribe.assert_called_once()
 
     @patch("faster_whisper_hotkey.models.AutoProcessor")
     @patch("faster_whisper_hotkey.models.CohereAsrForConditionalGeneration")
@@ -448,8 +591,8 @@ class TestModelWrapperTranscribe:
         wrapper = ModelWrapper(settings)
 
         with patch.object(
-            wrapper,
-            "_transcribe_cohere",
+            wrapper.backend,
+            "transcribe",
             return_value="cohere transcription",
         ):
             result = wrapper.transcribe(self.sample_audio, 16000)
@@ -563,3 +706,194 @@ class TestModelWrapperTranscribe:
 
         # Should return empty string on error
         assert result == ""
+
+
+class TestLazyBackendImports:
+    """Test that heavy backend dependencies are only imported on demand."""
+
+    def test_whisper_only_process_never_imports_nemo_or_transformers(self):
+        """A whisper load + transcribe must not pull NeMo or transformers into sys.modules."""
+        import os
+        import subprocess
+        import sys
+
+        script = (
+            "import sys\n"
+            "from unittest.mock import patch\n"
+            "import numpy as np\n"
+            "from faster_whisper_hotkey.models import ModelWrapper\n"
+            "from faster_whisper_hotkey.settings import Settings\n"
+            "settings = Settings(device_name='d', model_type='whisper', model_name='tiny',\n"
+            "                    compute_type='int8', device='cpu', language='en')\n"
+            "with patch('faster_whisper_hotkey.models.WhisperModel') as mock_whisper:\n"
+            "    mock_whisper.return_value.transcribe.return_value = ([], None)\n"
+            "    ModelWrapper(settings).transcribe(np.zeros(16000, dtype=np.float32))\n"
+            "print(','.join(m for m in ('nemo', 'transformers') if m in sys.modules))\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True
+        )
+
+        assert result.stdout.strip() == ""
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        """Names outside the lazy import table still raise AttributeError."""
+        from faster_whisper_hotkey import models
+
+        with pytest.raises(AttributeError):
+            models.NotARealDependency  # noqa: B018
+
+
+class TestBackendRegistry:
+    """Test backend lookup, registration and entry point discovery."""
+
+    def test_builtin_backends_cover_all_model_types(self):
+        """Every model type offered by the UI resolves to a backend."""
+        from faster_whisper_hotkey import models
+
+        with patch.object(models, "_entry_point_backends", return_value=[]):
+            for mt in ("whisper", "parakeet", "canary", "voxtral", "cohere", "granite", "granite-nar"):
+                assert issubclass(models.get_backend_class(mt), models.Backend)
+
+    def test_unknown_model_type_raises(self):
+        """Unknown model types raise ValueError, as before."""
+        from faster_whisper_hotkey.models import ModelWrapper
+
+        settings = MockSettings(model_type="nonexistent", model_name="x", device="cpu")
+
+        with pytest.raises(ValueError, match="Unknown model type"):
+            ModelWrapper(settings)
+
+    def test_registered_backend_overrides_builtin(self):
+        """register_backend takes precedence over the built-in backend."""
+        from faster_whisper_hotkey import models
+
+        class FakeBackend(models.Backend):
+            def load(self):
+                self.model = "loaded"
+
+            def transcribe(self, audio_data, sample_rate, language):
+                return "fake"
+
+        with patch.dict(models._backend_registry, clear=True):
+            models.register_backend("whisper", FakeBackend)
+            wrapper = models.ModelWrapper(
+                MockSettings(model_type="whisper", model_name="x", device="cpu")
+            )
+
+            assert isinstance(wrapper.backend, FakeBackend)
+            assert wrapper.model == "loaded"
+            assert wrapper.transcribe(np.zeros(16000, dtype=np.float32)) == "fake"
+
+    def test_entry_point_backend_is_loaded_lazily(self):
+        """Only the entry point matching the requested model type is imported."""
+        from faster_whisper_hotkey import models
+
+        wanted = MagicMock()
+        wanted.name = "inhouse"
+        other = MagicMock()
+        other.name = "other"
+
+        with (
+            patch.dict(models._backend_registry, clear=True),
+            patch.object(models, "_entry_point_backends", return_value=[other, wanted]),
+        ):
+            backend_class = models.get_backend_class("inhouse")
+
+        assert backend_class is wanted.load.return_value
+        other.load.assert_not_called()
+
+    def test_own_distribution_entry_points_are_ignored(self):
+        """Entry points from this package can't shadow a third-party override."""
+        from types import SimpleNamespace
+
+        from faster_whisper_hotkey import models
+
+        ours = SimpleNamespace(name="whisper", dist=SimpleNamespace(name="faster_whisper_hotkey"))
+        theirs = SimpleNamespace(name="whisper", dist=SimpleNamespace(name="acme-whisper"))
+
+        with patch("importlib.metadata.entry_points", return_value=[ours, theirs]):
+            assert models._entry_point_backends() == [theirs]
+
+    def test_fast_path_result_skips_transcribe(self):
+        """A non-None fast_transcribe result is returned without calling transcribe."""
+        from faster_whisper_hotkey import models
+
+        class FastBackend(models.Backend):
+            def load(self):
+                pass
+
+            def fast_transcribe(self, audio_data, sample_rate, language):
+                return "fast"
+
+            transcribe = MagicMock(return_value="slow")
+
+        with patch.dict(models._backend_registry, {"fast": FastBackend}):
+            wrapper = models.ModelWrapper(MockSettings(model_type="fast", model_name="x", device="cpu"))
+
+            assert wrapper.transcribe(np.zeros(16000, dtype=np.float32)) == "fast"
+            FastBackend.transcribe.assert_not_called()
+
+    def test_transcribe_batch_errors_return_empty_strings(self):
+        """A failing batch yields one empty string per clip."""
+        from faster_whisper_hotkey import models
+
+        class BrokenBackend(models.Backend):
+            def load(self):
+                pass
+
+            def transcribe(self, audio_data, sample_rate, language):
+                raise RuntimeError("boom")
+
+        with patch.dict(models._backend_registry, {"broken": BrokenBackend}):
+            wrapper = models.ModelWrapper(MockSettings(model_type="broken", model_name="x", device="cpu"))
+            clips = [np.zeros(1600, dtype=np.float32)] * 3
+
+            assert wrapper.transcribe_batch(clips) == ["", "", ""]
+
+
+class TestWarmup:
+    """Test the post-load warm-up pass."""
+
+    def _wrapper(self, backend_class):
+        from faster_whisper_hotkey import models
+
+        with patch.dict(models._backend_registry, {"fake": backend_class}):
+            return models.ModelWrapper(MockSettings(model_type="fake", model_name="x", device="cpu"))
+
+    def test_warmup_runs_each_clip_twice(self):
+        """Each synthetic clip is decoded cold and warm, shortest first."""
+        from faster_whisper_hotkey import models
+
+        seen_lengths = []
+
+        class FakeBackend(models.Backend):
+            def load(self):
+                pass
+
+            def transcribe(self, audio_data, sample_rate, language):
+                seen_lengths.append(len(audio_data))
+                return ""
+
+        wrapper = self._wrapper(FakeBackend)
+        report = wrapper.warmup(durations=(1.0, 2.0))
+
+        assert seen_lengths == [16000, 16000, 32000, 32000]
+        assert [duration for duration, _, _ in report] == [1.0, 2.0]
+        assert all(cold >= 0 and warm >= 0 for _, cold, warm in report)
+
+    def test_warmup_failure_is_not_fatal(self):
+        """A backend that cannot warm up is logged and skipped."""
+        from faster_whisper_hotkey import models
+
+        class BrokenBackend(models.Backend):
+            def load(self):
+                pass
+
+            def transcribe(self, audio_data, sample_rate, language):
+                raise RuntimeError("boom")
+
+        wrapper = self._wrapper(BrokenBackend)
+
+        assert wrapper.warmup() == []
@@ -183,7 +183,7 @@ class TestVoxtralNativeChunking:
         wrapper = ModelWrapper(settings)
 
         with patch.object(
-            wrapper, "_transcribe_voxtral", return_value="short audio result"
+            wrapper.backend, "transcribe", return_value="short audio result"
         ):
             short_audio = np.random.randn(48000).astype(np.float32)  # 3s
             result = wrapper.transcribe(short_audio, 16000)
@@ -214,8 +214,8 @@ class TestVoxtralNativeChunking:
         wrapper = ModelWrapper(settings)
 
         with patch.object(
-            wrapper,
-            "_transcribe_voxtral",
+            wrapper.backend,
+            "transcribe",
             return_value="long audio transcription",
         ):
             # 60+ seconds - previously would have been manually chunked
@@ -224,7 +224,7 @@ class TestVoxtralNativeChunking:
 
             assert result == "long audio transcription"
             # Single call - native chunking handles all lengths internally
-            wrapper._transcribe_voxtral.assert_called_once()
+            wrapper.backend.transcribe.assert_called_once()
 
     @patch("faster_whisper_hotkey.models.AutoProcessor")
     @patch("faster_whisper_hotkey.models.VoxtralForConditionalGeneration")
@@ -250,8 +250,8 @@ class TestVoxtralNativeChunking:
         wrapper = ModelWrapper(settings)
 
         with patch.object(
-            wrapper,
-            "_transcribe_voxtral",
+            wrapper.backend,
+            "transcribe",
             side_effect=Exception("Transcription failed"),
         ):
             audio = np.random.randn(480000).astype(np.float32)
@@ -290,7 +290,7 @@ class TestCohereNativeChunking:
         wrapper = ModelWrapper(settings)
 
         with patch.object(
-            wrapper, "_transcribe_cohere", return_value="short audio result"
+            wrapper.backend, "transcribe", return_value="short audio result"
         ):
             short_audio = np.random.randn(480000).astype(np.float32)  # 30s
             result = wrapper.transcribe(short_audio, 16000)
@@ -323,8 +323,8 @@ class TestCohereNativeChunking:
         wrapper = ModelWrapper(settings)
 
         with patch.object(
-            wrapper,
-            "_transcribe_cohere",
+            wrapper.backend,
+            "transcribe",
             return_value="long audio reassembled",
         ):
             long_audio = np.random.randn(960000).astype(np.float32)  # 60s
@@ -358,8 +358,8 @@ class TestCohereNativeChunking:
         wrapper = ModelWrapper(settings)
 
         with patch.object(
-            wrapper,
-            "_transcribe_cohere",
+            wrapper.backend,
+            "transcribe",
             return_value="full ten minutes transcribed",
         ):
             ten_min_audio = np.random.randn(960000).astype(np.float32)  # 10 min at 16kHz
@@ -370,7 +370,7 @@ class TestCohereNativeChunking:
     @patch("faster_whisper_hotkey.models.AutoProcessor")
     @patch("faster_whisper_hotkey.models.CohereAsrForConditionalGeneration")
     def test_cohere_error_handling(self, mock_cohere, mock_processor):
-        """Test that errors in _transcribe_cohere are caught."""
+        """Test that errors in the cohere backend are caught."""
         from faster_whisper_hotkey.models import ModelWrapper
 
         mock_model = MagicMock()
@@ -393,8 +393,8 @@ class TestCohereNativeChunking:
         wrapper = ModelWrapper(settings)
 
         with patch.object(
-            wrapper,
-            "_transcribe_cohere",
+            wrapper.backend,
+            "transcribe",
             side_effect=Exception("transcription failed"),
         ):
             audio = np.random.randn(16000).astype(np.float32)
@@ -540,6 +540,197 @@ class TestWhisperLanguageHandling:
         assert call_kwargs["language"] is None
 
 
+class TestWhisperBatchedInference:
+    """Test the switch to BatchedInferencePipeline for long recordings."""
+
+    @staticmethod
+    def _wrapper(mock_whisper, threshold=None, batch_size=None):
+        from faster_whisper_hotkey.models import ModelWrapper
+
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = ([MagicMock(text=" sequential ")], None)
+        mock_whisper.return_value = mock_model
+        settings = MockSettings(
+            model_type="whisper", model_name="tiny", device="cpu", compute_type="int8", language="en"
+        )
+        if threshold is not None:
+            settings.whisper_batch_threshold = threshold
+        if batch_size is not None:
+            settings.whisper_batch_size = batch_size
+        return ModelWrapper(settings), mock_model
+
+    @patch("faster_whisper_hotkey.models.BatchedInferencePipeline")
+    @patch("faster_whisper_hotkey.models.WhisperModel")
+    def test_short_recording_decodes_sequentially(self, mock_whisper, mock_pipeline):
+        wrapper, mock_model = self._wrapper(mock_whisper)
+
+        assert wrapper.transcribe(np.zeros(16000 * 10, dtype=np.float32), 16000) == "sequential"
+        mock_pipeline.assert_not_called()
+        assert mock_model.transcribe.call_args[1]["beam_size"] == 5
+
+    @patch("faster_whisper_hotkey.models.BatchedInferencePipeline")
+    @patch("faster_whisper_hotkey.models.WhisperModel")
+    def test_long_recording_uses_pipeline(self, mock_whisper, mock_pipeline):
+        """Above the threshold the pipeline wraps the loaded model and gets the batch size."""
+        wrapper, mock_model = self._wrapper(mock_whisper, threshold=30.0, batch_size=16)
+        pipeline = mock_pipeline.return_value
+        pipeline.model = mock_model
+        pipeline.transcribe.return_value = ([MagicMock(text=" one "), MagicMock(text="two")], None)
+
+        text = wrapper.transcribe(np.zeros(16000 * 45, dtype=np.float32), 16000, "en")
+
+        assert text == "one two"
+        mock_pipeline.assert_called_once_with(model=mock_model)
+        kwargs = pipeline.transcribe.call_args[1]
+        assert (kwargs["batch_size"], kwargs["beam_size"], kwargs["language"]) == (16, 5, "en")
+        mock_model.transcribe.assert_not_called()
+
+    @pytest.mark.parametrize("profile", ["fastest", "balanced", "accurate"])
+    @patch("faster_whisper_hotkey.models.BatchedInferencePipeline")
+    @patch("faster_whisper_hotkey.models.WhisperModel")
+    def test_pipeline_gets_the_profile_options(self, mock_whisper, mock_pipeline, profile):
+        """Both paths decode with the same profile options, timestamps included."""
+        wrapper, mock_model = self._wrapper(mock_whisper, threshold=30.0)
+        mock_pipeline.return_value.model = mock_model
+        mock_pipeline.return_value.transcribe.return_value = ([], None)
+
+        wrapper.transcribe(np.zeros(16000 * 10, dtype=np.float32), 16000, "en", profile=profile)
+        wrapper.transcribe(np.zeros(16000 * 45, dtype=np.float32), 16000, "en", profile=profile)
+
+        sequential = mock_model.transcribe.call_args[1]
+        batched = dict(mock_pipeline.return_value.transcribe.call_args[1])
+        assert batched.pop("batch_size") == 8
+        assert batched == sequential
+
+    @patch("faster_whisper_hotkey.models.BatchedInferencePipeline")
+    @patch("faster_whisper_hotkey.models.WhisperModel")
+    def test_pipeline_is_reused(self, mock_whisper, mock_pipeline):
+        wrapper, mock_model = self._wrapper(mock_whisper, threshold=1.0)
+        mock_pipeline.return_value.model = mock_model
+        mock_pipeline.return_value.transcribe.return_value = ([], None)
+        audio = np.zeros(16000 * 2, dtype=np.float32)
+
+        wrapper.transcribe(audio, 16000)
+        wrapper.transcribe(audio, 16000)
+
+        mock_pipeline.assert_called_once()
+
+    @patch("faster_whisper_hotkey.models.BatchedInferencePipeline")
+    @patch("faster_whisper_hotkey.models.WhisperModel")
+    def test_zero_threshold_disables_batching(self, mock_whisper, mock_pipeline):
+        wrapper, mock_model = self._wrapper(mock_whisper, threshold=0.0)
+
+        wrapper.transcribe(np.zeros(16000 * 600, dtype=np.float32), 16000)
+
+        mock_pipeline.assert_not_called()
+        mock_model.transcribe.assert_called_once()
+
+
+class TestDecodingProfiles:
+    """Test mapping decoding profiles onto backend knobs."""
+
+    @staticmethod
+    def _whisper(mock_whisper, profile=None):
+        from faster_whisper_hotkey.models import ModelWrapper
+
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = ([], None)
+        mock_whisper.return_value = mock_model
+        settings = MockSettings(model_type="whisper", model_name="tiny", device="cpu", compute_type="int8")
+        if profile is not None:
+            settings.decoding_profile = profile
+        return ModelWrapper(settings), mock_model
+
+    @patch("faster_whisper_hotkey.models.WhisperModel")
+    def test_balanced_is_the_default(self, mock_whisper):
+        """Without a profile setting whisper decodes as it always did."""
+        from faster_whisper_hotkey.models import FALLBACK_TEMPERATURES
+
+        wrapper, mock_model = self._whisper(mock_whisper)
+        wrapper.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+
+        kwargs = mock_model.transcribe.call_args[1]
+        assert kwargs["beam_size"] == 5
+        assert kwargs["temperature"] == FALLBACK_TEMPERATURES
+        assert (kwargs["without_timestamps"], kwargs["condition_on_previous_text"]) == (False, False)
+
+    @patch("faster_whisper_hotkey.models.WhisperModel")
+    def test_fastest_whisper_is_greedy(self, mock_whisper):
+        wrapper, mock_model = self._whisper(mock_whisper, "fastest")
+        wrapper.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+
+        kwargs = mock_model.transcribe.call_args[1]
+        assert (kwargs["beam_size"], kwargs["temperature"], kwargs["without_timestamps"]) == (1, 0.0, True)
+
+    @patch("faster_whisper_hotkey.models.WhisperModel")
+    def test_per_call_profile_is_restored(self, mock_whisper):
+        """A profile passed to transcribe applies to that call only."""
+        wrapper, mock_model = self._whisper(mock_whisper)
+        audio = np.zeros(16000, dtype=np.float32)
+
+        wrapper.transcribe(audio, 16000, profile="fastest")
+        assert mock_model.transcribe.call_args[1]["beam_size"] == 1
+        wrapper.transcribe(audio, 16000)
+        assert mock_model.transcribe.call_args[1]["beam_size"] == 5
+
+    @patch("faster_whisper_hotkey.models.AutoProcessor")
+    @patch("faster_whisper_hotkey.models.CohereAsrForConditionalGeneration")
+    def test_generate_gets_beams_and_token_cap(self, mock_cohere, mock_processor):
+        from faster_whisper_hotkey.models import ModelWrapper
+
+        mock_model = MagicMock()
+        mock_cohere.from_pretrained.return_value = mock_model.to.return_value = mock_model
+        mock_model.eval.return_value = mock_model
+        mock_proc_instance = MagicMock()
+        mock_proc_instance.decode.return_value = ["result"]
+        mock_proc_instance.return_value.to.return_value = {}
+        mock_processor.from_pretrained.return_value = mock_proc_instance
+        settings = MockSettings(model_type="cohere", model_name="c", device="cuda", language="en")
+        wrapper = ModelWrapper(settings)
+        audio = np.zeros(16000 * 2, dtype=np.float32)
+
+        wrapper.transcribe(audio, 16000, profile="accurate")
+        assert mock_model.generate.call_args[1] == {"max_new_tokens": 256, "num_beams": 4}
+        wrapper.transcribe(audio, 16000, profile="fastest")
+        assert mock_model.generate.call_args[1]["max_new_tokens"] < 256
+
+    @pytest.mark.parametrize(
+        ("profile", "generated", "message"),
+        [
+            ("fastest", 48, "decoding profile's 48-token cap"),
+            ("balanced", 256, "256-token limit"),
+            ("fastest", 47, None),
+        ],
+    )
+    @patch("faster_whisper_hotkey.models.AutoProcessor")
+    @patch("faster_whisper_hotkey.models.CohereAsrForConditionalGeneration")
+    def test_hitting_the_token_cap_warns(
+        self, mock_cohere, mock_processor, profile, generated, message, caplog
+    ):
+        """Generation that stops at max_new_tokens is reported as likely truncated."""
+        from faster_whisper_hotkey.models import ModelWrapper
+
+        mock_model = MagicMock()
+        mock_cohere.from_pretrained.return_value = mock_model.to.return_value = mock_model
+        mock_model.eval.return_value = mock_model
+        mock_model.generate.return_value = np.zeros((1, generated), dtype=np.int64)
+        mock_proc_instance = MagicMock()
+        mock_proc_instance.decode.return_value = ["result"]
+        mock_proc_instance.return_value.to.return_value = {}
+        mock_processor.from_pretrained.return_value = mock_proc_instance
+        settings = MockSettings(model_type="cohere", model_name="c", device="cuda", language="en")
+        wrapper = ModelWrapper(settings)
+
+        with caplog.at_level("WARNING"):
+            # 2 s of audio: the fastest profile allows 32 + 8 * 2 tokens
+            assert wrapper.transcribe(np.zeros(16000 * 2, dtype=np.float32), 16000, profile=profile) == "result"
+
+        if message is None:
+            assert "cut short" not in caplog.text
+        else:
+            assert message in caplog.text
+
+
 class TestTranscriptionOutputHandling:
     """Test transcription output formatting and edge cases."""
 
@@ -758,7 +949,7 @@ class TestCohereTranscription:
         wrapper = ModelWrapper(settings)
         sample_audio = np.random.randn(16000).astype(np.float32)
 
-        with patch.object(wrapper, "_transcribe_cohere", return_value=""):
+        with patch.object(wrapper.backend, "transcribe", return_value=""):
             result = wrapper.transcribe(sample_audio, 16000)
 
         assert result == ""
@@ -925,3 +1116,364 @@ class TestGraniteTranscription:
         result = wrapper.transcribe(sample_audio, 16000)
 
         assert result == ""
+
+
+class TestMaterializeWeights:
+    """Test the weight materialization strategies."""
+
+    def _model(self):
+        import torch
+
+        torch.manual_seed(0)
+        model = torch.nn.Sequential(torch.nn.Linear(8, 8), torch.nn.BatchNorm1d(8), torch.nn.Linear(8, 8))
+        # Tie the last layer to the first, like embedding/lm_head tying
+        model[2].weight = model[0].weight
+        return model.eval()
+
+    @pytest.mark.parametrize("strategy", ["clone", "module", "prefetch"])
+    def test_strategies_preserve_outputs(self, strategy):
+        """Every strategy leaves the model computing the same thing."""
+        import torch
+
+        from faster_whisper_hotkey.models import _materialize_weights
+
+        model = self._model()
+        x = torch.randn(4, 8)
+        expected = model(x)
+
+        _materialize_weights(model, strategy)
+
+        torch.testing.assert_close(model(x), expected)
+
+    def test_module_strategy_copies_and_keeps_ties(self):
+        """'module' moves every tensor to new storage and keeps tied weights tied."""
+        from faster_whisper_hotkey.models import _materialize_weights
+
+        model = self._model()
+        before = {name: t.data_ptr() for name, t in model.state_dict(keep_vars=True).items()}
+
+        _materialize_weights(model, "module")
+
+        after = {name: t.data_ptr() for name, t in model.state_dict(keep_vars=True).items()}
+        assert all(before[name] != after[name] for name in before if before[name])
+        assert model[2].weight is model[0].weight
+
+    def test_prefetch_strategy_keeps_storage(self):
+        """'prefetch' doesn't copy anything."""
+        from faster_whisper_hotkey.models import _materialize_weights
+
+        model = self._model()
+        before = [p.data_ptr() for p in model.parameters()]
+
+        _materialize_weights(model, "prefetch")
+
+        assert [p.data_ptr() for p in model.parameters()] == before
+
+    def test_unknown_strategy_falls_back_to_module(self):
+        """An unknown strategy name is logged and treated as 'module'."""
+        from faster_whisper_hotkey.models import _materialize_weights
+
+        model = self._model()
+        before = model[0].weight.data_ptr()
+
+        _materialize_weights(model, "bogus")
+
+        assert model[0].weight.data_ptr() != before
+
+    def test_dontneed_skips_anonymous_memory(self):
+        """DONTNEED is never issued on anonymous (non file-backed) memory."""
+        import torch
+
+        from faster_whisper_hotkey.models import _MADV_DONTNEED, _madvise_tensor
+
+        tensor = torch.ones(1 << 16)
+
+        assert _madvise_tensor(tensor, _MADV_DONTNEED, file_backed=[]) is False
+        assert bool(tensor.eq(1).all())
+
+
+class _FakePreprocessor:
+    """Centred-window 'STFT': frame t sums the samples within n_fft/2 of t * hop."""
+
+    def __init__(self, hop=160, n_fft=512):
+        from types import SimpleNamespace
+
+        self.featurizer = SimpleNamespace(hop_length=hop, n_fft=n_fft)
+
+    def __call__(self, input_signal, length):
+        import torch
+
+        hop, pad = self.featurizer.hop_length, self.featurizer.n_fft // 2
+        n_frames = int(length[0]) // hop + 1
+        audio = input_signal[0]
+        frames = [audio[max(0, t * hop - pad) : t * hop + pad].sum() for t in range(n_frames)]
+        return torch.stack(frames).reshape(1, 1, -1), torch.tensor([n_frames])
+
+
+class _FakeCacheAwareModel:
+    """Stand-in for a cache-aware FastConformer that records each stream step."""
+
+    def __init__(self):
+        from types import SimpleNamespace
+
+        import torch
+
+        self.encoder = SimpleNamespace(
+            att_context_style="chunked_limited",
+            streaming_cfg=SimpleNamespace(
+                chunk_size=[9, 16], shift_size=[9, 16], pre_encode_cache_size=[0, 9], drop_extra_pre_encoded=2
+            ),
+            get_initial_cache_state=lambda batch_size: (torch.zeros(1), torch.zeros(1), torch.zeros(1)),
+        )
+        self.preprocessor = _FakePreprocessor()
+        self.calls = []
+
+    def parameters(self):
+        import torch
+
+        return iter([torch.zeros(1)])
+
+    def conformer_stream_step(self, **kwargs):
+        self.calls.append(kwargs)
+        n = len(self.calls)
+        cache = kwargs["cache_last_channel"] + 1
+        return (f"pred{n}", [f"{n} chunks"], cache, kwargs["cache_last_time"], kwargs["cache_last_channel_len"], f"hyp{n}")
+
+
+class TestParakeetCacheAwareStreaming:
+    """Test chunked, cache-aware parakeet decoding."""
+
+    @staticmethod
+    def _audio(seconds=1.3):
+        return np.random.default_rng(0).standard_normal(int(16000 * seconds)).astype(np.float32)
+
+    def _stream(self):
+        from faster_whisper_hotkey.models import _NemoCacheAwareStream
+
+        model = _FakeCacheAwareModel()
+        return model, _NemoCacheAwareStream(model)
+
+    def test_every_frame_encoded_once_and_matches_one_shot_features(self):
+        """Features built from arbitrary blocks equal those of the whole utterance."""
+        import torch
+
+        model, stream = self._stream()
+        audio = self._audio()
+        for start in range(0, audio.size, 2777):
+            stream.feed(audio[start : start + 2777])
+        stream.finish()
+
+        expected, _ = model.preprocessor(torch.from_numpy(audio).unsqueeze(0), torch.tensor([audio.size]))
+        first, *rest = model.calls
+        encoded = [first["processed_signal"]] + [call["processed_signal"][:, :, 9:] for call in rest]
+        torch.testing.assert_close(torch.cat(encoded, dim=-1), expected)
+
+    def test_pre_encode_context_is_the_preceding_frames(self):
+        import torch
+
+        model, stream = self._stream()
+        stream.feed(self._audio())
+        stream.finish()
+
+        first, second = model.calls[:2]
+        torch.testing.assert_close(second["processed_signal"][:, :, :9], first["processed_signal"])
+
+    def test_state_carries_across_chunks(self):
+        model, stream = self._stream()
+        stream.feed(self._audio())
+        stream.finish()
+
+        first, second, *_ = model.calls
+        assert first["previous_hypotheses"] is None
+        assert second["previous_hypotheses"] == "hyp1"
+        assert second["previous_pred_out"] == "pred1"
+        assert float(second["cache_last_channel"][0]) == 1.0
+        assert (first["drop_extra_pre_encoded"], second["drop_extra_pre_encoded"]) == (0, 2)
+
+    def test_only_full_chunks_before_finish(self):
+        """Feeding waits for whole chunks; finish flushes the rest with keep_all_outputs."""
+        model, stream = self._stream()
+
+        stream.feed(self._audio(0.05))
+        assert model.calls == []
+
+        stream.feed(self._audio(1.0))
+        fed = len(model.calls)
+        assert fed > 0
+        assert not any(call["keep_all_outputs"] for call in model.calls)
+
+        text = stream.finish()
+        assert len(model.calls) > fed
+        assert [call["keep_all_outputs"] for call in model.calls[fed:]][-1] is True
+        assert text == f"{len(model.calls)} chunks"
+
+    def test_backend_detects_cache_aware_checkpoints(self):
+        from faster_whisper_hotkey.models import ParakeetBackend, _NemoCacheAwareStream
+
+        backend = ParakeetBackend(MockSettings(model_type="parakeet", model_name="x", device="cpu"))
+        backend.model = _FakeCacheAwareModel()
+        backend._detect_streaming()
+
+        assert "streaming" in backend.capabilities
+        assert isinstance(backend.open_stream(16000, None), _NemoCacheAwareStream)
+
+    @patch("faster_whisper_hotkey.models.ASRModel")
+    def test_offline_parakeet_does_not_stream(self, mock_asr):
+        from faster_whisper_hotkey.models import ModelWrapper
+
+        mock_asr.from_pretrained.return_value.eval.return_value.encoder.att_context_style = "regular"
+        wrapper = ModelWrapper(MockSettings(model_type="parakeet", model_name="x", device="cpu"))
+
+        assert "streaming" not in wrapper.capabilities
+        assert wrapper.open_stream() is None
+
+
+class _FakeRnntDecoding:
+    def rnnt_decoder_predictions_tensor(self, encoder_output, encoded_lengths):
+        from types import SimpleNamespace
+
+        return [SimpleNamespace(text=f"{int(encoded_lengths[0])} frames")]
+
+
+class _FakeParakeetModel:
+    """Preprocessor, encoder and RNNT decoding a direct-tensor decode can run."""
+
+    def __init__(self, decoding=None):
+        self.preprocessor = _FakePreprocessor()
+        self.preprocessor.featurizer.dither = 1e-5
+        self.preprocessor.featurizer.pad_to = 16
+        self.decoding = decoding if decoding is not None else _FakeRnntDecoding()
+        self.transcribe = MagicMock(return_value=[MagicMock(text="via transcribe")])
+
+    def eval(self):
+        return self
+
+    def encoder(self, audio_signal, length):
+        return audio_signal, length
+
+
+class _FakeCanaryDecoding:
+    def decode_predictions_tensor(self, encoder_hidden_states, encoder_input_mask, decoder_input_ids, **kwargs):
+        from types import SimpleNamespace
+
+        return [SimpleNamespace(text=f" prompt {decoder_input_ids[0].tolist()} ")]
+
+
+_CANARY_LANG_IDS = {"en": 1, "de": 2, "fr": 3}
+
+
+class _FakeCanaryModel:
+    """transcribe() builds a per-language prompt and hands it to the decoding strategy."""
+
+    def __init__(self):
+        self.preprocessor = _FakePreprocessor()
+        self.prompt = object()
+        self.decoding = _FakeCanaryDecoding()
+        self.transcribe_calls = 0
+        self.forward_calls = 0
+
+    def eval(self):
+        return self
+
+    def transcribe(self, audio, source_lang, target_lang, batch_size):
+        import torch
+
+        self.transcribe_calls += 1
+        prompt = torch.tensor([[0, _CANARY_LANG_IDS[source_lang], _CANARY_LANG_IDS[target_lang]]] * len(audio))
+        return self.decoding.decode_predictions_tensor(None, None, decoder_input_ids=prompt)
+
+    def forward(self, input_signal, input_signal_length):
+        import torch
+
+        self.forward_calls += 1
+        return None, None, torch.zeros(1, 4, 8), torch.ones(1, 4)
+
+
+class TestNemoDirectTensorPath:
+    """Test decoding NeMo clips without transcribe()'s dataloader."""
+
+    audio = np.zeros(16000 * 2, dtype=np.float32)
+
+    @staticmethod
+    def _wrapper(model_type, model):
+        from faster_whisper_hotkey.models import ModelWrapper
+
+        target = "ASRModel" if model_type == "parakeet" else "EncDecMultiTaskModel"
+        with patch(f"faster_whisper_hotkey.models.{target}") as mock_class:
+            mock_class.from_pretrained.return_value = model
+            return ModelWrapper(MockSettings(model_type=model_type, model_name="m", device="cpu"))
+
+    def test_parakeet_decodes_the_tensor_directly(self):
+        model = _FakeParakeetModel()
+        wrapper = self._wrapper("parakeet", model)
+
+        assert wrapper.transcribe(self.audio, 16000) == "201 frames"
+        model.transcribe.assert_not_called()
+        featurizer = model.preprocessor.featurizer
+        assert (featurizer.dither, featurizer.pad_to) == (0.0, 0)
+
+    def test_parakeet_failure_falls_back_for_good(self):
+        decoding = MagicMock(spec=["rnnt_decoder_predictions_tensor"])
+        decoding.rnnt_decoder_predictions_tensor.side_effect = RuntimeError("unsupported")
+        model = _FakeParakeetModel(decoding)
+        wrapper = self._wrapper("parakeet", model)
+
+        assert wrapper.transcribe(self.audio, 16000) == "via transcribe"
+        assert wrapper.transcribe(self.audio, 16000) == "via transcribe"
+        assert decoding.rnnt_decoder_predictions_tensor.call_count == 1
+
+    def test_unknown_decoding_uses_transcribe(self):
+        model = _FakeParakeetModel(decoding=object())
+        wrapper = self._wrapper("parakeet", model)
+
+        assert wrapper.backend.fast_transcribe(self.audio, 16000, None) is None
+        assert wrapper.transcribe(self.audio, 16000) == "via transcribe"
+
+    def test_canary_reuses_the_prompt_transcribe_built(self):
+        """The first clip per language pair records the prompt; later ones skip transcribe()."""
+        model = _FakeCanaryModel()
+        wrapper = self._wrapper("canary", model)
+
+        first = wrapper.transcribe(self.audio, 16000, language="en-de")
+        second = wrapper.transcribe(self.audio, 16000, language="en-de")
+
+        assert first == second == "prompt [0, 1, 2]"
+        assert (model.transcribe_calls, model.forward_calls) == (1, 1)
+        assert "decode_predictions_tensor" not in vars(model.decoding)
+
+    def test_canary_new_language_pair_goes_through_transcribe(self):
+        model = _FakeCanaryModel()
+        wrapper = self._wrapper("canary", model)
+        wrapper.transcribe(self.audio, 16000, language="en-de")
+
+        assert wrapper.transcribe(self.audio, 16000, language="fr-en") == "prompt [0, 3, 1]"
+        assert wrapper.transcribe(self.audio, 16000, language="fr-en") == "prompt [0, 3, 1]"
+        assert (model.transcribe_calls, model.forward_calls) == (2, 1)
+
+    def test_half_precision_model_gets_matching_input(self):
+        """float16/bfloat16 compute types get input of the parameter dtype, not float32."""
+        import torch
+
+        seen = []
+        model = _FakeParakeetModel()
+        model.parameters = lambda: iter([torch.zeros(1, dtype=torch.bfloat16)])
+        preprocess = model.preprocessor
+
+        def preprocessor(input_signal, length):
+            seen.append(input_signal.dtype)
+            return preprocess(input_signal.float(), length)
+
+        model.preprocessor = MagicMock(side_effect=preprocessor, featurizer=preprocess.featurizer)
+        wrapper = self._wrapper("parakeet", model)
+
+        assert wrapper.transcribe(self.audio, 16000) == "201 frames"
+        assert seen == [torch.bfloat16]
+
+    def test_warmup_goes_through_the_fast_path(self):
+        """Warm-up exercises the direct-tensor path real utterances take."""
+        model = _FakeParakeetModel()
+        wrapper = self._wrapper("parakeet", model)
+
+        wrapper.warmup(durations=(1.0,))
+
+        model.transcribe.assert_not_called()
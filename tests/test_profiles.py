@@ -0,0 +1,37 @@
+"""Tests for profiles.py (named decoding profiles)."""
+
+from faster_whisper_hotkey.profiles import DECODING_PROFILES, DEFAULT_PROFILE, get_profile
+
+
+class TestGetProfile:
+    """Test profile lookup."""
+
+    def test_names_are_case_insensitive(self):
+        assert get_profile("Fastest") is DECODING_PROFILES["fastest"]
+
+    def test_missing_name_is_the_default(self):
+        assert get_profile(None) is DECODING_PROFILES[DEFAULT_PROFILE]
+        assert get_profile("") is DECODING_PROFILES[DEFAULT_PROFILE]
+
+    def test_unknown_name_falls_back(self, caplog):
+        assert get_profile("turbo") is DECODING_PROFILES[DEFAULT_PROFILE]
+        assert "Unknown decoding profile 'turbo'" in caplog.text
+
+    def test_profiles_are_ordered_by_cost(self):
+        fastest, balanced, accurate = (DECODING_PROFILES[name] for name in ("fastest", "balanced", "accurate"))
+        assert fastest.beam_size < balanced.beam_size <= accurate.beam_size
+        assert fastest.num_beams <= balanced.num_beams < accurate.num_beams
+
+
+class TestTokenCap:
+    """Test the per-duration generate() token cap."""
+
+    def test_fixed_cap_without_rate(self):
+        assert DECODING_PROFILES["balanced"].max_new_tokens(400, 3.0) == 400
+
+    def test_cap_scales_with_duration(self):
+        fastest = DECODING_PROFILES["fastest"]
+        assert fastest.max_new_tokens(400, 2.0) < fastest.max_new_tokens(400, 10.0)
+
+    def test_cap_never_exceeds_the_backend_cap(self):
+        assert DECODING_PROFILES["fastest"].max_new_tokens(256, 600.0) == 256
@@ -119,6 +119,26 @@ class TestLoadSettings:
 
         assert settings.hotkey == "f4"
 
+    def test_load_settings_ignores_dropped_longform_workers(self, tmp_path):
+        test_file = str(tmp_path / "test_settings.json")
+        test_data = {
+            "device_name": "test_device",
+            "model_type": "granite",
+            "model_name": "ibm-granite/granite-speech-3.3-2b",
+            "compute_type": "float32",
+            "device": "cpu",
+            "language": "en",
+            "longform_workers": 4,
+        }
+        with open(test_file, "w") as f:
+            json.dump(test_data, f)
+
+        with patch("faster_whisper_hotkey.settings.SETTINGS_FILE", test_file):
+            settings = load_settings()
+
+        assert settings.model_type == "granite"
+        assert not hasattr(settings, "longform_workers")
+
     def test_load_settings_not_found(self):
         with patch(
             "faster_whisper_hotkey.settings.SETTINGS_FILE",
@@ -0,0 +1,301 @@
+"""Tests for snapshot_cache.py and its use in ModelWrapper."""
+
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from faster_whisper_hotkey.snapshot_cache import SnapshotCache, snapshot_key
+
+
+class MockSettings:
+    def __init__(self, model_type="parakeet", model_name="nvidia/parakeet-tdt-0.6b-v3",
+                 device="cpu", compute_type="float32", snapshot_cache=True, weight_materialization="module"):
+        self.model_type = model_type
+        self.model_name = model_name
+        self.device = device
+        self.compute_type = compute_type
+        self.language = "en"
+        self.snapshot_cache = snapshot_cache
+        self.weight_materialization = weight_materialization
+
+
+class TestSnapshotKey:
+    """Test cache keys and invalidation."""
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [("model_name", "other/model"), ("device", "cuda"), ("compute_type", "bfloat16")],
+    )
+    def test_key_fields_change_path(self, tmp_path, field, value):
+        """Changing any settings field in the key selects a different entry."""
+        base = SnapshotCache(MockSettings(), str(tmp_path))
+        changed = SnapshotCache(MockSettings(**{field: value}), str(tmp_path))
+
+        assert base.path != changed.path
+
+    def test_library_version_changes_path(self, tmp_path):
+        """A library upgrade is a cache miss."""
+        base = SnapshotCache(MockSettings(), str(tmp_path))
+        with patch("faster_whisper_hotkey.snapshot_cache._dist_version", return_value="999.0"):
+            upgraded = SnapshotCache(MockSettings(), str(tmp_path))
+
+        assert base.path != upgraded.path
+
+    def test_key_records_versions(self):
+        """The key lists the versions of the libraries that build the module."""
+        key = snapshot_key(MockSettings())
+
+        assert {"torch", "transformers", "nemo-toolkit"} <= set(key["versions"])
+
+
+class TestSnapshotFiles:
+    """Test saving, pruning and invalidation on disk."""
+
+    def _write_entry(self, cache):
+        os.makedirs(cache.cache_dir, exist_ok=True)
+        open(cache.path, "wb").close()
+        with open(cache.meta_path, "w") as f:
+            json.dump(cache.key, f)
+
+    def test_save_writes_snapshot_and_prunes_stale(self, tmp_path):
+        """Saving removes entries for the same model built with other versions."""
+        with patch("faster_whisper_hotkey.snapshot_cache._dist_version", return_value="1.0"):
+            stale = SnapshotCache(MockSettings(), str(tmp_path))
+        other_model = SnapshotCache(MockSettings(model_name="other/model"), str(tmp_path))
+        self._write_entry(stale)
+        self._write_entry(other_model)
+
+        fake_torch = MagicMock()
+        fake_torch.save.side_effect = lambda model, path: open(path, "wb").close()
+        current = SnapshotCache(MockSettings(), str(tmp_path))
+        with patch.dict("sys.modules", {"torch": fake_torch}):
+            current.save(MagicMock())
+
+        assert current.exists()
+        assert not stale.exists()
+        assert other_model.exists()
+
+    def test_failed_save_leaves_no_partial_file(self, tmp_path):
+        """A failing torch.save doesn't leave a snapshot behind."""
+        fake_torch = MagicMock()
+        fake_torch.save.side_effect = RuntimeError("cannot pickle")
+        cache = SnapshotCache(MockSettings(), str(tmp_path))
+
+        with patch.dict("sys.modules", {"torch": fake_torch}), pytest.raises(RuntimeError):
+            cache.save(MagicMock())
+
+        assert not cache.exists()
+        assert os.listdir(tmp_path) == []
+
+    def test_mark_failed_keeps_only_the_reason(self, tmp_path):
+        """A failed key drops its snapshot and remembers why."""
+        cache = SnapshotCache(MockSettings(), str(tmp_path))
+        self._write_entry(cache)
+
+        cache.mark_failed("save: cannot pickle")
+
+        assert not cache.exists()
+        assert cache.failed() == "save: cannot pickle"
+        assert SnapshotCache(MockSettings(model_name="other/model"), str(tmp_path)).failed() is None
+
+    def test_failure_record_pruned_on_version_change(self, tmp_path):
+        """Upgrading a library gives a failed model another try."""
+        with patch("faster_whisper_hotkey.snapshot_cache._dist_version", return_value="1.0"):
+            old = SnapshotCache(MockSettings(), str(tmp_path))
+        old.mark_failed("restore: boom")
+        current = SnapshotCache(MockSettings(), str(tmp_path))
+
+        assert current.failed() is None
+        current.prune_stale()
+        assert not os.path.exists(old.meta_path)
+
+    def test_save_removes_orphaned_partial_writes(self, tmp_path):
+        """A partial write from a process that died mid-save is cleaned up."""
+        cache = SnapshotCache(MockSettings(), str(tmp_path))
+        orphan = f"{cache.path}.tmp-999999999"
+        open(orphan, "wb").close()
+
+        fake_torch = MagicMock()
+        fake_torch.save.side_effect = lambda model, path: open(path, "wb").close()
+
+        with patch.dict("sys.modules", {"torch": fake_torch}):
+            cache.save(MagicMock())
+
+        assert not os.path.exists(orphan)
+        assert cache.exists()
+
+    def test_load_uses_mmap_on_cpu(self, tmp_path):
+        """CPU snapshots are memory-mapped rather than read into RAM."""
+        fake_torch = MagicMock()
+        cache = SnapshotCache(MockSettings(), str(tmp_path))
+
+        with patch.dict("sys.modules", {"torch": fake_torch}):
+            cache.load("cpu")
+
+        assert fake_torch.load.call_args[1]["mmap"] is True
+
+
+class TestModelWrapperSnapshots:
+    """Test ModelWrapper's use of the snapshot cache."""
+
+    def _backend_class(self):
+        from faster_whisper_hotkey import models
+
+        class FakeBackend(models.Backend):
+            supports_snapshot = True
+            load = MagicMock()
+            load_snapshot = MagicMock()
+
+            def transcribe(self, audio_data, sample_rate, language):
+                return ""
+
+        return FakeBackend
+
+    def test_hit_skips_load(self):
+        """An existing snapshot is restored and the normal load is skipped."""
+        from faster_whisper_hotkey import models
+
+        backend_class = self._backend_class()
+        with (
+            patch.dict(models._backend_registry, {"fake": backend_class}),
+            patch.object(models.SnapshotCache, "exists", return_value=True),
+            patch.object(models.SnapshotCache, "load") as mock_cache_load,
+            patch.object(models, "_materialize_weights"),
+        ):
+            models.ModelWrapper(MockSettings(model_type="fake"))
+
+        backend_class.load.assert_not_called()
+        backend_class.load_snapshot.assert_called_once_with(mock_cache_load.return_value)
+
+    @pytest.mark.parametrize("strategy", ["clone", "module", "prefetch"])
+    def test_hit_materializes_cpu_weights(self, strategy):
+        """A restored CPU snapshot goes through the configured materialization."""
+        from faster_whisper_hotkey import models
+
+        backend_class = self._backend_class()
+        with (
+            patch.dict(models._backend_registry, {"fake": backend_class}),
+            patch.object(models.SnapshotCache, "exists", return_value=True),
+            patch.object(models.SnapshotCache, "load"),
+            patch.object(models, "_materialize_weights") as mock_materialize,
+        ):
+            wrapper = models.ModelWrapper(MockSettings(model_type="fake", weight_materialization=strategy))
+
+        mock_materialize.assert_called_once_with(wrapper.backend.model, strategy)
+
+    def test_hit_on_gpu_skips_materialization(self):
+        """Snapshots restored onto a GPU aren't mmap'd and need no materialization."""
+        from faster_whisper_hotkey import models
+
+        backend_class = self._backend_class()
+        with (
+            patch.dict(models._backend_registry, {"fake": backend_class}),
+            patch.object(models.SnapshotCache, "exists", return_value=True),
+            patch.object(models.SnapshotCache, "load"),
+            patch.object(models, "_materialize_weights") as mock_materialize,
+        ):
+            models.ModelWrapper(MockSettings(model_type="fake", device="cuda"))
+
+        mock_materialize.assert_not_called()
+
+    def test_miss_loads_and_saves(self):
+        """Without a snapshot the model is built normally; saving waits for save_snapshot()."""
+        from faster_whisper_hotkey import models
+
+        backend_class = self._backend_class()
+        with (
+            patch.dict(models._backend_registry, {"fake": backend_class}),
+            patch.object(models.SnapshotCache, "exists", return_value=False),
+            patch.object(models.SnapshotCache, "save") as mock_save,
+        ):
+            wrapper = models.ModelWrapper(MockSettings(model_type="fake"))
+            backend_class.load.assert_called_once()
+            mock_save.assert_not_called()
+
+            wrapper.save_snapshot()
+            wrapper.save_snapshot()
+
+        mock_save.assert_called_once_with(wrapper.backend.model)
+
+    def test_unusable_snapshot_is_not_rebuilt(self):
+        """A snapshot that fails to restore is marked failed; the model loads without saving again."""
+        from faster_whisper_hotkey import models
+
+        backend_class = self._backend_class()
+        with (
+            patch.dict(models._backend_registry, {"fake": backend_class}),
+            patch.object(models.SnapshotCache, "exists", return_value=True),
+            patch.object(models.SnapshotCache, "load", side_effect=ImportError("no module 'remote_code'")),
+            patch.object(models.SnapshotCache, "mark_failed") as mock_mark_failed,
+            patch.object(models.SnapshotCache, "save") as mock_save,
+        ):
+            models.ModelWrapper(MockSettings(model_type="fake")).save_snapshot()
+
+        assert "remote_code" in mock_mark_failed.call_args[0][0]
+        backend_class.load.assert_called_once()
+        mock_save.assert_not_called()
+
+    def test_failed_save_is_not_retried(self, tmp_path):
+        """After a failed save, the next launch loads normally without trying again."""
+        from faster_whisper_hotkey import models
+
+        backend_class = self._backend_class()
+        with (
+            patch.dict(models._backend_registry, {"fake": backend_class}),
+            patch("faster_whisper_hotkey.snapshot_cache.CACHE_DIR", str(tmp_path)),
+            patch.object(models.SnapshotCache, "save", side_effect=TypeError("cannot pickle 'tokenizer'")) as save,
+        ):
+            models.ModelWrapper(MockSettings(model_type="fake")).save_snapshot()
+            models.ModelWrapper(MockSettings(model_type="fake")).save_snapshot()
+
+        save.assert_called_once()
+        assert backend_class.load.call_count == 2
+
+    def test_processor_loads_before_unpickling(self):
+        """trust_remote_code classes are importable by the time torch.load runs."""
+        from faster_whisper_hotkey import models
+
+        calls = []
+        backend_class = self._backend_class()
+        backend_class.load_processor = lambda self: calls.append("processor")
+        with (
+            patch.dict(models._backend_registry, {"fake": backend_class}),
+            patch.object(models.SnapshotCache, "exists", return_value=True),
+            patch.object(models.SnapshotCache, "load", side_effect=lambda device: calls.append("unpickle")),
+            patch.object(models, "_materialize_weights"),
+        ):
+            models.ModelWrapper(MockSettings(model_type="fake"))
+
+        assert calls == ["processor", "unpickle"]
+
+    @pytest.mark.parametrize("compute_type", ["int8", "int4"])
+    def test_quantized_models_are_not_cached(self, compute_type):
+        """bitsandbytes-quantized models always load normally."""
+        from faster_whisper_hotkey import models
+
+        backend_class = self._backend_class()
+        with (
+            patch.dict(models._backend_registry, {"fake": backend_class}),
+            patch.object(models.SnapshotCache, "save") as mock_save,
+        ):
+            models.ModelWrapper(
+                MockSettings(model_type="fake", device="cuda", compute_type=compute_type)
+            ).save_snapshot()
+
+        backend_class.load.assert_called_once()
+        mock_save.assert_not_called()
+
+    def test_disabled_by_default(self):
+        """snapshot_cache=False never touches the cache."""
+        from faster_whisper_hotkey import models
+
+        backend_class = self._backend_class()
+        with (
+            patch.dict(models._backend_registry, {"fake": backend_class}),
+            patch.object(models.SnapshotCache, "exists") as mock_exists,
+        ):
+            models.ModelWrapper(MockSettings(model_type="fake", snapshot_cache=False))
+
+        mock_exists.assert_not_called()
@@ -0,0 +1,87 @@
+"""Tests for startup_profile.py (--profile-startup)."""
+
+import json
+from unittest.mock import patch
+
+from faster_whisper_hotkey import startup_profile
+
+
+class TestPhase:
+    """Test phase recording."""
+
+    def test_disabled_records_nothing(self):
+        """With profiling off, phase() is a no-op."""
+        with patch.object(startup_profile, "ENABLED", False), patch.object(startup_profile, "_phases", []):
+            with startup_profile.phase("noop"):
+                pass
+
+            assert startup_profile.phases() == []
+
+    def test_nested_phases_record_depth(self):
+        """Nested phases are recorded with increasing depth, ordered by start time."""
+        with patch.object(startup_profile, "ENABLED", True), patch.object(startup_profile, "_phases", []):
+            with startup_profile.phase("outer"):
+                with startup_profile.phase("inner"):
+                    sum(range(1000))
+
+            records = startup_profile.phases()
+
+        assert [(p.name, p.depth) for p in records] == [("outer", 0), ("inner", 1)]
+        assert records[0].wall_s >= records[1].wall_s
+        assert all(p.cpu_s >= 0 for p in records)
+
+    def test_phase_recorded_when_block_raises(self):
+        """A phase that raises is still recorded."""
+        with patch.object(startup_profile, "ENABLED", True), patch.object(startup_profile, "_phases", []):
+            try:
+                with startup_profile.phase("boom"):
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+            assert [p.name for p in startup_profile.phases()] == ["boom"]
+
+
+class TestFinish:
+    """Test the report output."""
+
+    def test_table_lists_every_phase(self):
+        """format_table has a header, a rule and one row per phase."""
+        record = startup_profile.Phase("load_settings", "MainThread", 0, 0.1, 0.2, 0.1, 1.5)
+
+        table = startup_profile.format_table([record, record])
+
+        assert len(table.splitlines()) == 4
+        assert "load_settings" in table
+
+    def test_json_report_written(self, tmp_path):
+        """finish() writes the JSON report when a path is configured."""
+        out = tmp_path / "startup.json"
+        with (
+            patch.object(startup_profile, "ENABLED", True),
+            patch.object(startup_profile, "JSON_PATH", str(out)),
+            patch.object(startup_profile, "_phases", []),
+            patch.object(startup_profile, "_finished", False),
+        ):
+            with startup_profile.phase("imports"):
+                pass
+            startup_profile.finish()
+
+        report = json.loads(out.read_text())
+        assert [p["name"] for p in report["phases"]] == ["imports"]
+        assert {"wall_s", "cpu_s", "rss_delta_mb"} <= set(report["phases"][0])
+
+    def test_finish_runs_once(self, tmp_path):
+        """A second finish() call does not rewrite the report."""
+        out = tmp_path / "startup.json"
+        with (
+            patch.object(startup_profile, "ENABLED", True),
+            patch.object(startup_profile, "JSON_PATH", str(out)),
+            patch.object(startup_profile, "_phases", []),
+            patch.object(startup_profile, "_finished", False),
+        ):
+            startup_profile.finish()
+            out.unlink()
+            startup_profile.finish()
+
+        assert not out.exists()
@@ -0,0 +1,324 @@
+"""Tests for streaming.py (decoding while the hotkey is held)."""
+
+import numpy as np
+
+from faster_whisper_hotkey.audio import RingBuffer, to_mono
+from faster_whisper_hotkey.streaming import EncoderStreamSession, StreamingSession
+
+SR = 16000
+
+
+def _voiced(seconds):
+    t = np.arange(int(SR * seconds)) / SR
+    tone = sum(np.sin(2 * np.pi * 140 * k * t) / k for k in range(1, 15))
+    return (0.3 * tone * (0.6 + 0.4 * np.sin(2 * np.pi * 4 * t))).astype(np.float32)
+
+
+def _noise(seconds, seed=0):
+    return (np.random.default_rng(seed).standard_normal(int(SR * seconds)) * 0.003).astype(np.float32)
+
+
+def _session(ring, **kwargs):
+    """Session over `ring` whose decoder returns the clip length and records each clip."""
+    decoded = []
+
+    def decode(audio):
+        decoded.append(audio.size)
+        return f"<{audio.size / SR:.1f}s>"
+
+    session = StreamingSession(
+        read=lambda start, end: to_mono(ring.read(start, end)),
+        write_index=lambda: ring.write_index,
+        decode=decode,
+        start_index=0,
+        sample_rate=SR,
+        **kwargs,
+    )
+    return session, decoded
+
+
+class TestStreamingSession:
+    """Test pause-delimited commits and the tail left for release."""
+
+    def test_window_without_pause_is_only_a_partial(self):
+        ring = RingBuffer(60 * SR)
+        ring.write(_voiced(3) + _noise(3))
+        session, decoded = _session(ring)
+
+        session.step()
+
+        assert session.committed == []
+        assert session.index == 0
+        assert session.partial == "<3.0s>"
+        assert decoded == [3 * SR]
+
+    def test_pause_commits_the_audio_before_it(self):
+        ring = RingBuffer(60 * SR)
+        ring.write(np.concatenate([_voiced(2), _noise(0.6, seed=1), _voiced(1.5)]))
+        session, _ = _session(ring)
+
+        session.step()
+
+        assert len(session.committed) == 1
+        assert 2.0 * SR < session.index < 2.6 * SR
+        assert session.partial == ""
+
+    def test_long_window_is_cut_without_a_pause(self):
+        ring = RingBuffer(60 * SR)
+        ring.write(_voiced(6) + _noise(6))
+        session, _ = _session(ring, max_window=5.0)
+
+        session.step()
+
+        assert len(session.committed) == 1
+        assert 3 * SR <= session.index < 6 * SR
+
+    def test_short_window_is_not_decoded(self):
+        ring = RingBuffer(60 * SR)
+        ring.write(_voiced(0.5))
+        session, decoded = _session(ring)
+
+        session.step()
+
+        assert decoded == []
+
+    def test_finish_returns_only_the_tail(self):
+        """After streaming, release leaves just the audio since the last cut."""
+        ring = RingBuffer(60 * SR)
+        session, _ = _session(ring)
+        pieces = [_voiced(2.5), _noise(0.6, seed=1), _voiced(2.0), _noise(0.6, seed=2), _voiced(1.2)]
+        for piece in pieces:
+            ring.write(piece)
+            session.step()
+
+        session.stop(ring.write_index)
+        committed, tail = session.finish()
+
+        assert len(committed) == 2
+        assert tail.size < 2.0 * SR
+        assert session.index + tail.size == ring.write_index
+
+    def test_background_thread_steps_until_stopped(self):
+        ring = RingBuffer(60 * SR)
+        ring.write(np.concatenate([_voiced(2), _noise(0.6, seed=1), _voiced(1.5)]))
+        session, _ = _session(ring, interval=0.01)
+
+        session.start()
+        for _ in range(200):
+            if session.committed:
+                break
+            session._stop.wait(0.01)
+        session.stop(ring.write_index)
+        committed, _ = session.finish()
+
+        assert len(committed) == 1
+
+    def test_decoder_not_ready_retries_later(self):
+        ring = RingBuffer(60 * SR)
+        ring.write(np.concatenate([_voiced(2), _noise(0.6, seed=1), _voiced(1.5)]))
+        session = StreamingSession(
+            read=lambda start, end: to_mono(ring.read(start, end)),
+            write_index=lambda: ring.write_index,
+            decode=lambda audio: None,
+            start_index=0,
+        )
+
+        session.step()
+
+        assert (session.committed, session.index) == ([], 0)
+
+
+class TestLocalAgreement:
+    """Test emitting words once consecutive decodes agree on them."""
+
+    @staticmethod
+    def _session(ring, hypotheses, accept=True):
+        emitted = []
+        outputs = iter(hypotheses)
+
+        def emit(text):
+            if accept is True or accept():
+                emitted.append(text)
+                return True
+            return False
+
+        session = StreamingSession(
+            read=lambda start, end: to_mono(ring.read(start, end)),
+            write_index=lambda: ring.write_index,
+            decode=lambda audio: next(outputs),
+            start_index=0,
+            emit=emit,
+        )
+        return session, emitted
+
+    def test_agreed_prefix_is_emitted(self):
+        ring = RingBuffer(60 * SR)
+        ring.write(_voiced(3) + _noise(3))
+        session, emitted = self._session(
+            ring, ["hello there", "hello there general", "hello there general kenobi"]
+        )
+
+        session.step()
+        assert emitted == []
+        session.step()
+        session.step()
+
+        assert emitted == ["hello there", " general"]
+
+    def test_disagreement_emits_nothing_new(self):
+        ring = RingBuffer(60 * SR)
+        ring.write(_voiced(3) + _noise(3))
+        session, emitted = self._session(ring, ["hello there", "yellow there"])
+
+        session.step()
+        session.step()
+
+        assert emitted == []
+
+    def test_deferred_words_are_emitted_later(self):
+        ring = RingBuffer(60 * SR)
+        ring.write(_voiced(3) + _noise(3))
+        ready = iter([False, True])
+        session, emitted = self._session(ring, ["a b", "a b c", "a b c d"], accept=lambda: next(ready))
+
+        for _ in range(3):
+            session.step()
+
+        assert emitted == ["a b c"]
+
+    def test_cut_piece_emits_only_unemitted_words(self):
+        """Words already emitted from partials aren't repeated when their piece is cut off."""
+        ring = RingBuffer(60 * SR)
+        ring.write(_voiced(2.5))
+        session, emitted = self._session(ring, ["one two", "one two three", "one two three four"])
+        session.step()
+        session.step()
+        ring.write(np.concatenate([_noise(0.6, seed=1), _voiced(1.5)]))
+
+        session.step()
+
+        assert emitted == ["one two", " three four"]
+        assert session.remainder("five six") == " five six"
+
+    def test_piece_with_more_words_than_the_window_decode(self):
+        """A piece decode that picks up an extra word doesn't repeat emitted words."""
+        ring = RingBuffer(60 * SR)
+        ring.write(_voiced(2.5))
+        session, emitted = self._session(
+            ring, ["hello world how", "hello world how are", "well, hello world how are"]
+        )
+        session.step()
+        session.step()
+        ring.write(np.concatenate([_noise(0.6, seed=1), _voiced(1.5)]))
+
+        session.step()
+
+        assert emitted == ["hello world how", " are"]
+        assert session.remainder("you") == " you"
+
+    def test_piece_with_fewer_words_than_the_window_decode(self):
+        """Final words the piece left out are found in the tail by content, not count."""
+        ring = RingBuffer(60 * SR)
+        ring.write(_voiced(2.5))
+        session, emitted = self._session(ring, ["one two three", "one two three four", "one two"])
+        session.step()
+        session.step()
+        ring.write(np.concatenate([_noise(0.6, seed=1), _voiced(1.5)]))
+
+        session.step()
+
+        assert emitted == ["one two three"]
+        assert session.remainder("uh three four five") == " four five"
+
+    def test_remainder_skips_emitted_words_of_the_tail(self):
+        ring = RingBuffer(60 * SR)
+        ring.write(_voiced(3) + _noise(3))
+        session, _ = self._session(ring, ["hello there", "hello there general"])
+        session.step()
+        session.step()
+
+        assert session.remainder("hello there general kenobi") == " general kenobi"
+
+    def test_without_emit_remainder_is_everything(self):
+        ring = RingBuffer(60 * SR)
+        session, _ = _session(ring)
+        ring.write(np.concatenate([_voiced(2), _noise(0.6, seed=1), _voiced(1.5)]))
+        session.step()
+
+        assert session.remainder("tail words") == "<2.3s> tail words"
+
+
+class _FakeStream:
+    """Backend stream whose text is one word per fed block."""
+
+    def __init__(self, fail=False):
+        self.fed = []
+        self.fail = fail
+
+    def feed(self, audio):
+        if self.fail:
+            raise RuntimeError("boom")
+        self.fed.append(audio.size)
+        return " ".join(f"w{i}" for i in range(len(self.fed)))
+
+    def finish(self, audio):
+        self.fed.append(audio.size)
+        return " ".join(f"w{i}" for i in range(len(self.fed)))
+
+
+class TestEncoderStreamSession:
+    """Test feeding a backend stream as audio is captured."""
+
+    @staticmethod
+    def _session(ring, stream, emit=None):
+        return EncoderStreamSession(
+            read=lambda start, end: to_mono(ring.read(start, end)),
+            write_index=lambda: ring.write_index,
+            stream=stream,
+            start_index=0,
+            emit=emit,
+        )
+
+    def test_each_sample_is_fed_once(self):
+        ring = RingBuffer(60 * SR)
+        stream = _FakeStream()
+        session = self._session(ring, stream)
+        for seconds in (0.5, 1.0, 0.25):
+            ring.write(_voiced(seconds))
+            session.step()
+        session.step()  # nothing new
+        ring.write(_voiced(0.3))
+        session.stop(ring.write_index)
+
+        text = session.finish_text(lambda audio: "unused")
+
+        assert stream.fed == [8000, 16000, 4000, int(0.3 * SR)]
+        assert text == "w0 w1 w2 w3"
+
+    def test_agreed_words_emitted_and_excluded_at_release(self):
+        ring = RingBuffer(60 * SR)
+        emitted = []
+        session = self._session(ring, _FakeStream(), emit=lambda text: emitted.append(text) or True)
+        for _ in range(3):
+            ring.write(_voiced(0.5))
+            session.step()
+        session.stop(ring.write_index)
+
+        text = session.finish_text(lambda audio: "unused")
+
+        assert emitted == ["w0", " w1"]
+        assert text == " w2 w3"
+
+    def test_backend_failure_falls_back_to_decoding_the_recording(self):
+        ring = RingBuffer(60 * SR)
+        session = self._session(ring, _FakeStream(fail=True))
+        ring.write(_voiced(1.0))
+        session.step()
+        session.stop(ring.write_index)
+        decoded = []
+
+        text = session.finish_text(lambda audio: decoded.append(audio.size) or "whole thing")
+
+        assert session.failed
+        assert decoded == [SR]
+        assert text == "whole thing"
@@ -101,3 +101,42 @@ class TestSetupLogging:
         handler = root_logger.handlers[0]
         # Normal mode uses SimpleFormatter which doesn't include %(name)s
         assert hasattr(handler.formatter, "format")
+
+    def test_log_lines_survive_output_suppression_on_another_thread(self):
+        """Lines logged while the loader thread has fd 2 on /dev/null still appear."""
+        import logging
+        import os
+        import tempfile
+        import threading
+
+        from faster_whisper_hotkey.models import suppress_output
+        from faster_whisper_hotkey.transcribe import _setup_logging
+
+        os.environ.pop("FASTER_WHISPER_HOTKEY_DEBUG", None)
+        loading, done = threading.Event(), threading.Event()
+
+        def load():
+            with suppress_output():
+                loading.set()
+                done.wait(5)
+
+        with tempfile.TemporaryFile() as out:
+            saved_fd = os.dup(2)
+            os.dup2(out.fileno(), 2)
+            try:
+                with patch("sys.stderr", open(2, "w", closefd=False)):
+                    _setup_logging()
+                    loader = threading.Thread(target=load)
+                    loader.start()
+                    try:
+                        assert loading.wait(5)
+                        logging.getLogger("faster_whisper_hotkey.transcriber").info("Model is still loading")
+                    finally:
+                        done.set()
+                        loader.join()
+            finally:
+                os.dup2(saved_fd, 2)
+                os.close(saved_fd)
+                _setup_logging()
+            out.seek(0)
+            assert b"INFO:Model is still loading" in out.read()
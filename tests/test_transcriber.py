@@ -0,0 +1,848 @@
+"""Tests for transcriber.py (MicrophoneTranscriber)."""
+
+import threading
+import time
+from unittest.mock import MagicMock, call, patch
+
+import numpy as np
+import pytest
+
+from faster_whisper_hotkey.settings import Settings
+
+
+def _settings(**overrides):
+    values = {
+        "device_name": "test_dev",
+        "model_type": "whisper",
+        "model_name": "small",
+        "compute_type": "int8",
+        "device": "cpu",
+        "language": "en",
+        "hotkey": "pause",
+    }
+    values.update(overrides)
+    return Settings(**values)
+
+
+@pytest.fixture
+def make_transcriber():
+    """Build a MicrophoneTranscriber with the model, keyboard and audio mocked."""
+    patches = [
+        patch("faster_whisper_hotkey.transcriber.keyboard"),
+        patch("faster_whisper_hotkey.transcriber.sd"),
+    ]
+    mocks = [p.start() for p in patches]
+    mock_sd = mocks[1]
+    mock_sd.query_devices.return_value = {"default_samplerate": 16000.0}
+    mock_sd.InputStream.return_value.latency = 0.0
+
+    def _make(model_wrapper_cls=None, **overrides):
+        from faster_whisper_hotkey.transcriber import MicrophoneTranscriber
+
+        model_wrapper_cls = model_wrapper_cls or MagicMock()
+        with patch("faster_whisper_hotkey.transcriber.ModelWrapper", model_wrapper_cls):
+            transcriber = MicrophoneTranscriber(_settings(**overrides))
+            transcriber._model_thread.join(timeout=5)
+        return transcriber
+
+    yield _make
+
+    for p in patches:
+        p.stop()
+
+
+class TestBackgroundModelLoading:
+    """Test that the model loads off the main thread and queued audio is flushed."""
+
+    def test_model_loads_on_background_thread(self, make_transcriber):
+        """ModelWrapper is built on the loader thread, not the caller's."""
+        load_threads = []
+
+        def _record_thread(settings):
+            load_threads.append(threading.current_thread().name)
+            return MagicMock()
+
+        transcriber = make_transcriber(MagicMock(side_effect=_record_thread))
+
+        assert load_threads == ["model-loader"]
+        assert transcriber.model_ready.is_set()
+
+    def test_recording_before_model_ready_is_queued(self, make_transcriber):
+        """Audio captured while loading waits in the queue until the model is ready."""
+        release = threading.Event()
+        wrapper = MagicMock()
+        wrapper.transcribe.return_value = ""
+
+        def _slow_load(settings):
+            release.wait(timeout=5)
+            return wrapper
+
+        from faster_whisper_hotkey.transcriber import MicrophoneTranscriber
+
+        with (
+            patch("faster_whisper_hotkey.transcriber.ModelWrapper", MagicMock(side_effect=_slow_load)),
+            patch.object(MicrophoneTranscriber, "transcribe_and_send") as mock_send,
+        ):
+            transcriber = MicrophoneTranscriber(_settings())
+            audio = np.ones(16000, dtype=np.float32)
+            transcriber.transcription_queue.append(audio)
+            transcriber.process_next_transcription()
+
+            assert not transcriber.model_ready.is_set()
+            assert len(transcriber.transcription_queue) == 1
+
+            release.set()
+            transcriber._model_thread.join(timeout=5)
+
+            assert transcriber.model_ready.is_set()
+            assert transcriber.transcription_queue == []
+            for _ in range(100):
+                if mock_send.called:
+                    break
+                time.sleep(0.01)
+            mock_send.assert_called_once()
+
+    def test_load_failure_stops_main_loop(self, make_transcriber):
+        """A model that fails to load sets exit_flag instead of hanging."""
+        transcriber = make_transcriber(MagicMock(side_effect=RuntimeError("no weights")))
+
+        assert transcriber.exit_flag is True
+        assert not transcriber.model_ready.is_set()
+        assert isinstance(transcriber.model_load_error, RuntimeError)
+
+    def test_load_failure_reports_startup_profile(self, make_transcriber):
+        """The startup breakdown is printed even when the model fails to load."""
+        with patch("faster_whisper_hotkey.transcriber.startup_profile.finish") as finish:
+            transcriber = make_transcriber(MagicMock(side_effect=RuntimeError("no weights")))
+            transcriber._startup_part_done()  # run()'s startup phases
+
+        finish.assert_called_once()
+
+    def test_startup_profile_waits_for_every_phase(self, make_transcriber, tmp_path):
+        """The report is written after run()'s phases too, even when the model was ready first."""
+        import json
+        import sys
+
+        from faster_whisper_hotkey import startup_profile
+
+        out = tmp_path / "startup.json"
+        with (
+            patch.object(startup_profile, "ENABLED", True),
+            patch.object(startup_profile, "JSON_PATH", str(out)),
+            patch.object(startup_profile, "_phases", []),
+            patch.object(startup_profile, "_finished", False),
+        ):
+            transcriber = make_transcriber()
+            assert transcriber.model_ready.is_set()
+            assert not out.exists()
+
+            transcriber.exit_flag = True
+            with patch.dict(sys.modules, {"pulsectl": MagicMock()}), patch("signal.signal"):
+                transcriber.run()
+
+        names = [p["name"] for p in json.loads(out.read_text())["phases"]]
+        assert "ModelWrapper" in names
+        assert "pulsectl default source" in names
+
+    def test_warmup_runs_before_model_ready(self, make_transcriber):
+        """Warm-up happens on the loader thread when enabled."""
+        model_wrapper_cls = MagicMock()
+        make_transcriber(model_wrapper_cls, warmup=True)
+
+        model_wrapper_cls.return_value.warmup.assert_called_once()
+
+    def test_warmup_is_off_by_default(self, make_transcriber):
+        """Without warmup=True nothing delays model_ready."""
+        model_wrapper_cls = MagicMock()
+        make_transcriber(model_wrapper_cls)
+
+        model_wrapper_cls.return_value.warmup.assert_not_called()
+
+    def test_snapshot_saved_after_model_ready(self, make_transcriber):
+        """A first-launch snapshot is written only after queued audio is flushed."""
+        calls = []
+        model_wrapper_cls = MagicMock()
+        model_wrapper_cls.return_value.save_snapshot.side_effect = lambda: calls.append("save")
+        with patch(
+            "faster_whisper_hotkey.transcriber.MicrophoneTranscriber.process_next_transcription",
+            side_effect=lambda: calls.append("flush"),
+        ):
+            transcriber = make_transcriber(model_wrapper_cls)
+
+        assert transcriber.model_ready.is_set()
+        assert calls == ["flush", "save"]
+
+    def test_daemon_socket_uses_remote_model(self, make_transcriber):
+        """With daemon_socket set, no model is loaded in-process."""
+        model_wrapper_cls = MagicMock()
+        with patch("faster_whisper_hotkey.transcriber.RemoteModel") as mock_remote:
+            transcriber = make_transcriber(model_wrapper_cls, daemon_socket="/run/fwh.sock")
+
+        model_wrapper_cls.assert_not_called()
+        mock_remote.assert_called_once_with("/run/fwh.sock")
+        assert transcriber.model_wrapper is mock_remote.return_value
+        assert transcriber.model_ready.is_set()
+
+
+class TestAudioSource:
+    """Test default source selection."""
+
+    def test_source_is_default_before_the_stream_opens(self, make_transcriber):
+        """The chosen source becomes the default after the listener starts, before InputStream opens on it."""
+        import sys
+
+        from faster_whisper_hotkey import transcriber as transcriber_module
+
+        events = []
+        chosen, other = MagicMock(), MagicMock()
+        chosen.name, other.name = "test_dev", "other_dev"
+        pulsectl = MagicMock()
+        pulse = pulsectl.Pulse.return_value.__enter__.return_value
+        pulse.source_list.return_value = [other, chosen]
+        pulse.source_default_set.side_effect = lambda source: events.append(("default", source.name))
+
+        transcriber = make_transcriber(keep_stream_open=True)
+        transcriber.exit_flag = True
+        keyboard = transcriber_module.keyboard
+        keyboard.Listener.return_value.start.side_effect = lambda: events.append(("listener", None))
+        transcriber_module.sd.InputStream.side_effect = lambda **kwargs: events.append(
+            ("stream", kwargs["device"])
+        ) or MagicMock(latency=0.01)
+
+        with patch.dict(sys.modules, {"pulsectl": pulsectl}), patch("signal.signal"):
+            transcriber.run()
+
+        assert events == [("listener", None), ("default", "test_dev"), ("stream", "default")]
+
+
+class TestAudioCapture:
+    """Test that the callback only copies and the utterance is processed on stop."""
+
+    def test_callback_copies_raw_samples(self, make_transcriber):
+        """Blocks land in the ring untouched (no per-block normalization)."""
+        transcriber = make_transcriber()
+        block = np.full((4000, 1), 0.25, dtype=np.float32)
+
+        transcriber.audio_callback(block, 4000, None, None)
+
+        assert transcriber.ring.write_index == 4000
+        np.testing.assert_array_equal(transcriber.ring.read(0), block)
+
+    def test_stop_queues_normalized_mono_utterance(self, make_transcriber):
+        """One gain is applied to the whole utterance when recording stops."""
+        transcriber = make_transcriber()
+        transcriber.start_recording()
+        transcriber.audio_callback(np.full((8000, 1), 0.1, dtype=np.float32), 8000, None, None)
+        transcriber.audio_callback(np.full((8000, 1), 0.5, dtype=np.float32), 8000, None, None)
+        transcriber.recording_start_time -= 2.0
+
+        with patch.object(transcriber, "process_next_transcription"):
+            transcriber.stop_recording_and_transcribe()
+
+        (audio,) = transcriber.transcription_queue
+        assert audio.shape == (16000,)
+        np.testing.assert_allclose(audio[:8000], 0.2)
+        np.testing.assert_allclose(audio[8000:], 1.0)
+
+    def test_consecutive_recordings_do_not_overlap(self, make_transcriber):
+        """Each recording starts at the ring's current write index."""
+        transcriber = make_transcriber()
+        transcriber.audio_callback(np.ones((4000, 1), dtype=np.float32), 4000, None, None)
+
+        transcriber.start_recording()
+
+        assert transcriber.recording_start_index == 4000
+
+    def test_utterance_buffer_returns_to_pool(self, make_transcriber):
+        """The queued utterance's buffer is recycled after transcription."""
+        transcriber = make_transcriber()
+        transcriber.model_wrapper.transcribe.return_value = ""
+        transcriber.start_recording()
+        transcriber.audio_callback(np.full((16000, 1), 0.1, dtype=np.float32), 16000, None, None)
+        transcriber.recording_start_time -= 2.0
+        with patch.object(transcriber, "process_next_transcription"):
+            transcriber.stop_recording_and_transcribe()
+        (audio,) = transcriber.transcription_queue
+        block = audio.base
+
+        transcriber.transcribe_and_send(transcriber.transcription_queue.pop())
+        transcriber.start_recording()
+        transcriber.audio_callback(np.full((8000, 1), 0.1, dtype=np.float32), 8000, None, None)
+        transcriber.recording_start_time -= 2.0
+        with patch.object(transcriber, "process_next_transcription"):
+            transcriber.stop_recording_and_transcribe()
+
+        assert transcriber.transcription_queue[0].base is block
+
+
+class TestRecordingSpill:
+    """Test that recordings longer than the RAM threshold spill to disk."""
+
+    def test_long_recording_is_not_truncated(self, make_transcriber, tmp_path):
+        """Audio beyond the ring's capacity survives via the spill file."""
+        from faster_whisper_hotkey.audio import SpillFile
+
+        transcriber = make_transcriber(recording_ram_seconds=1.0, spill_dir=str(tmp_path))
+        transcriber.start_recording()
+        transcriber.stop_event.set()
+        transcriber._spill_thread.join()
+        transcriber._spill = SpillFile(str(tmp_path))
+        for i in range(1, 6):
+            transcriber.audio_callback(np.full((8000, 1), i / 10, dtype=np.float32), 8000, None, None)
+            transcriber._drain_to_spill(transcriber.ring.write_index)
+        transcriber.recording_start_time -= 3.0
+
+        with patch.object(transcriber, "process_next_transcription"):
+            transcriber.stop_recording_and_transcribe()
+
+        (audio,) = transcriber.transcription_queue
+        assert audio.shape == (40000,)
+        np.testing.assert_allclose(audio[:8000], 0.2)
+        np.testing.assert_allclose(audio[-8000:], 1.0)
+        assert transcriber._spill is None
+
+    def test_worker_starts_spilling_past_threshold(self, make_transcriber, tmp_path):
+        """The helper thread only creates a spill file once the threshold is crossed."""
+        transcriber = make_transcriber(recording_ram_seconds=1.0, spill_dir=str(tmp_path))
+        transcriber.stop_event = MagicMock()
+        transcriber.recording_start_index = transcriber._spilled_index = 0
+
+        def _wait(timeout):
+            transcriber.audio_callback(np.ones((6000, 1), dtype=np.float32), 6000, None, None)
+            return transcriber.stop_event.wait.call_count > 2
+
+        transcriber.stop_event.wait.side_effect = _wait
+        transcriber._spill_worker()
+
+        assert transcriber._spill is not None
+        assert transcriber._spilled_index == 12000
+        assert transcriber._spill.frames == 12000
+
+    def test_short_recording_stays_in_ram(self, make_transcriber, tmp_path):
+        transcriber = make_transcriber(recording_ram_seconds=1.0, spill_dir=str(tmp_path))
+        transcriber.start_recording()
+        transcriber.audio_callback(np.ones((4000, 1), dtype=np.float32), 4000, None, None)
+
+        with patch.object(transcriber, "process_next_transcription"):
+            transcriber.stop_recording_and_transcribe()
+
+        assert transcriber._spill is None
+
+
+class TestKeepStreamOpen:
+    """Test the always-open stream with pre-roll."""
+
+    def test_stream_opened_once_across_recordings(self, make_transcriber):
+        """Pressing and releasing doesn't reopen or close the stream."""
+        from faster_whisper_hotkey import transcriber as transcriber_module
+
+        transcriber = make_transcriber(keep_stream_open=True)
+        with patch.object(transcriber, "process_next_transcription"):
+            for _ in range(3):
+                transcriber.start_recording()
+                transcriber.stop_recording_and_transcribe()
+
+        assert transcriber_module.sd.InputStream.call_count == 1
+        transcriber.stream.stop.assert_not_called()
+
+    def test_recording_starts_with_preroll(self, make_transcriber):
+        """Audio captured just before the press is part of the utterance."""
+        transcriber = make_transcriber(keep_stream_open=True, preroll_ms=250)
+        transcriber._open_stream()
+        transcriber.audio_callback(np.full((16000, 1), 0.1, dtype=np.float32), 16000, None, None)
+
+        transcriber.start_recording()
+        transcriber.audio_callback(np.full((16000, 1), 0.5, dtype=np.float32), 16000, None, None)
+        transcriber.recording_start_time -= 2.0
+        with patch.object(transcriber, "process_next_transcription"):
+            transcriber.stop_recording_and_transcribe()
+
+        (audio,) = transcriber.transcription_queue
+        assert audio.shape == (4000 + 16000,)
+        np.testing.assert_allclose(audio[:4000], 0.2)
+
+    def test_press_latency_includes_ring_lag(self, make_transcriber):
+        """The ring lags the press by the block's capture delay, which adds to the pre-roll."""
+        from types import SimpleNamespace
+
+        transcriber = make_transcriber(keep_stream_open=True, preroll_ms=250)
+        transcriber._open_stream()
+        # Newest sample captured 100 ms before the callback ran
+        adc = SimpleNamespace(currentTime=10.0, inputBufferAdcTime=10.0 - 0.25 - 0.1)
+        transcriber.audio_callback(np.zeros((4000, 1), dtype=np.float32), 4000, adc, None)
+
+        transcriber.start_recording()
+
+        assert transcriber.last_press_latency == pytest.approx(-0.35, abs=0.02)
+
+    def test_release_waits_for_the_block_covering_it(self, make_transcriber):
+        """Speech up to the release instant arrives with the next block and is kept."""
+        transcriber = make_transcriber(keep_stream_open=True, preroll_ms=0)
+        transcriber.start_recording()
+        transcriber.audio_callback(np.ones((16000, 1), dtype=np.float32), 16000, None, None)
+        transcriber.recording_start_time -= 2.0
+
+        def deliver_trailing_block():
+            time.sleep(0.05)
+            transcriber.audio_callback(np.ones((4000, 1), dtype=np.float32), 4000, None, None)
+
+        threading.Thread(target=deliver_trailing_block).start()
+        with patch.object(transcriber, "process_next_transcription"):
+            transcriber.stop_recording_and_transcribe()
+
+        assert transcriber.transcription_queue[0].shape == (20000,)
+
+    def test_audio_after_release_is_excluded(self, make_transcriber):
+        """Capture continues after release but isn't part of the utterance."""
+        transcriber = make_transcriber(keep_stream_open=True, preroll_ms=0)
+        transcriber.start_recording()
+        transcriber.audio_callback(np.ones((16000, 1), dtype=np.float32), 16000, None, None)
+        transcriber.recording_start_time -= 2.0
+        with patch.object(transcriber, "process_next_transcription"):
+            transcriber.stop_recording_and_transcribe()
+        transcriber.audio_callback(np.ones((8000, 1), dtype=np.float32), 8000, None, None)
+
+        assert transcriber.transcription_queue[0].shape == (16000,)
+
+    def test_per_press_mode_measures_device_open_latency(self, make_transcriber):
+        """Without keep_stream_open, latency is press to the first captured sample."""
+        from types import SimpleNamespace
+
+        transcriber = make_transcriber()
+        transcriber.start_recording()
+        transcriber._press_time -= 0.5
+        # The first block's first sample was captured 300 ms before its callback
+        adc = SimpleNamespace(currentTime=10.0, inputBufferAdcTime=9.7)
+        transcriber.audio_callback(np.zeros((4000, 1), dtype=np.float32), 4000, adc, None)
+
+        with patch.object(transcriber, "process_next_transcription"):
+            transcriber.stop_recording_and_transcribe()
+
+        assert transcriber.last_press_latency == pytest.approx(0.2, abs=0.02)
+
+
+class TestNativeRateCapture:
+    """Test capture at the device rate with in-process resampling."""
+
+    def test_native_16k_device_writes_ring_directly(self, make_transcriber):
+        transcriber = make_transcriber()
+        transcriber._open_stream()
+
+        assert transcriber.resampler is None
+        assert transcriber._capture_target is transcriber.ring
+
+    def test_stream_opened_at_native_rate(self, make_transcriber):
+        """The stream uses the device rate and a blocksize derived from capture_block_ms."""
+        from faster_whisper_hotkey import transcriber as transcriber_module
+
+        transcriber_module.sd.query_devices.return_value = {"default_samplerate": 48000.0}
+        transcriber = make_transcriber(capture_block_ms=20, capture_latency="0.01")
+        transcriber._open_stream()
+        transcriber._close_stream()
+
+        kwargs = transcriber_module.sd.InputStream.call_args.kwargs
+        assert kwargs["samplerate"] == 48000
+        assert kwargs["blocksize"] == 960
+        assert kwargs["latency"] == 0.01
+
+    def test_configured_rate_overrides_device(self, make_transcriber):
+        transcriber = make_transcriber(capture_samplerate=44100)
+        transcriber._configure_capture()
+
+        assert transcriber.capture_rate == 44100
+        assert transcriber.resampler.in_rate == 44100
+
+    def test_recording_is_resampled_to_16k(self, make_transcriber):
+        """A 1 s recording at 48 kHz reaches the queue as 16000 samples."""
+        transcriber = make_transcriber(capture_samplerate=48000)
+        transcriber.start_recording()
+        for _ in range(10):
+            transcriber.audio_callback(np.full((4800, 1), 0.5, dtype=np.float32), 4800, None, None)
+        transcriber.recording_start_time -= 2.0
+
+        with patch.object(transcriber, "process_next_transcription"):
+            transcriber.stop_recording_and_transcribe()
+
+        (audio,) = transcriber.transcription_queue
+        assert audio.shape == (16000,)
+        assert transcriber._pump_thread is None
+
+    def test_resampling_happens_while_recording(self, make_transcriber):
+        """Blocks are resampled as they arrive, not at release."""
+        transcriber = make_transcriber(capture_samplerate=48000)
+        transcriber._open_stream()
+        transcriber.audio_callback(np.zeros((4800, 1), dtype=np.float32), 4800, None, None)
+
+        transcriber._pump_capture()
+
+        assert transcriber.ring.write_index == 1600
+        transcriber._close_stream()
+
+
+class TestVoiceActivity:
+    """Test VAD trimming on the transcription thread."""
+
+    @staticmethod
+    def _speech_with_silence():
+        t = np.arange(16000) / 16000
+        voiced = sum(np.sin(2 * np.pi * 140 * k * t) / k for k in range(1, 15)) * (0.6 + 0.4 * np.sin(8 * np.pi * t))
+        silence = np.random.default_rng(0).standard_normal(32000) * 0.002
+        return np.concatenate([silence, voiced, silence]).astype(np.float32)
+
+    def test_model_gets_trimmed_audio(self, make_transcriber):
+        transcriber = make_transcriber()
+        transcriber.model_wrapper.transcribe.return_value = ""
+
+        transcriber.transcribe_and_send(self._speech_with_silence())
+
+        audio = transcriber.model_wrapper.transcribe.call_args.args[0]
+        assert 1.0 <= audio.size / 16000 < 2.0
+
+    def test_no_speech_skips_the_model(self, make_transcriber):
+        transcriber = make_transcriber()
+        silence = (np.random.default_rng(0).standard_normal(48000) * 0.01).astype(np.float32)
+
+        transcriber.transcribe_and_send(silence)
+
+        transcriber.model_wrapper.transcribe.assert_not_called()
+        assert transcriber.is_transcribing is False
+
+    def test_vad_disabled_passes_audio_through(self, make_transcriber):
+        transcriber = make_transcriber(vad_aggressiveness=0)
+        transcriber.model_wrapper.transcribe.return_value = ""
+        audio = self._speech_with_silence()
+
+        transcriber.transcribe_and_send(audio)
+
+        assert transcriber.model_wrapper.transcribe.call_args.args[0].size == audio.size
+
+    def test_short_press_is_queued_when_vad_decides(self, make_transcriber):
+        """With the VAD on, the wall-clock minimum no longer applies."""
+        transcriber = make_transcriber()
+        transcriber.start_recording()
+        transcriber.audio_callback(np.ones((4000, 1), dtype=np.float32), 4000, None, None)
+
+        with patch.object(transcriber, "process_next_transcription"):
+            transcriber.stop_recording_and_transcribe()
+
+        assert len(transcriber.transcription_queue) == 1
+
+    def test_short_press_dropped_without_vad(self, make_transcriber):
+        transcriber = make_transcriber(vad_aggressiveness=0)
+        transcriber.start_recording()
+        transcriber.audio_callback(np.ones((4000, 1), dtype=np.float32), 4000, None, None)
+
+        with patch.object(transcriber, "process_next_transcription"):
+            transcriber.stop_recording_and_transcribe()
+
+        assert transcriber.transcription_queue == []
+
+
+class TestCaptureProcess:
+    """Test capture through a separate process and a shared-memory ring."""
+
+    def test_capture_process_owns_the_stream(self, make_transcriber):
+        """No in-process InputStream is opened; frames are pumped from shared memory."""
+        from faster_whisper_hotkey import transcriber as transcriber_module
+        from faster_whisper_hotkey.audio import CaptureStats
+        from faster_whisper_hotkey.capture import SharedRingBuffer
+
+        shared = SharedRingBuffer(16000)
+        process = MagicMock(ring=shared, latency=0.01, stats=CaptureStats())
+        transcriber = make_transcriber(capture_process=True, preroll_ms=0)
+        assert transcriber.keep_stream_open is True
+
+        with patch("faster_whisper_hotkey.transcriber.CaptureProcess", return_value=process):
+            transcriber.start_recording()
+            shared.write(np.ones((16000, 1), dtype=np.float32))
+            transcriber.recording_start_time -= 2.0
+            with patch.object(transcriber, "process_next_transcription"):
+                transcriber.stop_recording_and_transcribe()
+            transcriber._close_stream()
+
+        transcriber_module.sd.InputStream.assert_not_called()
+        process.start.assert_called_once()
+        process.close.assert_called_once()
+        assert transcriber.transcription_queue[0].size == 16000
+        assert transcriber.capture_ring is None
+        shared.close()
+
+    def test_falls_back_to_in_process_capture(self, make_transcriber):
+        """If the child can't start, the stream opens in-process."""
+        from faster_whisper_hotkey import transcriber as transcriber_module
+
+        transcriber = make_transcriber(capture_process=True)
+        with patch(
+            "faster_whisper_hotkey.transcriber.CaptureProcess",
+            side_effect=RuntimeError("capture process did not start"),
+        ):
+            transcriber._open_stream()
+
+        transcriber_module.sd.InputStream.assert_called_once()
+        assert transcriber.capture_process is False
+        transcriber._close_stream()
+
+    @staticmethod
+    def _process(alive=True):
+        from faster_whisper_hotkey.audio import CaptureStats
+        from faster_whisper_hotkey.capture import SharedRingBuffer
+
+        process = MagicMock(ring=SharedRingBuffer(16000), latency=0.01, stats=CaptureStats(), exitcode=None)
+        process.is_alive.return_value = alive
+        process.close.side_effect = process.ring.close
+        return process
+
+    def test_pump_stops_when_child_dies(self, make_transcriber, caplog):
+        """A dead child is reported instead of polling a write index that never moves."""
+        process = self._process()
+        transcriber = make_transcriber(capture_process=True)
+        with patch("faster_whisper_hotkey.transcriber.CaptureProcess", return_value=process):
+            transcriber._open_stream()
+        pump = transcriber._pump_thread
+
+        process.is_alive.return_value = False
+        process.exitcode = -9
+        with caplog.at_level("WARNING"):
+            pump.join(timeout=2)
+
+        assert not pump.is_alive()
+        assert "exit code -9" in caplog.text
+        transcriber._close_stream()
+
+    def test_dead_child_restarted_at_next_press(self, make_transcriber, caplog):
+        """The next recording gets a fresh child rather than a silent one."""
+        dead, fresh = self._process(), self._process()
+        transcriber = make_transcriber(capture_process=True)
+        with patch("faster_whisper_hotkey.transcriber.CaptureProcess", side_effect=[dead, fresh]):
+            transcriber.start_recording()
+            with patch.object(transcriber, "process_next_transcription"):
+                transcriber.stop_recording_and_transcribe()
+            dead.is_alive.return_value = False
+
+            with caplog.at_level("WARNING"):
+                transcriber.start_recording()
+
+        dead.close.assert_called_once()
+        fresh.start.assert_called_once()
+        assert transcriber.stream is fresh
+        assert "Restarting the capture process" in caplog.text
+        transcriber.stop_event.set()
+        transcriber._close_stream()
+
+    def test_repeated_deaths_fall_back_to_in_process(self, make_transcriber):
+        """A child that keeps dying is given up on for the session."""
+        from faster_whisper_hotkey import transcriber as transcriber_module
+
+        dead = self._process()
+        transcriber = make_transcriber(capture_process=True)
+        transcriber._capture_deaths = transcriber_module.CAPTURE_PROCESS_MAX_DEATHS - 1
+        with patch("faster_whisper_hotkey.transcriber.CaptureProcess", return_value=dead) as capture_cls:
+            transcriber._open_stream()
+            dead.is_alive.return_value = False
+            transcriber.start_recording()
+
+        assert capture_cls.call_count == 1
+        assert transcriber.capture_process is False
+        transcriber_module.sd.InputStream.assert_called_once()
+        transcriber.stop_event.set()
+        transcriber._close_stream()
+
+
+class TestAudioTelemetry:
+    """Test audio-path health counters."""
+
+    @staticmethod
+    def _status(overflow=False, underflow=False):
+        return MagicMock(input_overflow=overflow, input_underflow=underflow)
+
+    def test_overflows_counted_per_recording(self, make_transcriber, caplog):
+        transcriber = make_transcriber()
+        transcriber.audio_callback(np.ones((4000, 1), dtype=np.float32), 4000, None, self._status(overflow=True))
+
+        transcriber.start_recording()
+        transcriber.audio_callback(np.ones((4000, 1), dtype=np.float32), 4000, None, self._status(overflow=True))
+        transcriber.audio_callback(np.ones((4000, 1), dtype=np.float32), 4000, None, self._status(underflow=True))
+        with patch.object(transcriber, "process_next_transcription"), caplog.at_level("WARNING"):
+            transcriber.stop_recording_and_transcribe()
+
+        stats = transcriber.last_recording_stats
+        assert (stats["overflows"], stats["underflows"], stats["callbacks"]) == (1, 1, 2)
+        assert "Input overflow in 1 and underflow in 1" in caplog.text
+        assert transcriber.capture_stats.summary()["overflows"] == 2
+
+    def test_callback_time_and_jitter_histograms(self, make_transcriber):
+        transcriber = make_transcriber()
+        transcriber._block_ns = 250_000_000
+        for _ in range(3):
+            transcriber.audio_callback(np.ones((4000, 1), dtype=np.float32), 4000, None, None)
+
+        summary = transcriber.capture_stats.summary()
+
+        assert sum(summary["callback_us"].values()) == 3
+        # Back-to-back calls are ~250 ms early: jitter lands in the open-ended bucket
+        assert summary["jitter_us"][">100000"] == 2
+
+    def test_stream_latency_recorded(self, make_transcriber):
+        transcriber = make_transcriber()
+
+        with patch("faster_whisper_hotkey.transcriber.sd.InputStream", return_value=MagicMock(latency=0.032)):
+            transcriber._open_stream()
+
+        assert transcriber.capture_stats.summary()["latency_ms"] == pytest.approx(32.0)
+
+    def test_dump_logs_histograms(self, make_transcriber, caplog):
+        transcriber = make_transcriber()
+        transcriber.audio_callback(np.ones((4000, 1), dtype=np.float32), 4000, None, None)
+
+        with caplog.at_level("INFO"):
+            transcriber.dump_audio_stats()
+
+        assert "Audio path stats (session)" in caplog.text
+        assert "callbacks 1, input overflows 0" in caplog.text
+
+
+class TestStreaming:
+    """Test decoding while the hotkey is held."""
+
+    @staticmethod
+    def _voiced(seconds):
+        t = np.arange(int(16000 * seconds)) / 16000
+        tone = sum(np.sin(2 * np.pi * 140 * k * t) / k for k in range(1, 15))
+        return (0.3 * tone * (0.6 + 0.4 * np.sin(8 * np.pi * t))).astype(np.float32).reshape(-1, 1)
+
+    @staticmethod
+    def _pause(seconds):
+        return (np.random.default_rng(0).standard_normal((int(16000 * seconds), 1)) * 0.003).astype(np.float32)
+
+    def test_release_decodes_only_the_tail(self, make_transcriber):
+        """Text committed while recording is joined with the decoded tail."""
+        # A long interval: the test drives the session's steps itself
+        transcriber = make_transcriber(streaming_interval=60.0)
+        transcriber.model_wrapper.transcribe.side_effect = ["first part", "the rest"]
+        transcriber.start_recording()
+        session = transcriber._stream_session
+        transcriber.audio_callback(self._voiced(3), 48000, None, None)
+        transcriber.audio_callback(self._pause(0.6), 9600, None, None)
+        transcriber.audio_callback(self._voiced(1), 16000, None, None)
+        session.step()
+        transcriber.audio_callback(self._voiced(1), 16000, None, None)
+
+        with patch.object(transcriber, "process_next_transcription"):
+            transcriber.stop_recording_and_transcribe()
+        (queued,) = transcriber.transcription_queue
+        with patch.object(transcriber, "_send_via_clipboard", return_value=True) as send:
+            transcriber.transcribe_and_send(queued)
+
+        send.assert_called_once_with("first part the rest")
+        tail = transcriber.model_wrapper.transcribe.call_args.args[0]
+        assert tail.size < 2.5 * 16000
+
+    def test_streaming_skips_the_spill_thread(self, make_transcriber):
+        transcriber = make_transcriber(streaming_interval=60.0)
+        transcriber.start_recording()
+
+        assert transcriber._spill_thread is None
+        assert transcriber._stream_session is not None
+        with patch.object(transcriber, "process_next_transcription"):
+            transcriber.stop_recording_and_transcribe()
+        assert transcriber._stream_session is None
+
+    def test_no_streaming_decode_before_model_is_ready(self, make_transcriber):
+        transcriber = make_transcriber(streaming_interval=60.0)
+        transcriber.model_ready.clear()
+
+        assert transcriber._decode_piece(self._voiced(2)[:, 0]) is None
+        transcriber.model_wrapper.transcribe.assert_not_called()
+
+    def test_incremental_paste(self, make_transcriber):
+        """Stable words are pasted while recording; release pastes only the rest."""
+        transcriber = make_transcriber(streaming_interval=60.0, streaming_paste=True)
+        transcriber.model_wrapper.transcribe.side_effect = ["so far so", "so far so good", "so far so good then"]
+        with patch.object(transcriber, "_send_via_clipboard", return_value=True) as send:
+            transcriber.start_recording()
+            session = transcriber._stream_session
+            transcriber.audio_callback(self._voiced(3), 48000, None, None)
+            session.step()
+            session.step()
+            assert send.call_args_list == [call("so far so")]
+
+            with patch.object(transcriber, "process_next_transcription"):
+                transcriber.stop_recording_and_transcribe()
+            transcriber.transcribe_and_send(transcriber.transcription_queue.pop())
+
+        assert send.call_args_list == [call("so far so"), call(" good then")]
+
+    def test_incremental_paste_waits_for_earlier_utterance(self, make_transcriber):
+        transcriber = make_transcriber(streaming_interval=60.0, streaming_paste=True)
+        transcriber.is_transcribing = True
+
+        with patch.object(transcriber, "_send_via_clipboard") as send:
+            assert transcriber._paste_final_words("early words") is False
+
+        send.assert_not_called()
+
+    def test_cache_aware_backend_is_fed_instead_of_redecoded(self, make_transcriber):
+        from faster_whisper_hotkey.streaming import EncoderStreamSession
+
+        transcriber = make_transcriber(streaming_interval=60.0)
+        stream = MagicMock()
+        stream.feed.return_value = "hello"
+        stream.finish.return_value = "hello world"
+        transcriber.model_wrapper.capabilities = frozenset({"streaming"})
+        transcriber.model_wrapper.open_stream.return_value = stream
+        transcriber.start_recording()
+        session = transcriber._stream_session
+        assert isinstance(session, EncoderStreamSession)
+        transcriber.audio_callback(self._voiced(1), 16000, None, None)
+        session.step()
+
+        with patch.object(transcriber, "process_next_transcription"):
+            transcriber.stop_recording_and_transcribe()
+        with patch.object(transcriber, "_send_via_clipboard", return_value=True) as send:
+            transcriber.transcribe_and_send(transcriber.transcription_queue.pop())
+
+        send.assert_called_once_with("hello world")
+        assert stream.feed.call_args.args[0].size == 16000
+        transcriber.model_wrapper.transcribe.assert_not_called()
+
+
+class TestProfileHotkeys:
+    """Test recording with another decoding profile from its own hotkey."""
+
+    def test_profile_hotkey_records_with_its_profile(self, make_transcriber):
+        from faster_whisper_hotkey import transcriber as transcriber_module
+
+        transcriber = make_transcriber(profile_hotkeys={"f8": "Accurate"})
+        key = transcriber_module.keyboard.Key.f8
+        assert transcriber.hotkey_profiles[key] == "accurate"
+
+        with patch.object(transcriber, "start_recording") as start:
+            transcriber.on_press(key)
+        start.assert_called_once_with("accurate")
+
+    def test_main_hotkey_uses_the_configured_profile(self, make_transcriber):
+        transcriber = make_transcriber(profile_hotkeys={"f8": "fastest"})
+
+        with patch.object(transcriber, "start_recording") as start:
+            transcriber.on_press(transcriber.hotkey_key)
+        start.assert_called_once_with(None)
+
+    def test_unknown_profile_is_ignored(self, make_transcriber):
+        transcriber = make_transcriber(profile_hotkeys={"f8": "turbo"})
+        assert list(transcriber.hotkey_profiles.values()) == [None]
+
+    def test_queued_recording_keeps_its_profile(self, make_transcriber):
+        """The profile travels with the recording to the model call."""
+        transcriber = make_transcriber(vad_aggressiveness=0)
+        transcriber.model_wrapper.transcribe.return_value = ""
+        transcriber.start_recording("fastest")
+        transcriber.audio_callback(np.full((16000, 1), 0.1, dtype=np.float32), 16000, None, None)
+        transcriber.recording_start_time -= 2
+
+        with patch("faster_whisper_hotkey.transcriber.threading.Thread") as thread:
+            transcriber.stop_recording_and_transcribe()
+        target, args = thread.call_args.kwargs["target"], thread.call_args.kwargs["args"]
+        target(*args)
+
+        assert transcriber.model_wrapper.transcribe.call_args.kwargs["profile"] == "fastest"
+        assert transcriber._queued_profiles == {}
@@ -301,3 +301,30 @@ class TestCursesMenu:
             mock_stdscr, "Title", ["Opt1", "Opt2"], message="Very long message..."
         )
         assert result is None
+
+
+class TestDecodingProfileScreen:
+    """Test the decoding profile step of the configuration flow."""
+
+    @patch("faster_whisper_hotkey.ui.curses_menu", return_value="Fastest")
+    def test_selection_is_stored(self, mock_menu):
+        from faster_whisper_hotkey.ui import ConfigData, ConfigStep, _screen_decoding_profile
+
+        config = ConfigData(decoding_profile="accurate")
+        step, config = _screen_decoding_profile(MagicMock(), config)
+
+        assert (step, config.decoding_profile) == (ConfigStep.LLM_ENABLE, "fastest")
+        assert mock_menu.call_args.kwargs["initial_idx"] == 2
+
+    @patch("faster_whisper_hotkey.ui.curses_menu", return_value=None)
+    def test_escape_returns_to_start(self, mock_menu):
+        from faster_whisper_hotkey.ui import ConfigData, ConfigStep, _screen_decoding_profile
+
+        step, _ = _screen_decoding_profile(MagicMock(), ConfigData())
+        assert step == ConfigStep.INITIAL
+
+    def test_profile_is_saved_with_the_settings(self):
+        from faster_whisper_hotkey.ui import ConfigData, _create_settings_from_config
+
+        settings = _create_settings_from_config(ConfigData(model_type="whisper", decoding_profile="accurate"), None)
+        assert settings.decoding_profile == "accurate"
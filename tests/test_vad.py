@@ -0,0 +1,110 @@
+"""Tests for vad.py (silence trimming before inference)."""
+
+import numpy as np
+import pytest
+
+from faster_whisper_hotkey.vad import MIN_SPEECH_S, find_pause, quietest_point, speech_frames, trim_silence
+
+SR = 16000
+
+
+def _voiced(seconds):
+    """Harmonic, amplitude-modulated tone: speech-like energy and spectrum."""
+    t = np.arange(int(SR * seconds)) / SR
+    tone = sum(np.sin(2 * np.pi * 140 * k * t) / k for k in range(1, 15))
+    return (0.3 * tone * (0.6 + 0.4 * np.sin(2 * np.pi * 4 * t))).astype(np.float32)
+
+
+def _noise(seconds, level=0.003, seed=0):
+    return (np.random.default_rng(seed).standard_normal(int(SR * seconds)) * level).astype(np.float32)
+
+
+def _utterance():
+    """1 s silence, 1 s speech, 2 s pause, 1 s speech, 1 s silence."""
+    return np.concatenate(
+        [_noise(1, seed=1), _voiced(1) + _noise(1, seed=2), _noise(2, seed=3), _voiced(1) + _noise(1, seed=4), _noise(1, seed=5)]
+    )
+
+
+class TestSpeechFrames:
+    """Test the per-frame speech decision."""
+
+    def test_speech_frames_found_where_speech_is(self):
+        speech = speech_frames(_utterance(), SR)
+        frames_per_s = len(speech) / 6
+
+        assert not speech[: int(0.9 * frames_per_s)].any()
+        assert speech[int(1.1 * frames_per_s) : int(1.9 * frames_per_s)].mean() > 0.8
+        assert not speech[int(2.1 * frames_per_s) : int(3.9 * frames_per_s)].any()
+
+    @pytest.mark.parametrize("aggressiveness", [1, 2, 3])
+    def test_noise_is_not_speech(self, aggressiveness):
+        assert not speech_frames(_noise(3, level=0.3), SR, aggressiveness).any()
+
+    def test_digital_silence_is_not_speech(self):
+        assert not speech_frames(np.zeros(SR * 2, dtype=np.float32), SR).any()
+
+    def test_too_short_for_a_frame(self):
+        assert speech_frames(np.zeros(10, dtype=np.float32), SR).size == 0
+
+
+class TestTrimSilence:
+    """Test trimming and pause collapsing."""
+
+    @pytest.mark.parametrize("aggressiveness", [1, 2, 3])
+    def test_edges_and_long_pause_removed(self, aggressiveness):
+        trimmed, speech_s = trim_silence(_utterance(), SR, aggressiveness)
+
+        assert 2.0 <= trimmed.size / SR < 3.5
+        assert speech_s >= 1.5
+
+    def test_higher_aggressiveness_removes_more(self):
+        lengths = [trim_silence(_utterance(), SR, a)[0].size for a in (1, 2, 3)]
+        assert lengths[0] > lengths[1] > lengths[2]
+
+    def test_trims_in_place(self):
+        """The result is a view of the input buffer, no new allocation."""
+        audio = _utterance()
+        trimmed, _ = trim_silence(audio, SR)
+
+        assert np.shares_memory(trimmed, audio)
+
+    def test_speech_is_kept_intact(self):
+        """Continuous speech passes through unchanged."""
+        audio = _voiced(3)
+        trimmed, _ = trim_silence(audio.copy(), SR)
+
+        np.testing.assert_array_equal(trimmed, audio[: trimmed.size])
+        assert trimmed.size / SR > 2.9
+
+    def test_silence_reports_no_speech(self):
+        trimmed, speech_s = trim_silence(_noise(2), SR)
+
+        assert speech_s < MIN_SPEECH_S
+        assert trimmed.size == 0
+
+
+class TestStreamingCuts:
+    """Test where streaming windows may be cut."""
+
+    def test_cut_lands_in_the_last_pause(self):
+        audio = np.concatenate([_voiced(2), _noise(0.6, seed=1), _voiced(1.5), _noise(0.5, seed=2), _voiced(0.5)])
+
+        cut = find_pause(audio, SR)
+
+        assert 4.1 * SR < cut < 4.6 * SR
+
+    def test_pause_at_the_edge_is_not_a_cut(self):
+        """Silence at the very end may be a breath before more speech."""
+        assert find_pause(np.concatenate([_voiced(2), _noise(0.2)]), SR) is None
+
+    def test_leading_silence_is_not_a_cut(self):
+        assert find_pause(np.concatenate([_noise(0.6), _voiced(2)]), SR) is None
+
+    def test_quietest_point_in_second_half(self):
+        audio = _voiced(4)
+        audio[int(3 * SR) : int(3.1 * SR)] *= 0.01
+
+        cut = quietest_point(audio, SR)
+
+        assert 2.95 * SR <= cut <= 3.1 * SR